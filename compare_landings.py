@@ -1,9 +1,10 @@
+import sys
 from pathlib import Path
-import re
-content = Path('data/transfer-landings.ts').read_text(encoding='utf-8')
-pattern = r"landingSlug:\s*['\"]([^'\"]+)['\"]"
-slugs = set(re.findall(pattern, content))
-given = [
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from content_cli import run_tool
+from landing_index import LandingIndex
+
+GIVEN = [
     'punta-cana-international-airport-to-bahia-principe-grand-punta-cana',
     'punta-cana-international-airport-to-bahia-principe-luxury-ambar',
     'punta-cana-international-airport-to-bahia-principe-luxury-esmeralda',
@@ -42,7 +43,16 @@ given = [
     'punta-cana-international-airport-to-whala-bavaro',
     'punta-cana-international-airport-to-zoetry-agua',
 ]
-missing = [slug for slug in given if slug not in slugs]
-print('manual count:', len(slugs))
-print('missing count:', len(missing))
-print('\\n'.join(missing))
+
+
+def main() -> None:
+    index = LandingIndex.load()
+    slugs = index.slugs_in(Path('data/transfer-landings.ts'))
+    missing = [slug for slug in GIVEN if slug not in slugs]
+    print('manual count:', len(slugs))
+    print('missing count:', len(missing))
+    print('\\n'.join(missing))
+
+
+if __name__ == '__main__':
+    run_tool(main)
@@ -19,10 +19,15 @@ export type TransferLandingData = {
   canonical?: string;
 };
 
-const buildLongCopy = (hotelName: string) => [
-  `Conectamos Punta Cana International Airport (PUJ) con ${hotelName} en un servicio privado que anticipa cada detalle de tu llegada. Nuestro equipo planifica el pick-up segun tu aterrizaje, revisa el estado del vuelo en tiempo real y te recibe con un cartel con tu nombre. Durante el trayecto puedes relajarte con musica, revisar itinerarios con Wi-Fi a bordo o simplemente descansar con aire acondicionado y espacio para equipaje.`,
+const buildLongCopy = (
+  hotelName: string,
+  airportName = "Punta Cana International Airport",
+  airportCode = "PUJ",
+  regionName = "Punta Cana"
+) => [
+  `Conectamos ${airportName} (${airportCode}) con ${hotelName} en un servicio privado que anticipa cada detalle de tu llegada. Nuestro equipo planifica el pick-up segun tu aterrizaje, revisa el estado del vuelo en tiempo real y te recibe con un cartel con tu nombre. Durante el trayecto puedes relajarte con musica, revisar itinerarios con Wi-Fi a bordo o simplemente descansar con aire acondicionado y espacio para equipaje.`,
   `Hacemos que el transporte sea parte de la experiencia, no un tramite. Antes de tu viaje confirmamos el tipo de vehiculo ideal para tu grupo (sedan, SUV o minibus) y dejamos claro el precio sin cargos ocultos. Nuestro equipo bilingue te acompana en cada paso y se comunica contigo si necesitas ajustar la hora. Incluimos 60 minutos de espera gratis en el aeropuerto por retrasos o equipaje.`,
-  `El recorrido desde PUJ hasta ${hotelName} es seguro y monitoreado. Los conductores son profesionales certificados y estan conectados a nuestro centro de operaciones en Punta Cana. Si hay trafico o mal tiempo, replanificamos la ruta para mantener tu itinerario. Cada vehiculo cuenta con seguro de pasajeros, agua de cortesia y desinfectantes para un viaje comodo.`,
+  `El recorrido desde ${airportCode} hasta ${hotelName} es seguro y monitoreado. Los conductores son profesionales certificados y estan conectados a nuestro centro de operaciones en ${regionName}. Si hay trafico o mal tiempo, replanificamos la ruta para mantener tu itinerario. Cada vehiculo cuenta con seguro de pasajeros, agua de cortesia y desinfectantes para un viaje comodo.`,
   `Sabemos que muchos viajeros llevan equipaje grande, por eso ajustamos el vehiculo segun el numero de personas y maletas. Te compartimos tiempo estimado, distancia y detalles de llegada. Si necesitas algo especial (cuna, parada breve o check-in prioritario), lo coordinamos con el hotel. Si cambia tu hora de llegada, ajustamos el pick-up y confirmamos por mensaje y correo.`,
   `Reservar aqui te da prioridad inmediata. Al seleccionar fecha, hora y pasajeros, veras opciones claras de vehiculos y tarifas finales. Todos los precios incluyen chofer bilingue, soporte 24/7 y servicio privado sin esperas. Tu traslado se siente como un concierge personal desde el aeropuerto.`,
   `Creemos que el primer trayecto marca la diferencia. Por eso detallamos la ruta a ${hotelName}, enviamos recordatorios una hora antes y mantenemos soporte activo durante el viaje. Coordinamos con el hotel para que tu llegada sea fluida y sin sorpresas.`,
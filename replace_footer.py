@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
+import sys
 from pathlib import Path
-path = Path('app/(public)/layout.tsx')
-text = path.read_text()
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from content_cli import run_tool
+from source_patch import Edit, PlanError, apply_plan, combined_diff
 old = """      {/* Footer oscuro minimalista con iconograf\\u00eda social. */}\n      <footer\n        id=\"footer\"\n        className=\"border-t border-slate-800 bg-slate-950 px-6 py-12 text-sm text-gray-200\"\n      >\n        <div className=\"mx-auto flex max-w-6xl flex-col gap-6 md:flex-row md:items-center md:justify-between\">\n          <div className=\"space-y-1\">\n            <p className=\"text-base font-semibold text-white\">Proactivitis</p>\n            <p className=\"text-gray-400\">Marketplace global de experiencias premium.</p>\n          </div>\n          <div className=\"flex flex-wrap gap-4 text-xs uppercase tracking-[0.3em] text-gray-400\">\n            <Link href=\"/terms\" className=\"transition hover:text-white\">\n              T\\u30c6rminos\n            </Link>\n            <Link href=\"/privacy\" className=\"transition hover:text-white\">\n              Privacidad\n            </Link>\n            <Link href=\"#footer\" className=\"transition hover:text-white\">\n              Contacto\n            </Link>\n          </div>\n          <div className=\"flex items-center gap-3 text-xl\">\n            {socialLinks.map((social) => (\n              <Link\n                key={social.label}\n                href={social.href}\n                className=\"inline-flex h-10 w-10 items-center justify-center rounded-full border border-white/20 text-white transition hover:border-white hover:text-sky-300\"\n                aria-label={social.label}\n              >\n                {social.icon}\n              </Link>\n            ))}\n          </div>\n        </div>\n        <p className=\"mt-8 text-center text-xs text-gray-500\">\\u98df {new Date().getFullYear()} Proactivitis. Todos los derechos reservados.</p>\n      </footer>\n"""
-new = """      {/* Footer oscuro con columnas informativas y controles de negocio. */}\n      <footer id=\"footer\" className=\"border-t border-slate-900 bg-slate-950 px-6 py-10 text-sm text-gray-200\">\n        <div className=\"mx-auto flex max-w-6xl flex-col gap-10\">\n          <div className=\"flex flex-col gap-6 border-b border-white/10 pb-6 text-xs uppercase tracking-[0.3em] text-gray-400 md:flex-row md:items-center md:justify-between\">\n            <div className=\"space-y-2\">\n              <p className=\"text-[0.55rem] text-slate-400\">Language</p>\n              <select className=\"w-48 rounded-md border border-white/10 bg-slate-900 px-3 py-2 text-xs text-white\">\n                <option>English (Global)</option>\n                <option>Espaol</option>\n                <option>Portugus</option>\n              </select>\n            </div>\n            <div className=\"space-y-2\">\n              <p className=\"text-[0.55rem] text-slate-400\">Currency</p>\n              <select className=\"w-48 rounded-md border border-white/10 bg-slate-900 px-3 py-2 text-xs text-white\">\n                <option>USD ($)</option>\n                <option>EUR ()</option>\n                <option>MXN ($)</option>\n              </select>\n            </div>\n            <div className=\"space-y-2\">\n              <p className=\"text-[0.55rem] text-slate-400\">Mobile</p>\n              <div className=\"flex flex-wrap gap-2\">\n                <span className=\"rounded-full border border-white/20 px-3 py-1 text-xs font-semibold text-white\">Get it on Google Play</span>\n                <span className=\"rounded-full border border-white/20 px-3 py-1 text-xs font-semibold text-white\">Download on the App Store</span>\n              </div>\n            </div>\n          </div>\n\n          <div className=\"grid gap-8 md:grid-cols-2 lg:grid-cols-4\">\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Support</p>\n              {['Help center', 'Contact us', 'How it works', 'FAQs'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Company</p>\n              {['About Proactivitis', 'Our mission', 'Press & media', 'Partners'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Work with us</p>\n              {['Become a supplier', 'Agency partners', 'Affiliates', 'Careers (coming soon)'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Legal</p>\n              {['Terms & conditions', 'Privacy policy', 'Cookies', 'Legal information'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          <div className=\"flex flex-col gap-4 border-t border-white/10 pt-6 text-xs text-gray-400 md:flex-row md:items-center md:justify-between\">\n            <div className=\"flex flex-wrap items-center gap-3 text-[0.6rem] uppercase tracking-[0.3em] text-gray-300\">\n              {['Visa', 'Mastercard', 'Amex', 'PayPal', 'Apple Pay', 'Google Pay'].map((method) => (\n                <span key={method} className=\"rounded-full border border-white/20 px-3 py-1\">\n                  {method}\n                </span>\n              ))}\n            </div>\n            <div className=\"flex items-center gap-3 text-xl text-white\">\n              {socialLinks.map((social) => (\n                <Link\n                  key={social.label}\n                  href={social.href}\n                  className=\"inline-flex h-10 w-10 items-center justify-center rounded-full border border-white/20 text-white transition hover:border-white hover:text-sky-300\"\n                  aria-label={social.label}\n                >\n                  {social.icon}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          <p className=\"text-center text-[0.65rem] uppercase tracking-[0.3em] text-gray-500\">\n             {new Date().getFullYear()} Proactivitis. Operated by Owen Dominicanproactivitis Limited. All rights reserved.\n          </p>\n        </div>\n      </footer>\n"""
-if old not in text:
-    raise SystemExit('old block not found')
-text = text.replace(old, new)
-path.write_text(text)
+new = """      {/* Footer oscuro con columnas informativas y controles de negocio. */}\n      <footer id=\"footer\" className=\"border-t border-slate-900 bg-slate-950 px-6 py-10 text-sm text-gray-200\">\n        <div className=\"mx-auto flex max-w-6xl flex-col gap-10\">\n          <div className=\"flex flex-col gap-6 border-b border-white/10 pb-6 text-xs uppercase tracking-[0.3em] text-gray-400 md:flex-row md:items-center md:justify-between\">\n            <div className=\"space-y-2\">\n              <p className=\"text-[0.55rem] text-slate-400\">Language</p>\n              <select className=\"w-48 rounded-md border border-white/10 bg-slate-900 px-3 py-2 text-xs text-white\">\n                <option>English (Global)</option>\n                <option>Español</option>\n                <option>Português</option>\n              </select>\n            </div>\n            <div className=\"space-y-2\">\n              <p className=\"text-[0.55rem] text-slate-400\">Currency</p>\n              <select className=\"w-48 rounded-md border border-white/10 bg-slate-900 px-3 py-2 text-xs text-white\">\n                <option>USD ($)</option>\n                <option>EUR (€)</option>\n                <option>MXN ($)</option>\n              </select>\n            </div>\n            <div className=\"space-y-2\">\n              <p className=\"text-[0.55rem] text-slate-400\">Mobile</p>\n              <div className=\"flex flex-wrap gap-2\">\n                <span className=\"rounded-full border border-white/20 px-3 py-1 text-xs font-semibold text-white\">Get it on Google Play</span>\n                <span className=\"rounded-full border border-white/20 px-3 py-1 text-xs font-semibold text-white\">Download on the App Store</span>\n              </div>\n            </div>\n          </div>\n\n          <div className=\"grid gap-8 md:grid-cols-2 lg:grid-cols-4\">\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Support</p>\n              {['Help center', 'Contact us', 'How it works', 'FAQs'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Company</p>\n              {['About Proactivitis', 'Our mission', 'Press & media', 'Partners'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Work with us</p>\n              {['Become a supplier', 'Agency partners', 'Affiliates', 'Careers (coming soon)'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n            <div className=\"space-y-3\">\n              <p className=\"text-xs uppercase tracking-[0.3em] text-slate-400\">Legal</p>\n              {['Terms & conditions', 'Privacy policy', 'Cookies', 'Legal information'].map((item) => (\n                <Link key={item} href=\"#\" className=\"block text-white transition hover:text-sky-300\">\n                  {item}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          <div className=\"flex flex-col gap-4 border-t border-white/10 pt-6 text-xs text-gray-400 md:flex-row md:items-center md:justify-between\">\n            <div className=\"flex flex-wrap items-center gap-3 text-[0.6rem] uppercase tracking-[0.3em] text-gray-300\">\n              {['Visa', 'Mastercard', 'Amex', 'PayPal', 'Apple Pay', 'Google Pay'].map((method) => (\n                <span key={method} className=\"rounded-full border border-white/20 px-3 py-1\">\n                  {method}\n                </span>\n              ))}\n            </div>\n            <div className=\"flex items-center gap-3 text-xl text-white\">\n              {socialLinks.map((social) => (\n                <Link\n                  key={social.label}\n                  href={social.href}\n                  className=\"inline-flex h-10 w-10 items-center justify-center rounded-full border border-white/20 text-white transition hover:border-white hover:text-sky-300\"\n                  aria-label={social.label}\n                >\n                  {social.icon}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          <p className=\"text-center text-[0.65rem] uppercase tracking-[0.3em] text-gray-500\">\n            © {new Date().getFullYear()} Proactivitis. Operated by Owen Dominicanproactivitis Limited. All rights reserved.\n          </p>\n        </div>\n      </footer>\n"""
+
+
+def main() -> None:
+    try:
+        results = apply_plan([Edit(file='app/(public)/layout.tsx', find=old, replace=new, whitespace='loose')])
+    except PlanError as exc:
+        raise SystemExit(f'footer not replaced: {exc}')
+    print(combined_diff(results, Path('.')))
+
+
+if __name__ == '__main__':
+    run_tool(main)
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+from content_cli import run_tool
+from landing_index import LandingIndex
+
 
 MISSING_SLUGS = [
     "punta-cana-international-airport-to-barcelo-bavaro-beach",
@@ -36,13 +39,16 @@ MISSING_SLUGS = [
 ]
 
 
+AIRPORT_PREFIX = "punta-cana-international-airport-to-"
+
+
 def slug_to_hotel_name(slug: str) -> str:
-    base = slug.split("to-")[-1]
+    base = slug.removeprefix(AIRPORT_PREFIX)
     return base.replace("-", " ").title()
 
 
 def build_entry(slug: str) -> str:
-    hotel_slug = slug.split("to-")[-1]
+    hotel_slug = slug.removeprefix(AIRPORT_PREFIX)
     hotel_name = slug_to_hotel_name(slug)
     return (
         "  {\n"
@@ -70,16 +76,10 @@ def build_entry(slug: str) -> str:
 
 def main():
     path = Path("data/transfer-landings.ts")
-    text = path.read_text(encoding="utf-8")
-    marker = "];"
-    idx = text.rfind(marker)
-    if idx == -1:
-        raise SystemExit("Could not locate closing `];` in transfer-landings.ts")
-    entries = [build_entry(slug) for slug in MISSING_SLUGS]
-    insertion = ",\n".join(entries)
-    new_text = text[:idx] + ",\n" + insertion + "\n];" + text[idx + len(marker) :]
-    path.write_text(new_text, encoding="utf-8")
+    index = LandingIndex.load()
+    written = index.insert_entries(path, [(slug, build_entry(slug)) for slug in MISSING_SLUGS])
+    print(f"Inserted {len(written)} landings, {len(MISSING_SLUGS) - len(written)} already present")
 
 
 if __name__ == "__main__":
-    main()
+    run_tool(main)
@@ -1,33 +1,27 @@
-from pathlib import Path
+from content_cli import run_tool
+from i18n_patch import patch_messages
 
 
 INSERTS = {
-    "messages/es.json": [
-        '  "thingsToDo.meta.title": "Que hacer en {hotel} | Tours y traslados Proactivitis",',
-        '  "thingsToDo.meta.description": "Proactivitis recomienda {hotel} y experiencias cercanas. Reserva tours y traslados con confirmacion inmediata."'
-    ],
-    "messages/en.json": [
-        '  "thingsToDo.meta.title": "Things to do in {hotel} | Proactivitis tours and transfers",',
-        '  "thingsToDo.meta.description": "Proactivitis recommends {hotel} and nearby experiences. Book tours and transfers with instant confirmation."'
-    ],
-    "messages/fr.json": [
-        '  "thingsToDo.meta.title": "Things to do in {hotel} | Tours et transferts Proactivitis",',
-        '  "thingsToDo.meta.description": "Proactivitis recommande {hotel} et des experiences a proximite. Reservez des tours et transferts avec confirmation immediate."'
-    ]
+    "es": {
+        "thingsToDo.meta.title": "Que hacer en {hotel} | Tours y traslados Proactivitis",
+        "thingsToDo.meta.description": "Proactivitis recomienda {hotel} y experiencias cercanas. Reserva tours y traslados con confirmacion inmediata."
+    },
+    "en": {
+        "thingsToDo.meta.title": "Things to do in {hotel} | Proactivitis tours and transfers",
+        "thingsToDo.meta.description": "Proactivitis recommends {hotel} and nearby experiences. Book tours and transfers with instant confirmation."
+    },
+    "fr": {
+        "thingsToDo.meta.title": "Things to do in {hotel} | Tours et transferts Proactivitis",
+        "thingsToDo.meta.description": "Proactivitis recommande {hotel} et des experiences a proximite. Reservez des tours et transferts avec confirmation immediate."
+    }
 }
 
 
-def append_keys(path: str, lines: list[str]) -> None:
-    file_path = Path(path)
-    text = file_path.read_text(encoding="latin-1")
-    if '"thingsToDo.meta.title"' in text:
-        return
-    trimmed = text.rstrip()
-    if not trimmed.endswith("}"):
-        raise ValueError(f"{path} does not end with a JSON object")
-    updated = trimmed[:-1] + ",\n" + "\n".join(lines) + "\n}\n"
-    file_path.write_text(updated, encoding="latin-1")
+def main() -> None:
+    for report in patch_messages([INSERTS]):
+        print(report.summary())
 
 
-for file_path, lines in INSERTS.items():
-    append_keys(file_path, lines)
+if __name__ == "__main__":
+    run_tool(main)
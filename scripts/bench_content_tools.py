@@ -0,0 +1,461 @@
+"""Scaling benchmark for the content tooling at 1x/10x/100x today's data size.
+
+For each family the fixtures are generated in a temp directory, sized
+relative to what is in the repo right now, and the tool's load / diff / write
+phases are timed separately. Where a family runs a tool end to end, its
+content_cli spans are folded into those phases (read + parse = load,
+transform = diff, write = write), so every phase times the tool's own code:
+
+  messages  - i18n_patch.patch_messages (spans)
+  locales   - check_locales: read_catalog / check / JSON report
+  landings  - landing_index + generate_transfer_landings (and the slug
+              lookup compare_landings.py does): index rebuild /
+              plan + select_new + duplicates / stream_into + refresh
+  links     - link_check offline: index rebuild / inventory + checks / report
+  hotels    - hotel_dedup: load_hotel_directory / find_clusters / JSON report
+  keywords  - keyword_coverage: documents + sheets / index + analyze / report
+  feed      - merchant_feed.build_feed over a synthetic Tour table (spans)
+  patch     - source_patch.apply_plan, the engine behind replace_footer.py,
+              over synthetic .tsx files (spans) plus combined_diff
+
+Not covered: booking_analytics, transfer_price_matrix and image_derivatives
+(they need prisma/dev.db, numpy or Pillow), message_shards and the online
+link_check crawl.
+
+Every (family, scale) runs in a fresh process so peak RSS is per run (not
+recorded on Windows, which has no `resource` module).
+Results are written as JSON; with --baseline, phases slower than the
+baseline by more than --tolerance are listed and the exit code is 1.
+
+Usage:
+    python scripts/bench_content_tools.py [--family messages landings ...] [--scale 1 10 100]
+        [--output .cache/content-tools/bench.json] [--baseline previous.json] [--tolerance 0.25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from bench_i18n_patch import write_catalogs
+from check_locales import check, read_catalog
+from content_cli import TIMER, peak_rss_kb, run_tool
+from generate_transfer_landings import (
+    AIRPORTS,
+    SEED_PATH,
+    TARGET_PATH,
+    Landing,
+    PriceFrom,
+    load_hotel_directory,
+    plan_landings,
+    render_landing,
+    select_new,
+    stream_into,
+)
+from hotel_dedup import find_clusters
+from i18n_patch import MESSAGES_DIR, patch_messages
+from keyword_coverage import KeywordIndex, analyze, load_documents, load_sheets
+from landing_index import LandingIndex
+from link_check import SITE_ORIGIN, LinkReport, build_inventory, check_offline, load_discovered
+from merchant_feed import DB_PATH, build_feed
+from source_patch import Edit, apply_plan, combined_diff
+from slugs import slugify
+
+OUTPUT_PATH = Path(".cache/content-tools/bench.json")
+FAMILIES = ("messages", "locales", "landings", "links", "hotels", "keywords", "feed", "patch")
+SCALES = (1, 10, 100)
+LANDINGS_HEADER = "export const transferLandings: TransferLandingData[] = [\n"
+LANDINGS_FOOTER = "\n];\n"
+BRANDS = ["Riu", "Iberostar", "Bahia Principe", "Barcelo", "Melia", "Secrets", "Dreams", "Royalton", "Hyatt", "Catalonia"]
+QUALIFIERS = ["Grand", "Palace", "Beach", "Suites", "Collection", "Deluxe", "Bavaro", "Cap Cana", "Select", "Village"]
+VARIANTS = ["{}", "{} Resort", "Hotel {}", "{} & Spa", "{} All Inclusive"]
+# Tours in the feed family when there is no prisma/dev.db to count.
+DEFAULT_TOURS = 500
+# content_cli span -> benchmark phase.
+SPAN_PHASES = {"read": "load", "parse": "load", "transform": "diff", "write": "write"}
+TSX_TEMPLATE = """import Link from "next/link";
+
+export default function Bench{i}() {{
+  return (
+    <main className="mx-auto max-w-6xl px-6 py-10">
+{filler}
+{indent}<footer className="border-t border-slate-800 bg-slate-950 px-6 py-12">
+{indent}  <p className="text-gray-400">Bench {i}</p>
+{indent}</footer>
+    </main>
+  );
+}}
+"""
+OLD_FOOTER = """<footer className="border-t border-slate-800 bg-slate-950 px-6 py-12">
+  <p className="text-gray-400">"""
+NEW_FOOTER = """<footer className="border-t border-slate-900 bg-slate-950 px-6 py-10">
+  <p className="text-slate-400">"""
+
+
+def current_sizes() -> dict[str, int]:
+    """Today's sizes, read from the repo (used as the 1x baseline)."""
+    catalogs = sorted(MESSAGES_DIR.glob("*.json"))
+    keys = max((len(json.loads(path.read_text(encoding="utf-8"))) for path in catalogs), default=1000)
+    index = LandingIndex(cache_path=None)
+    index.refresh()
+    zones = load_hotel_directory(SEED_PATH)
+    sheets = load_sheets(sorted(Path(".").glob("*_keywords.csv")))
+    tours = DEFAULT_TOURS
+    if DB_PATH.exists():
+        with sqlite3.connect(f"{DB_PATH.resolve().as_uri()}?mode=ro", uri=True) as conn:
+            tours = conn.execute("SELECT COUNT(*) FROM Tour").fetchone()[0] or DEFAULT_TOURS
+    return {
+        "locales": len(catalogs) or 3,
+        "messageKeys": keys,
+        "landings": len(index.entries_in(TARGET_PATH)) or 64,
+        "discovered": len(load_discovered()) or 100,
+        "hotels": sum(len(names) for names in zones.values()),
+        "zones": len(zones),
+        "keywords": sum(len(row.keywords) for row in sheets) or 100,
+        "tours": tours,
+        "tsxFiles": sum(1 for folder in ("app", "components") for _ in Path(folder).rglob("*.tsx")) or 500,
+    }
+
+
+def synthetic_hotels(count: int, zone_names: list[str], rng: random.Random) -> dict[str, list[str]]:
+    zones: dict[str, list[str]] = {zone: [] for zone in zone_names}
+    for i in range(count):
+        base = f"{rng.choice(BRANDS)} {rng.choice(QUALIFIERS)} {i // 3}"
+        zones[zone_names[i % len(zone_names)]].append(rng.choice(VARIANTS).format(base))
+    return zones
+
+
+def write_seed(path: Path, zones: dict[str, list[str]]) -> None:
+    halves = {"directory": {}, "extraDirectory": {}}
+    for zone, names in zones.items():
+        halves["extraDirectory" if zone.endswith("_EXTRA") else "directory"][zone] = names
+    parts = []
+    for name, body in halves.items():
+        blocks = ",\n".join(f"  {zone}: {json.dumps(names, ensure_ascii=False)}" for zone, names in body.items())
+        parts.append(f"const {name} = {{\n{blocks}\n}};\n")
+    path.write_text("\n".join(parts), encoding="utf-8")
+
+
+def _add(phases: dict[str, dict[str, float]], name: str, seconds: float) -> None:
+    phase = phases.setdefault(name, {"seconds": 0.0, "rssKb": 0})
+    phase["seconds"] = round(phase["seconds"] + seconds, 4)
+    phase["rssKb"] = peak_rss_kb()
+
+
+def timed(phases: dict[str, dict[str, float]], name: str, func: Callable[[], Any]) -> Any:
+    started = time.perf_counter()
+    result = func()
+    _add(phases, name, time.perf_counter() - started)
+    return result
+
+
+def traced(phases: dict[str, dict[str, float]], func: Callable[[], Any]) -> Any:
+    """Run a tool entry point and add its content_cli spans to the load/diff/write phases."""
+    TIMER.reset()
+    result = func()
+    for name, stats in TIMER.snapshot().items():
+        _add(phases, SPAN_PHASES.get(name, "diff"), stats["seconds"])
+    for name in ("load", "diff", "write"):
+        _add(phases, name, 0.0)
+    return result
+
+
+def write_landings(target: Path, count: int) -> list[str]:
+    """Write `count` forward transfer landings for synthetic hotels; returns their slugs."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    airports = list(AIRPORTS.values())
+    blocks, slugs = [], []
+    for i in range(count):
+        name = f"Bench Hotel {i}"
+        airport = airports[i % len(airports)]
+        hotel_slug = slugify(name)
+        landing = Landing(f"{airport.slug}-to-{hotel_slug}", f"{hotel_slug}-to-{airport.slug}", hotel_slug, name, airport, "")
+        blocks.append(render_landing(landing, 45))
+        slugs.append(landing.slug)
+    target.write_text(LANDINGS_HEADER + ",\n".join(blocks) + LANDINGS_FOOTER, encoding="utf-8")
+    return slugs
+
+
+def bench_messages(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    keys = sizes["messageKeys"] * scale
+    new_keys = max(10, keys // 50)
+    locales = [f"l{i}" for i in range(sizes["locales"])]
+    write_catalogs(workdir, locales, keys)
+    # Half of the batch already exists, so the diff phase has real work to do.
+    batch = {
+        locale: {f"bench.section{i % 97}.key{i}": f"{locale} nuevo {i}" for i in range(keys - new_keys // 2, keys + new_keys // 2)}
+        for locale in locales
+    }
+    phases: dict[str, dict[str, float]] = {}
+    traced(phases, lambda: patch_messages([batch], messages_dir=workdir))
+    return keys * len(locales), phases
+
+
+def bench_locales(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    keys = sizes["messageKeys"] * scale
+    locales = ["es"] + [f"l{i}" for i in range(1, sizes["locales"])]
+    write_catalogs(workdir, locales, keys)
+    paths = sorted(workdir.glob("*.json"))
+    phases: dict[str, dict[str, float]] = {}
+    catalogs = timed(phases, "load", lambda: {path.stem: read_catalog(path) for path in paths})
+    issues = timed(phases, "diff", lambda: check(catalogs, "es"))
+    report = {locale: vars(found) for locale, found in issues.items()}
+    timed(phases, "write", lambda: (workdir / "locales.json").write_text(json.dumps(report), encoding="utf-8"))
+    return keys * len(locales), phases
+
+
+def bench_landings(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    data_dir = workdir / "data"
+    target = data_dir / "transfer-landings.ts"
+    airports = list(AIRPORTS.values())
+    existing = sizes["landings"] * scale
+    slugs = write_landings(target, existing)
+    zones = synthetic_hotels(sizes["hotels"] * scale, sorted({zone for a in airports for zone in a.zones}), rng)
+
+    phases: dict[str, dict[str, float]] = {}
+    index = timed(phases, "load", lambda: LandingIndex.load(data_dir, workdir / "index.json", rebuild=True))
+
+    def diff() -> list[Landing]:
+        index.duplicates()
+        index.missing(slugs[::2], target)
+        return list(select_new(plan_landings(zones, airports), index))
+
+    new = timed(phases, "diff", diff)
+    anchor = max(entry.end for entry in index.entries_in(target))
+
+    def write() -> None:
+        price_from = PriceFrom()
+        stream_into(target, anchor, (render_landing(landing, price_from.for_landing(landing)) for landing in new))
+        index.refresh()
+
+    timed(phases, "write", write)
+    return existing + len(new), phases
+
+
+def bench_hotels(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    seed = workdir / "seed-transfer-hotels.ts"
+    zone_names = sorted(load_hotel_directory(SEED_PATH))
+    write_seed(seed, synthetic_hotels(sizes["hotels"] * scale, zone_names, rng))
+    phases: dict[str, dict[str, float]] = {}
+    zones = timed(phases, "load", lambda: load_hotel_directory(seed))
+    clusters = timed(phases, "diff", lambda: find_clusters(zones))
+
+    def write() -> None:
+        report = {
+            group: [[hotel.name for hotel in members] for members, _ in found] for group, found in clusters.items()
+        }
+        (workdir / "clusters.json").write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    timed(phases, "write", write)
+    return sum(len(names) for names in zones.values()), phases
+
+
+def bench_links(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    slugs = write_landings(workdir / "data" / "transfer-landings.ts", sizes["landings"] * scale)
+    discovered = [
+        f"{SITE_ORIGIN}/transfer/{slugs[i % len(slugs)] if i % 4 and slugs else f'bench-stale-{i}'}"
+        for i in range(sizes["discovered"] * scale)
+    ]
+    phases: dict[str, dict[str, float]] = {}
+    previous = Path.cwd()
+    # Routes are keyed by repo-relative data paths, so run from the fixture root.
+    os.chdir(workdir)
+    try:
+        index = timed(phases, "load", lambda: LandingIndex.load(Path("data"), None, rebuild=True))
+
+        def diff() -> tuple[Any, LinkReport]:
+            inventory = build_inventory(index, discovered)
+            report = LinkReport()
+            check_offline(index, inventory, report)
+            return inventory, report
+
+        inventory, report = timed(phases, "diff", diff)
+        timed(phases, "write", lambda: Path("links.json").write_text(json.dumps(asdict(report)), encoding="utf-8"))
+    finally:
+        os.chdir(previous)
+    return len(inventory.pages), phases
+
+
+def bench_keywords(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    target = workdir / "data" / "transfer-landings.ts"
+    slugs = write_landings(target, sizes["landings"] * scale)
+    sheet = workdir / "keywords.csv"
+    keywords = sizes["keywords"] * scale
+    with sheet.open("w", encoding="utf-8", newline="") as handle:
+        handle.write("url,locale,keywords\n")
+        for start in range(0, keywords, 10):
+            slug = rng.choice(slugs)
+            terms = ", ".join(f"bench hotel {rng.randrange(len(slugs))} transfer" for _ in range(min(10, keywords - start)))
+            handle.write(f"{SITE_ORIGIN}/transfer/{slug},{rng.choice(('es', 'en', 'fr'))},\"{terms}\"\n")
+    phases: dict[str, dict[str, float]] = {}
+    docs = timed(phases, "load", lambda: load_documents([target]))
+    rows = timed(phases, "load", lambda: load_sheets([sheet]))
+    report = timed(phases, "diff", lambda: analyze(rows, KeywordIndex(docs)))
+    timed(phases, "write", lambda: (workdir / "keywords.json").write_text(json.dumps(report), encoding="utf-8"))
+    return keywords, phases
+
+
+def bench_feed(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    db = workdir / "dev.db"
+    tours = sizes["tours"] * scale
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "CREATE TABLE Tour (id TEXT PRIMARY KEY, productId TEXT, title TEXT, slug TEXT, price REAL, description TEXT, "
+            "subtitle TEXT, shortDescription TEXT, category TEXT, location TEXT, heroImage TEXT, gallery TEXT, "
+            "status TEXT, featured INTEGER, createdAt TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO Tour VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    f"tour-{i}", f"P{i}", f"Bench tour {i} & catamaran", f"bench-tour-{i}", 30 + i % 200,
+                    "<p>" + " ".join(rng.choice(BRANDS) for _ in range(80)) + "</p>", f"Subtitle {i}", None,
+                    rng.choice(("Boat Tours", "Adventure", "Transfers")), "Punta Cana", None,
+                    json.dumps([f"/fototours/{i}-{n}.jpg" for n in range(4)]), "published", i % 2,
+                    f"2026-01-{1 + i % 28:02d}T00:00:00Z",
+                )
+                for i in range(tours)
+            ),
+        )
+    output = workdir / "products.tsv"
+    build_feed(db, output)
+    # The timed run diffs against the previous feed, like a nightly rebuild.
+    with sqlite3.connect(db) as conn:
+        conn.execute("UPDATE Tour SET price = price + 1 WHERE rowid % 10 = 0")
+        conn.execute("DELETE FROM Tour WHERE rowid % 50 = 0")
+    phases: dict[str, dict[str, float]] = {}
+    traced(phases, lambda: build_feed(db, output))
+    return tours, phases
+
+
+def bench_patch(workdir: Path, sizes: dict[str, int], scale: int, rng: random.Random) -> tuple[int, dict]:
+    files = sizes["tsxFiles"] * scale
+    folder = workdir / "components"
+    folder.mkdir()
+    filler = "\n".join(f'      <section className="py-4">Bench section {n}</section>' for n in range(60))
+    edits = []
+    for i in range(files):
+        # Indentation drifts between files, which the loose whitespace match has to absorb.
+        text = TSX_TEMPLATE.format(i=i, filler=filler, indent=" " * (4 + 2 * (i % 3)))
+        (folder / f"Bench{i}.tsx").write_text(text, encoding="utf-8")
+        edits.append(Edit(file=f"components/Bench{i}.tsx", find=OLD_FOOTER, replace=NEW_FOOTER, whitespace="loose"))
+    phases: dict[str, dict[str, float]] = {}
+    results = traced(phases, lambda: apply_plan(edits, workdir))
+    timed(phases, "diff", lambda: combined_diff(results, workdir))
+    return files, phases
+
+
+BENCHES = {
+    "messages": bench_messages,
+    "locales": bench_locales,
+    "landings": bench_landings,
+    "links": bench_links,
+    "hotels": bench_hotels,
+    "keywords": bench_keywords,
+    "feed": bench_feed,
+    "patch": bench_patch,
+}
+
+
+def run_case(job: tuple[str, int, dict[str, int], int]) -> dict[str, Any]:
+    family, scale, sizes, seed = job
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory(prefix=f"bench-{family}-") as tmp:
+        items, phases = BENCHES[family](Path(tmp), sizes, scale, rng)
+    total = sum(phase["seconds"] for phase in phases.values())
+    return {
+        "family": family,
+        "scale": scale,
+        "items": items,
+        "phases": phases,
+        "seconds": round(total, 4),
+        "itemsPerSecond": round(items / total) if total else None,
+        "peakRssKb": peak_rss_kb(),
+    }
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float, floor: float = 0.05) -> list[str]:
+    """Phases more than `tolerance` slower than baseline (ignoring ones under `floor` seconds)."""
+    previous = {(run["family"], run["scale"]): run for run in baseline}
+    regressions = []
+    for run in results:
+        old = previous.get((run["family"], run["scale"]))
+        if not old:
+            continue
+        for name, phase in run["phases"].items():
+            before = old["phases"].get(name, {}).get("seconds")
+            if before and phase["seconds"] >= floor and phase["seconds"] > before * (1 + tolerance):
+                regressions.append(
+                    f"{run['family']} x{run['scale']} {name}: {before:.3f}s -> {phase['seconds']:.3f}s"
+                )
+        if old.get("peakRssKb") and run["peakRssKb"] and run["peakRssKb"] > old["peakRssKb"] * (1 + tolerance):
+            regressions.append(f"{run['family']} x{run['scale']} peak RSS: {old['peakRssKb']} -> {run['peakRssKb']} KB")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark content tools at multiples of today's data size")
+    parser.add_argument("--family", nargs="+", choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument("--scale", nargs="+", type=int, default=list(SCALES))
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--baseline", type=Path, help="previous results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio before flagging")
+    args = parser.parse_args(argv)
+
+    sizes = current_sizes()
+    print(f"1x = {sizes}")
+    print(f"{'family':>9} {'scale':>6} {'items':>9} {'load':>8} {'diff':>8} {'write':>8} {'items/s':>10} {'peak MB':>8}")
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for family in args.family:
+        for scale in args.scale:
+            # A fresh interpreter per case keeps ru_maxrss scoped to that case.
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                run = pool.submit(run_case, (family, scale, sizes, args.seed)).result()
+            results.append(run)
+            seconds = {name: run["phases"].get(name, {}).get("seconds", 0.0) for name in ("load", "diff", "write")}
+            peak = f"{run['peakRssKb'] / 1024:.1f}" if run["peakRssKb"] else "-"
+            print(
+                f"{family:>9} {scale:>5}x {run['items']:>9,} {seconds['load']:>8.3f} "
+                f"{seconds['diff']:>8.3f} {seconds['write']:>8.3f} "
+                f"{run['itemsPerSecond'] or 0:>10,} {peak:>8}"
+            )
+
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "baseSizes": sizes,
+        "runs": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    print(args.output)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["runs"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"regression: {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    run_tool(main)
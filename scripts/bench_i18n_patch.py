@@ -0,0 +1,73 @@
+"""Wall-clock scaling of i18n_patch across locale counts and worker counts.
+
+Builds synthetic catalogs in a temp directory (nothing under messages/ is
+touched), patches a batch into every locale and prints one row per run.
+
+Usage:
+    python scripts/bench_i18n_patch.py [--keys 50000] [--locales 3 6 12] [--workers 1 2 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from content_cli import run_tool
+from i18n_patch import merge_reports, patch_messages
+
+
+def write_catalogs(directory: Path, locales: list[str], keys: int) -> None:
+    """Synthetic catalogs with `keys` keys per locale; shared with bench_content_tools."""
+    for locale in locales:
+        catalog = {f"bench.section{i % 97}.key{i}": f"{locale} value {i} for {{hotel}}" for i in range(keys)}
+        (directory / f"{locale}.json").write_text(
+            json.dumps(catalog, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+
+
+def build_batch(locales: list[str], new_keys: int) -> dict[str, dict[str, str]]:
+    return {
+        locale: {f"bench.added.key{i}": f"{locale} added {i}" for i in range(new_keys)}
+        for locale in locales
+    }
+
+
+def run_once(locale_count: int, workers: int, keys: int, new_keys: int) -> tuple[float, dict[str, int]]:
+    locales = [f"l{i:02d}" for i in range(locale_count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_catalogs(directory, locales, keys)
+        batch = build_batch(locales, new_keys)
+        started = time.perf_counter()
+        reports = patch_messages([batch], messages_dir=directory, workers=workers)
+        elapsed = time.perf_counter() - started
+    return elapsed, merge_reports(reports)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark i18n_patch scaling")
+    parser.add_argument("--keys", type=int, default=50_000, help="existing keys per locale")
+    parser.add_argument("--new-keys", type=int, default=200, help="keys appended per locale")
+    parser.add_argument("--locales", type=int, nargs="+", default=[3, 6, 12])
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args(argv)
+
+    print(f"cpu_count={os.cpu_count()} keys/locale={args.keys} new/locale={args.new_keys}")
+    print(f"{'locales':>8} {'workers':>8} {'seconds':>9} {'speedup':>8} {'keys/s':>12}")
+    for locale_count in args.locales:
+        baseline = None
+        for workers in args.workers:
+            elapsed, totals = run_once(locale_count, workers, args.keys, args.new_keys)
+            baseline = baseline or elapsed
+            print(
+                f"{locale_count:>8} {workers:>8} {elapsed:>9.3f} {baseline / elapsed:>7.2f}x "
+                f"{totals['keys'] / elapsed:>12,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,399 @@
+"""Booking and landing-traffic analytics over the local SQLite snapshot (prisma/dev.db).
+
+Dashboard queries never scan Booking or LandingPageTraffic directly. A
+refresh (one writer connection, WAL, single transaction) writes these
+summary tables into the database itself:
+
+  _analytics_booking_rows     id -> the bucket each booking was last counted in
+  _analytics_bookings_daily   day x source: bookings, pax, revenue, cancelled
+  _analytics_cancellations    day x cancellationByRole: count, amount
+  _analytics_landings         landing slug -> data file (from landing_index)
+  _analytics_landing_traffic  slug -> visits, updatedAt
+  _analytics_state            per-source updatedAt watermark
+
+Only rows with updatedAt (or createdAt when updatedAt is NULL) at or past the
+watermark are read; their previous contribution is subtracted and the new
+one added, so re-reading a row is harmless. Deleted bookings are found with
+an anti-join of _analytics_booking_rows against Booking on id. Missing
+covering indexes for these scans are created in dev.db first; a snapshot
+without a LandingPageTraffic table gets no traffic index or rollup.
+
+Without --refresh/--rebuild nothing is written: queries go through a small
+pool of read-only (mode=ro, query_only) connections, which WAL lets run
+alongside the app's writes.
+
+Usage:
+    python scripts/booking_analytics.py [--db prisma/dev.db] [--refresh | --rebuild]
+        [--since 2026-01-01] [--until 2026-12-31] [--top 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from content_cli import run_tool, span
+from landing_index import LandingIndex
+from sqlite_migrate import DB_PATH, _quote, connect
+
+STATE_TABLE = "_analytics_state"
+
+
+@dataclass(frozen=True)
+class Index:
+    table: str
+    columns: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return f"analytics_{self.table}_{'_'.join(self.columns)}"
+
+    def create(self) -> str:
+        columns = ", ".join(_quote(column) for column in self.columns)
+        return f"CREATE INDEX IF NOT EXISTS {_quote(self.name)} ON {_quote(self.table)} ({columns})"
+
+
+INDEXES = (
+    Index("Booking", ("updatedAt", "id")),
+    Index("Booking", ("createdAt", "id")),
+    Index("Booking", ("source", "date", "status", "totalAmount")),
+    Index("Booking", ("cancellationByRole", "cancellationAt", "totalAmount")),
+    Index("LandingPageTraffic", ("updatedAt", "slug", "visits")),
+)
+
+SUMMARY_TABLES = {
+    "_analytics_booking_rows": (
+        "id TEXT PRIMARY KEY, day TEXT, source TEXT, pax INTEGER NOT NULL, amount REAL NOT NULL, "
+        "cancelled INTEGER NOT NULL, cancelRole TEXT, cancelDay TEXT"
+    ),
+    "_analytics_bookings_daily": (
+        "day TEXT, source TEXT, bookings INTEGER NOT NULL, pax INTEGER NOT NULL, revenue REAL NOT NULL, "
+        "cancelled INTEGER NOT NULL, PRIMARY KEY (day, source)"
+    ),
+    "_analytics_cancellations": (
+        "day TEXT, role TEXT, cancellations INTEGER NOT NULL, amount REAL NOT NULL, PRIMARY KEY (day, role)"
+    ),
+    "_analytics_landings": "slug TEXT PRIMARY KEY, file TEXT NOT NULL",
+    "_analytics_landing_traffic": "slug TEXT PRIMARY KEY, visits INTEGER NOT NULL, updatedAt",
+    STATE_TABLE: "name TEXT PRIMARY KEY, watermark, refreshedAt TEXT NOT NULL",
+}
+
+
+def day_of(column: str) -> str:
+    """Calendar day of a DateTime column stored either as ISO text or as Prisma's epoch milliseconds."""
+    return (
+        f"CASE WHEN typeof({column}) IN ('integer', 'real') THEN date({column} / 1000, 'unixepoch') "
+        f"ELSE date({column}) END"
+    )
+
+
+CHANGED_BOOKINGS = f"""
+    SELECT id, {day_of('date')} AS day, COALESCE(source, 'WEB') AS source,
+           COALESCE(paxAdults, 0) + COALESCE(paxChildren, 0) AS pax, COALESCE(totalAmount, 0) AS amount,
+           (status = 'CANCELLED' OR cancellationAt IS NOT NULL) AS cancelled,
+           cancellationByRole AS cancelRole, {day_of('cancellationAt')} AS cancelDay
+    FROM Booking
+"""
+CHANGED_SINCE = "WHERE updatedAt >= :mark OR (updatedAt IS NULL AND createdAt >= :mark)"
+
+# Aggregate a set of booking rows into signed deltas for both summaries.
+DAILY_DELTA = """
+    INSERT INTO _analytics_bookings_daily (day, source, bookings, pax, revenue, cancelled)
+    SELECT day, source, {sign} * COUNT(*), {sign} * SUM(pax), {sign} * SUM(amount), {sign} * SUM(cancelled)
+    FROM {rows} WHERE true GROUP BY day, source
+    ON CONFLICT (day, source) DO UPDATE SET
+        bookings = bookings + excluded.bookings, pax = pax + excluded.pax,
+        revenue = revenue + excluded.revenue, cancelled = cancelled + excluded.cancelled
+"""
+CANCELLATION_DELTA = """
+    INSERT INTO _analytics_cancellations (day, role, cancellations, amount)
+    SELECT COALESCE(cancelDay, day), COALESCE(cancelRole, 'UNKNOWN'), {sign} * COUNT(*), {sign} * SUM(amount)
+    FROM {rows} WHERE cancelled GROUP BY 1, 2
+    ON CONFLICT (day, role) DO UPDATE SET
+        cancellations = cancellations + excluded.cancellations, amount = amount + excluded.amount
+"""
+OLD_ROWS = "(SELECT * FROM _analytics_booking_rows WHERE id IN (SELECT id FROM temp._changed))"
+GONE_ROWS = """
+    SELECT * FROM _analytics_booking_rows r WHERE NOT EXISTS (SELECT 1 FROM Booking b WHERE b.id = r.id)
+"""
+
+
+@dataclass
+class RefreshReport:
+    created_indexes: list[str] = field(default_factory=list)
+    bookings: int = 0
+    deleted: int = 0
+    traffic: int = 0
+    landings: int = 0
+    missing_tables: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def _has_index(conn: sqlite3.Connection, index: Index) -> bool:
+    """True when an existing index already starts with `index.columns`."""
+    for row in conn.execute(f"PRAGMA index_list({_quote(index.table)})"):
+        columns = tuple(info[2] for info in conn.execute(f"PRAGMA index_info({_quote(row[1])})"))
+        if columns[: len(index.columns)] == index.columns:
+            return True
+    return False
+
+
+def _has_table(conn: sqlite3.Connection, table: str) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+
+def ensure_schema(conn: sqlite3.Connection) -> list[str]:
+    for table, columns in SUMMARY_TABLES.items():
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+    conn.execute("CREATE INDEX IF NOT EXISTS analytics_cancellations_role ON _analytics_cancellations (role, day)")
+    created = []
+    for index in INDEXES:
+        if _has_table(conn, index.table) and not _has_index(conn, index):
+            conn.execute(index.create())
+            created.append(index.name)
+    return created
+
+
+def _watermark(conn: sqlite3.Connection, name: str):
+    row = conn.execute(f"SELECT watermark FROM {STATE_TABLE} WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_watermark(conn: sqlite3.Connection, name: str, value) -> None:
+    conn.execute(
+        f"INSERT OR REPLACE INTO {STATE_TABLE} VALUES (?, ?, datetime('now'))",
+        (name, value),
+    )
+
+
+def refresh_bookings(conn: sqlite3.Connection) -> tuple[int, int]:
+    mark = _watermark(conn, "Booking")
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _changed AS SELECT * FROM _analytics_booking_rows WHERE 0")
+    conn.execute("DELETE FROM temp._changed")
+    since = CHANGED_SINCE if mark is not None else ""
+    conn.execute(f"INSERT INTO temp._changed {CHANGED_BOOKINGS} {since}", {"mark": mark})
+    changed = conn.execute("SELECT COUNT(*) FROM temp._changed").fetchone()[0]
+    if changed:
+        conn.execute(DAILY_DELTA.format(sign=-1, rows=OLD_ROWS))
+        conn.execute(CANCELLATION_DELTA.format(sign=-1, rows=OLD_ROWS))
+        conn.execute("DELETE FROM _analytics_booking_rows WHERE id IN (SELECT id FROM temp._changed)")
+        conn.execute("INSERT INTO _analytics_booking_rows SELECT * FROM temp._changed")
+        conn.execute(DAILY_DELTA.format(sign=1, rows="temp._changed"))
+        conn.execute(CANCELLATION_DELTA.format(sign=1, rows="temp._changed"))
+        latest = conn.execute("SELECT MAX(COALESCE(updatedAt, createdAt)) FROM Booking").fetchone()[0]
+        _set_watermark(conn, "Booking", latest)
+
+    # Compare ids, not counts: a delete plus an insert keeps the counts equal.
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _gone AS SELECT * FROM _analytics_booking_rows WHERE 0")
+    conn.execute("DELETE FROM temp._gone")
+    deleted = conn.execute(f"INSERT INTO temp._gone {GONE_ROWS}").rowcount
+    if deleted:
+        conn.execute(DAILY_DELTA.format(sign=-1, rows="temp._gone"))
+        conn.execute(CANCELLATION_DELTA.format(sign=-1, rows="temp._gone"))
+        conn.execute("DELETE FROM _analytics_booking_rows WHERE id IN (SELECT id FROM temp._gone)")
+    if changed or deleted:
+        conn.execute("DELETE FROM _analytics_bookings_daily WHERE bookings = 0")
+        conn.execute("DELETE FROM _analytics_cancellations WHERE cancellations = 0")
+    return changed, deleted
+
+
+def refresh_traffic(conn: sqlite3.Connection) -> int:
+    mark = _watermark(conn, "LandingPageTraffic")
+    since = "updatedAt >= :mark" if mark is not None else "true"
+    cursor = conn.execute(
+        f"""
+        INSERT INTO _analytics_landing_traffic (slug, visits, updatedAt)
+        SELECT slug, visits, updatedAt FROM LandingPageTraffic WHERE {since}
+        ON CONFLICT (slug) DO UPDATE SET visits = excluded.visits, updatedAt = excluded.updatedAt
+        """,
+        {"mark": mark},
+    )
+    if cursor.rowcount:
+        latest = conn.execute("SELECT MAX(updatedAt) FROM LandingPageTraffic").fetchone()[0]
+        _set_watermark(conn, "LandingPageTraffic", latest)
+    return max(cursor.rowcount, 0)
+
+
+def refresh_landings(conn: sqlite3.Connection, index: LandingIndex) -> int:
+    conn.execute("DELETE FROM _analytics_landings")
+    conn.executemany(
+        "INSERT INTO _analytics_landings VALUES (?, ?)",
+        ((slug, entries[0].file) for slug, entries in index.by_slug.items()),
+    )
+    return len(index.by_slug)
+
+
+def refresh(db_path: Path = DB_PATH, rebuild: bool = False, index: LandingIndex | None = None) -> RefreshReport:
+    started = time.perf_counter()
+    report = RefreshReport()
+    index = index or LandingIndex.load()
+    conn = connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if rebuild:
+                for table in SUMMARY_TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+            report.created_indexes = ensure_schema(conn)
+            report.bookings, report.deleted = refresh_bookings(conn)
+            if _has_table(conn, "LandingPageTraffic"):
+                report.traffic = refresh_traffic(conn)
+            else:
+                report.missing_tables.append("LandingPageTraffic")
+            report.landings = refresh_landings(conn, index)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if report.created_indexes:
+            conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+class ReadPool:
+    """Fixed-size pool of read-only connections; safe to share between threads."""
+
+    def __init__(self, db_path: Path = DB_PATH, size: int = 4) -> None:
+        self.connections: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(
+                f"{db_path.resolve().as_uri()}?mode=ro", uri=True, isolation_level=None, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only=1")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            self.connections.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connections.get()
+        try:
+            yield conn
+        finally:
+            self.connections.put(conn)
+
+    def query(self, sql: str, params: dict | tuple = ()) -> list[sqlite3.Row]:
+        with self.connection() as conn, span("read"):
+            return conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        while not self.connections.empty():
+            self.connections.get_nowait().close()
+
+
+class Analytics:
+    """Dashboard queries; every one reads only the materialized summaries."""
+
+    def __init__(self, pool: ReadPool) -> None:
+        self.pool = pool
+
+    def bookings_by_source(self, since: str = "", until: str = "9999") -> list[sqlite3.Row]:
+        return self.pool.query(
+            """
+            SELECT source, SUM(bookings) AS bookings, SUM(pax) AS pax, SUM(revenue) AS revenue,
+                   SUM(cancelled) AS cancelled
+            FROM _analytics_bookings_daily WHERE day >= ? AND day <= ?
+            GROUP BY source ORDER BY bookings DESC
+            """,
+            (since, until),
+        )
+
+    def daily(self, source: str | None = None, since: str = "", until: str = "9999") -> list[sqlite3.Row]:
+        return self.pool.query(
+            """
+            SELECT day, SUM(bookings) AS bookings, SUM(revenue) AS revenue, SUM(cancelled) AS cancelled
+            FROM _analytics_bookings_daily
+            WHERE day >= ? AND day <= ? AND (? IS NULL OR source = ?)
+            GROUP BY day ORDER BY day
+            """,
+            (since, until, source, source),
+        )
+
+    def cancellations_by_role(self, since: str = "", until: str = "9999") -> list[sqlite3.Row]:
+        return self.pool.query(
+            """
+            SELECT role, SUM(cancellations) AS cancellations, SUM(amount) AS amount
+            FROM _analytics_cancellations WHERE day >= ? AND day <= ?
+            GROUP BY role ORDER BY cancellations DESC
+            """,
+            (since, until),
+        )
+
+    def landing_traffic(self, limit: int = 20) -> list[sqlite3.Row]:
+        return self.pool.query(
+            """
+            SELECT l.slug, l.file, COALESCE(t.visits, 0) AS visits
+            FROM _analytics_landings l LEFT JOIN _analytics_landing_traffic t ON t.slug = l.slug
+            ORDER BY visits DESC, l.slug LIMIT ?
+            """,
+            (limit,),
+        )
+
+    def untracked_traffic(self) -> list[sqlite3.Row]:
+        """Visited slugs that no data/*-landings.ts or *-variants.ts file defines."""
+        return self.pool.query(
+            """
+            SELECT t.slug, t.visits FROM _analytics_landing_traffic t
+            WHERE NOT EXISTS (SELECT 1 FROM _analytics_landings l WHERE l.slug = t.slug)
+            ORDER BY t.visits DESC
+            """
+        )
+
+
+def _table(rows: list[sqlite3.Row], title: str) -> None:
+    print(f"\n{title}")
+    for row in rows:
+        print("  " + "  ".join(f"{key}={row[key]}" for key in row.keys()))
+    if not rows:
+        print("  (none)")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Booking and landing traffic reports from materialized summaries")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("--refresh", action="store_true", help="apply changes since the last refresh first")
+    parser.add_argument("--rebuild", action="store_true", help="drop and rebuild every summary table")
+    parser.add_argument("--since", default="", help="first day (YYYY-MM-DD) to report")
+    parser.add_argument("--until", default="9999", help="last day (YYYY-MM-DD) to report")
+    parser.add_argument("--top", type=int, default=20, help="landings to list by visits")
+    args = parser.parse_args(argv)
+
+    if not args.db.exists():
+        raise SystemExit(f"{args.db} not found")
+    if args.refresh or args.rebuild:
+        with span("transform"):
+            report = refresh(args.db, rebuild=args.rebuild)
+        for name in report.created_indexes:
+            print(f"created index {name}")
+        for table in report.missing_tables:
+            print(f"no {table} table in {args.db}, skipped")
+        print(
+            f"refreshed {report.bookings} bookings ({report.deleted} deleted), {report.traffic} traffic rows, "
+            f"{report.landings} landing slugs in {report.seconds:.3f}s"
+        )
+
+    pool = ReadPool(args.db, size=1)
+    try:
+        analytics = Analytics(pool)
+        started = time.perf_counter()
+        _table(analytics.bookings_by_source(args.since, args.until), "Bookings by source")
+        _table(analytics.cancellations_by_role(args.since, args.until), "Cancellations by role")
+        _table(analytics.landing_traffic(args.top), f"Top {args.top} landings by visits")
+        _table(analytics.untracked_traffic()[: args.top], "Visited slugs without a landing entry")
+        print(f"\nqueries took {(time.perf_counter() - started) * 1000:.1f}ms")
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -1,23 +1,30 @@
-import re
-from collections import Counter
-from pathlib import Path
+import argparse
 
+from content_cli import run_tool, span
+from generate_transfer_landings import SEED_PATH, load_hotel_directory
+from hotel_dedup import find_clusters
 
-def extract_hotel_names(name: str) -> list[str]:
-    text = Path("scripts/seed-transfer-hotels.ts").read_text()
-    start = text.split(f"const {name} = ")[1]
-    block = start[: start.index("};", start.index("{")) + 1]
-    return re.findall(r"\"([^\\\"]+)\"", block)
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Detecta hoteles duplicados o casi duplicados por zona")
+    parser.add_argument("--threshold", type=float, default=0.7, help="similitud minima de trigramas")
+    args = parser.parse_args()
 
-directory_names = extract_hotel_names("directory")
-extra_directory_names = extract_hotel_names("extraDirectory")
+    zones = load_hotel_directory(SEED_PATH)
+    all_names = [name for names in zones.values() for name in names]
+    with span("transform"):
+        report = find_clusters(zones, threshold=args.threshold)
+    cluster_count = sum(len(clusters) for clusters in report.values())
 
-all_names = directory_names + extra_directory_names
-normalized = [name.lower() for name in all_names]
-duplicates = [name for name, count in Counter(normalized).items() if count > 1]
+    print(f"Total hoteles cargados: {len(all_names)}")
+    print(f"Grupos de duplicados detectados: {cluster_count}")
+    for group, clusters in sorted(report.items()):
+        print(f"\n{group}")
+        for hotels, matches in clusters:
+            print("  - " + " | ".join(f"{hotel.name} ({hotel.zone})" for hotel in hotels))
+            for match in matches:
+                print(f"      {match.reason} {match.score:.2f}: {match.left.name} ~ {match.right.name}")
 
-print(f"Total hoteles cargados: {len(all_names)}")
-print(f"Duplicados detectados: {len(duplicates)}")
-if duplicates:
-    print("Ejemplos de duplicados:", duplicates[:10])
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,238 @@
+"""Cross-locale consistency check for messages/*.json.
+
+Each catalog is read once with a small streaming tokenizer (fixed-size
+chunks, so memory is bounded by the longest string rather than the file);
+nested objects are flattened to dotted keys. Per key only the placeholder
+signature and a hash of the text are kept, which is enough to
+report, against the reference locale:
+
+  * missing keys      - in the reference catalog but not in this locale
+  * extra keys        - in this locale but not in the reference catalog
+  * placeholders      - {hotel}/{count, plural, ...}/${price} sets differ
+  * untranslated      - text identical to another locale's copy
+  * duplicate keys    - a key defined twice in one file
+
+Usage:
+    python scripts/check_locales.py [--messages-dir messages] [--reference es] [--json report.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from content_cli import run_tool, span, write_text
+from i18n_patch import MESSAGES_DIR
+
+CHUNK_SIZE = 1 << 16
+TOKEN = re.compile(r'\s*+(?:(?P<string>"(?:[^"\\]++|\\.)*+")|(?P<punct>[{}\[\],:])|(?P<literal>[^\s{}\[\],:"]++))')
+PLACEHOLDER = re.compile(r"(\$?)\{\s*([A-Za-z_][\w.]*)")
+LETTERS = re.compile(r"[^\W\d_]{3}")
+
+
+def iter_tokens(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, str]]:
+    """Tokens of a JSON file, read in fixed-size chunks.
+
+    Only the text after the last complete token is carried into the next
+    chunk, so a minified (single-line) catalog is not read whole either.
+    """
+    with path.open(encoding="utf-8") as handle:
+        carry = ""
+        first = True
+        while True:
+            chunk = handle.read(chunk_size)
+            if first:
+                chunk, first = chunk.lstrip("\ufeff"), False
+            buffer = carry + chunk
+            position = 0
+            partial = False
+            for match in TOKEN.finditer(buffer):
+                if match.start() != position:
+                    break
+                if chunk and match.lastgroup == "literal" and match.end() == len(buffer):
+                    # `tru` or `12` may continue in the next chunk.
+                    partial = True
+                    break
+                position = match.end()
+                yield match.lastgroup, match[match.lastgroup]
+            carry = buffer[position:]
+            rest = carry.lstrip()
+            # Mid-file, only a cut literal or an unterminated string may be left over.
+            if rest and not (chunk and (partial or rest.startswith('"'))):
+                raise ValueError(f"{path}: unexpected text near {rest[:40]!r}")
+            if not chunk:
+                return
+
+
+def _decode(kind: str, token: str) -> object:
+    if kind == "string" and "\\" not in token:
+        return token[1:-1]
+    return json.loads(token)
+
+
+def iter_messages(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, object]]:
+    """Yield (dotted key, value) leaves of a JSON catalog without loading it whole."""
+    stack: list[list] = []  # [kind, prefix, pending key or next index]
+    expecting_key = False
+    for kind, token in iter_tokens(path, chunk_size):
+        if kind == "punct" and token in "{[":
+            prefix = _leaf_key(stack)
+            stack.append(["object" if token == "{" else "array", prefix, None if token == "{" else 0])
+            expecting_key = token == "{"
+            continue
+        if kind == "punct" and token in "}]":
+            stack.pop()
+            _advance(stack)
+            continue
+        if kind == "punct":
+            expecting_key = token == "," and bool(stack) and stack[-1][0] == "object"
+            continue
+        if not stack:
+            raise ValueError(f"{path}: top level must be an object")
+        if expecting_key:
+            stack[-1][2] = _decode(kind, token)
+            expecting_key = False
+            continue
+        value = _decode(kind, token)
+        yield _leaf_key(stack), value
+        _advance(stack)
+
+
+def _leaf_key(stack: list[list]) -> str:
+    if not stack:
+        return ""
+    kind, prefix, slot = stack[-1]
+    return f"{prefix}.{slot}" if prefix else str(slot)
+
+
+def _advance(stack: list[list]) -> None:
+    if stack and stack[-1][0] == "array":
+        stack[-1][2] += 1
+
+
+def placeholders(value: object) -> tuple[str, ...]:
+    if not isinstance(value, str) or "{" not in value:
+        return ()
+    return tuple(sorted(dollar + name for dollar, name in PLACEHOLDER.findall(value)))
+
+
+def text_hash(value: object) -> int | None:
+    """Hash of translatable text (only compared within one run); None if it cannot be 'untranslated'."""
+    if not isinstance(value, str):
+        return None
+    text = " ".join(value.split())
+    if "{" in text:
+        text = PLACEHOLDER.sub("", text)
+    if not LETTERS.search(text):
+        return None
+    return hash(text.casefold())
+
+
+@dataclass
+class LocaleCatalog:
+    locale: str
+    signatures: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    hashes: dict[str, int | None] = field(default_factory=dict)
+    duplicates: list[str] = field(default_factory=list)
+
+
+def read_catalog(path: Path, chunk_size: int = CHUNK_SIZE) -> LocaleCatalog:
+    catalog = LocaleCatalog(path.stem)
+    for key, value in iter_messages(path, chunk_size):
+        if key in catalog.signatures:
+            catalog.duplicates.append(key)
+        catalog.signatures[key] = placeholders(value)
+        catalog.hashes[key] = text_hash(value)
+    return catalog
+
+
+@dataclass
+class LocaleIssues:
+    missing: list[str] = field(default_factory=list)
+    extra: list[str] = field(default_factory=list)
+    placeholders: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+    untranslated: dict[str, str] = field(default_factory=dict)
+    duplicates: list[str] = field(default_factory=list)
+
+    def count(self) -> int:
+        return len(self.missing) + len(self.extra) + len(self.placeholders) + len(self.duplicates)
+
+
+def check(catalogs: dict[str, LocaleCatalog], reference: str) -> dict[str, LocaleIssues]:
+    base = catalogs[reference]
+    issues: dict[str, LocaleIssues] = {}
+    for locale, catalog in catalogs.items():
+        found = issues[locale] = LocaleIssues(duplicates=catalog.duplicates)
+        if locale == reference:
+            continue
+        found.missing = [key for key in base.signatures if key not in catalog.signatures]
+        found.extra = [key for key in catalog.signatures if key not in base.signatures]
+        for key, signature in catalog.signatures.items():
+            expected = base.signatures.get(key)
+            if expected is not None and expected != signature:
+                found.placeholders[key] = {"expected": list(expected), "found": list(signature)}
+    # A copy shared with another locale is reported on every locale except the reference.
+    for locale, catalog in catalogs.items():
+        if locale == reference:
+            continue
+        for key, text_key in catalog.hashes.items():
+            if text_key is None:
+                continue
+            same = [other for other, theirs in catalogs.items() if other != locale and theirs.hashes.get(key) == text_key]
+            if same:
+                issues[locale].untranslated[key] = ", ".join(same)
+    return issues
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Check messages/*.json locales against each other")
+    parser.add_argument("--messages-dir", type=Path, default=MESSAGES_DIR)
+    parser.add_argument("--reference", default="es", help="locale whose key set is authoritative")
+    parser.add_argument("--json", type=Path, help="write the full report to this file")
+    parser.add_argument("--limit", type=int, default=10, help="examples printed per section")
+    parser.add_argument("--strict", action="store_true", help="also fail on untranslated copies")
+    args = parser.parse_args(argv)
+
+    paths = sorted(args.messages_dir.glob("*.json"))
+    catalogs = {}
+    for path in paths:
+        # Reading and tokenizing are interleaved chunk by chunk, so both count as parse.
+        with span("parse", path.stat().st_size):
+            catalogs[path.stem] = read_catalog(path)
+    if args.reference not in catalogs:
+        raise SystemExit(f"No catalog for reference locale {args.reference!r} in {args.messages_dir}")
+    with span("transform"):
+        issues = check(catalogs, args.reference)
+
+    for locale, found in issues.items():
+        print(
+            f"{locale}: {len(catalogs[locale].signatures)} keys, {len(found.missing)} missing, {len(found.extra)} extra, "
+            f"{len(found.placeholders)} placeholder mismatches, {len(found.untranslated)} untranslated, "
+            f"{len(found.duplicates)} duplicates"
+        )
+        for key in found.missing[: args.limit]:
+            print(f"  missing {key}")
+        for key in found.extra[: args.limit]:
+            print(f"  extra {key}")
+        for key, signatures in list(found.placeholders.items())[: args.limit]:
+            print(f"  placeholders {key}: expected {signatures['expected']} found {signatures['found']}")
+        for key, others in list(found.untranslated.items())[: args.limit]:
+            print(f"  untranslated {key} (same as {others})")
+        for key in found.duplicates[: args.limit]:
+            print(f"  duplicate {key}")
+
+    if args.json:
+        report = {locale: vars(found) for locale, found in issues.items()}
+        write_text(args.json, json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+    failed = any(found.count() for found in issues.values())
+    failed = failed or (args.strict and any(found.untranslated for found in issues.values()))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,274 @@
+"""Shared entry point, phase timing and profiling for the Python content tools.
+
+Every tool ends with `run_tool(main)` instead of calling `main()` directly.
+The wrapper strips its own options before the tool's argparse sees argv:
+
+    --profile cprofile|sample   cProfile (.pstats + top functions on stderr) or a
+                                stack sampler writing collapsed stacks (.folded,
+                                flamegraph.pl / speedscope input)
+    --profile-output PATH       where to write the profile
+                                (default .cache/content-tools/profiles/)
+    --timings                   print a per-phase table on stderr
+    --no-runs-log               don't append the summary to the runs log
+
+Library code marks its phases with `span("read" | "parse" | "transform" |
+"write", nbytes)`. Spans are exclusive: a nested span pauses its parent, so
+phase totals never double count. Spans opened in worker processes can be
+shipped back with `snapshot()` / `merge()`.
+
+After every run one line is written to stderr and appended to
+.cache/content-tools/runs.jsonl:
+
+    content-tool-summary {"tool": "check_locales", "exit": 0, "seconds": 0.41,
+        "phases": {"read": {"seconds": 0.02, "bytes": 1843200, "calls": 3}, ...}, ...}
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+RUNS_LOG = Path(".cache/content-tools/runs.jsonl")
+PROFILE_DIR = Path(".cache/content-tools/profiles")
+SUMMARY_PREFIX = "content-tool-summary"
+PHASES = ("read", "parse", "transform", "write")
+
+
+@dataclass
+class PhaseStats:
+    seconds: float = 0.0
+    bytes: int = 0
+    calls: int = 0
+
+
+class Span:
+    def __init__(self, phase: str, nbytes: int) -> None:
+        self.phase = phase
+        self.bytes = nbytes
+        self.elapsed = 0.0
+        self.resumed = time.perf_counter()
+
+    def add(self, nbytes: int) -> None:
+        self.bytes += nbytes
+
+
+class PhaseTimer:
+    """Process-wide phase totals; each thread keeps its own stack of open spans."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def _stack(self) -> list[Span]:
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    @contextmanager
+    def span(self, phase: str, nbytes: int = 0) -> Iterator[Span]:
+        stack = self._stack()
+        now = time.perf_counter()
+        if stack:
+            stack[-1].elapsed += now - stack[-1].resumed
+        current = Span(phase, nbytes)
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            now = time.perf_counter()
+            current.elapsed += now - current.resumed
+            stack.pop()
+            if stack:
+                stack[-1].resumed = now
+            with self.lock:
+                stats = self.phases.setdefault(phase, PhaseStats())
+                stats.seconds += current.elapsed
+                stats.bytes += current.bytes
+                stats.calls += 1
+
+    def snapshot(self) -> dict[str, dict]:
+        with self.lock:
+            return {phase: asdict(stats) for phase, stats in self.phases.items()}
+
+    def merge(self, snapshot: dict[str, dict]) -> None:
+        with self.lock:
+            for phase, values in snapshot.items():
+                stats = self.phases.setdefault(phase, PhaseStats())
+                stats.seconds += values["seconds"]
+                stats.bytes += values["bytes"]
+                stats.calls += values["calls"]
+
+    def reset(self) -> None:
+        with self.lock:
+            self.phases = {}
+
+
+TIMER = PhaseTimer()
+span = TIMER.span
+snapshot = TIMER.snapshot
+merge = TIMER.merge
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size of this process (ru_maxrss); None where `resource` is missing."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def read_text(path: Path, errors: str = "strict") -> str:
+    """`path.read_text()` as a read span sized by the file."""
+    with span("read", path.stat().st_size):
+        return path.read_text(encoding="utf-8", errors=errors)
+
+
+def write_text(path: Path, text: str) -> None:
+    with span("write", len(text)):
+        path.write_text(text, encoding="utf-8")
+
+
+class StackSampler:
+    """Samples the main thread's stack every `interval` seconds from a daemon thread."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self.target = threading.main_thread().ident
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="content-cli-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> "StackSampler":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stopped.set()
+        self.thread.join()
+
+    def write(self, path: Path) -> None:
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in self.samples.most_common()), encoding="utf-8")
+
+
+def _profile_path(tool: str, kind: str, requested: Path | None) -> Path:
+    if requested:
+        path = requested
+    else:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = PROFILE_DIR / f"{tool}-{stamp}.{'pstats' if kind == 'cprofile' else 'folded'}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def format_timings(phases: dict[str, dict], total: float) -> str:
+    lines = [f"{'phase':<10} {'seconds':>9} {'share':>6} {'MB':>9} {'MB/s':>8} {'calls':>7}"]
+    ordered = [phase for phase in PHASES if phase in phases] + sorted(set(phases) - set(PHASES))
+    for phase in ordered:
+        stats = phases[phase]
+        megabytes = stats["bytes"] / 1_000_000
+        rate = megabytes / stats["seconds"] if stats["seconds"] and stats["bytes"] else 0.0
+        share = stats["seconds"] / total * 100 if total else 0.0
+        lines.append(
+            f"{phase:<10} {stats['seconds']:>9.4f} {share:>5.1f}% {megabytes:>9.3f} {rate:>8.1f} {stats['calls']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def run_tool(main: Callable[[], object], tool: str | None = None) -> None:
+    tool = tool or Path(sys.argv[0]).stem
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--profile", choices=("cprofile", "sample"))
+    parser.add_argument("--profile-output", type=Path)
+    parser.add_argument("--sample-interval", type=float, default=0.005)
+    parser.add_argument("--timings", action="store_true")
+    parser.add_argument("--no-runs-log", action="store_true")
+    options, rest = parser.parse_known_args(sys.argv[1:])
+    sys.argv[1:] = rest
+
+    TIMER.reset()
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    profiler = cProfile.Profile() if options.profile == "cprofile" else None
+    sampler = StackSampler(options.sample_interval) if options.profile == "sample" else None
+    exit_code: int | str = 0
+    try:
+        if profiler:
+            profiler.enable()
+        if sampler:
+            sampler.__enter__()
+        main()
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        raise
+    except BaseException as exc:
+        exit_code = type(exc).__name__
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+        if sampler:
+            sampler.__exit__(None, None, None)
+        seconds = time.perf_counter() - started
+        phases = TIMER.snapshot()
+        summary = {
+            "tool": tool,
+            "argv": rest,
+            "exit": exit_code,
+            "startedAt": started_at,
+            "seconds": round(seconds, 6),
+            "cpu_seconds": round(time.process_time() - cpu_started, 6),
+            "peak_rss_kb": peak_rss_kb(),
+            "untracked_seconds": round(max(0.0, seconds - sum(stats["seconds"] for stats in phases.values())), 6),
+            "phases": {phase: {**stats, "seconds": round(stats["seconds"], 6)} for phase, stats in phases.items()},
+        }
+        if profiler:
+            path = _profile_path(tool, "cprofile", options.profile_output)
+            profiler.dump_stats(path)
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(20)
+            print(buffer.getvalue(), file=sys.stderr)
+            summary["profile"] = path.as_posix()
+        if sampler:
+            path = _profile_path(tool, "sample", options.profile_output)
+            sampler.write(path)
+            summary["profile"] = path.as_posix()
+        if options.timings:
+            print(format_timings(phases, seconds), file=sys.stderr)
+        line = json.dumps(summary, separators=(",", ":"))
+        print(f"{SUMMARY_PREFIX} {line}", file=sys.stderr)
+        if not options.no_runs_log:
+            try:
+                RUNS_LOG.parent.mkdir(parents=True, exist_ok=True)
+                with RUNS_LOG.open("a", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+            except OSError:
+                pass
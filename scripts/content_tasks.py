@@ -0,0 +1,372 @@
+"""Incremental runner for the Python content jobs.
+
+Each job declares its command, input globs and output paths. A job runs
+after the jobs that produce its inputs (or write the same outputs, in
+declaration order), independent jobs run in parallel, and a job is skipped
+when the hash of its inputs, its own script (plus every scripts/*.py it
+imports, transitively) and its command matches the
+last successful run recorded in .cache/content-tools/tasks.json and its
+outputs still exist. File hashes are reused while mtime and size are
+unchanged, so an up-to-date refresh only stats files.
+
+Jobs marked opt-in (bulk writers and one-off patches) only run when named.
+Jobs whose database or third-party modules (scripts/requirements.txt) are
+not available are reported as missing rather than failed.
+
+Usage:
+    python scripts/content_tasks.py [JOB ...] [--list] [--force] [--dry-run] [-j 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from content_cli import run_tool
+
+ROOT = Path(".")
+CACHE_PATH = Path(".cache/content-tools/tasks.json")
+CACHE_VERSION = 2
+SCRIPTS_DIR = Path("scripts")
+
+MESSAGES = ("messages/*.json",)
+LANDINGS = ("data/*-landings.ts", "data/*-variants.ts")
+SOURCES = ("app/**/*.ts", "app/**/*.tsx", "components/**/*.tsx", "components/**/*.ts", "lib/**/*.ts", "context/**/*.tsx")
+MESSAGE_FILES = ("messages/es.json", "messages/en.json", "messages/fr.json")
+
+
+@dataclass
+class Job:
+    name: str
+    command: tuple[str, ...]
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...] = ()
+    requires: tuple[str, ...] = ()
+    modules: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+    default: bool = True
+
+    @property
+    def script(self) -> str:
+        return self.command[0]
+
+
+JOBS = [
+    Job("things-to-do-messages", ("scripts/update_things_to_do_messages.py",), MESSAGES, MESSAGE_FILES, default=False),
+    Job("things-to-do-meta", ("scripts/append_things_to_do_meta.py",), MESSAGES, MESSAGE_FILES, default=False),
+    Job("notfound-messages", ("scripts/update_notfound_messages.py",), MESSAGES, MESSAGE_FILES, default=False),
+    Job("transfer-messages", ("scripts/append_transfer_i18n.py",), MESSAGES, MESSAGE_FILES, default=False),
+    Job("check-locales", ("scripts/check_locales.py",), MESSAGES),
+    Job(
+        "message-shards",
+        ("scripts/message_shards.py",),
+        MESSAGES + SOURCES,
+        (".cache/content-tools/message-shards/manifest.json",),
+    ),
+    Job(
+        "transfer-landings",
+        ("scripts/generate_transfer_landings.py",),
+        ("scripts/seed-transfer-hotels.ts",) + LANDINGS,
+        ("data/transfer-landings.ts",),
+        default=False,
+    ),
+    Job(
+        "missing-transfer-landings",
+        ("scripts/add_missing_transfer_landings.py",),
+        LANDINGS,
+        ("data/transfer-landings.ts",),
+        default=False,
+    ),
+    Job(
+        "landing-index",
+        ("scripts/landing_index.py", "--duplicates"),
+        LANDINGS,
+        (".cache/content-tools/landing-index.json",),
+    ),
+    Job("compare-landings", ("compare_landings.py",), LANDINGS, after=("landing-index",)),
+    Job(
+        "link-check",
+        ("scripts/link_check.py", "--json", ".cache/content-tools/link-check.json"),
+        LANDINGS + ("data/discovered-not-indexed-urls.ts",),
+        (".cache/content-tools/link-check.json",),
+        after=("landing-index",),
+    ),
+    Job(
+        "keyword-coverage",
+        ("scripts/keyword_coverage.py", "sosua_party_boat_keywords.csv", "--source",
+         "components/public/SosuaPartyBoatAliasPage.tsx", "--json", ".cache/content-tools/keyword-coverage.json"),
+        LANDINGS + ("sosua_party_boat_keywords.csv", "components/public/SosuaPartyBoatAliasPage.tsx"),
+        (".cache/content-tools/keyword-coverage.json",),
+    ),
+    Job("hotel-duplicates", ("scripts/check-transfer-duplicates.py",), ("scripts/seed-transfer-hotels.ts",)),
+    Job(
+        "transfer-prices",
+        ("scripts/transfer_price_matrix.py",),
+        ("data/traslado-pricing.ts", "prisma/dev.db"),
+        (".cache/content-tools/transfer-prices.npz",),
+        modules=("numpy",),
+    ),
+    Job(
+        "merchant-feed",
+        ("scripts/merchant_feed.py",),
+        ("prisma/dev.db",),
+        ("public/merchant-center/products.tsv", "merchant_center_feed.tsv"),
+        requires=("prisma/dev.db",),
+    ),
+    Job(
+        "booking-analytics",
+        ("scripts/booking_analytics.py", "--refresh"),
+        ("prisma/dev.db",) + LANDINGS,
+        requires=("prisma/dev.db",),
+        after=("landing-index",),
+    ),
+    Job(
+        "image-derivatives",
+        ("scripts/image_derivatives.py", "--prune"),
+        ("public/**/*.png", "public/**/*.jpg", "public/**/*.jpeg", "data/*.ts"),
+        ("public/optimized/manifest.json",),
+        modules=("PIL",),
+        default=False,
+    ),
+    Job("booking-columns", ("scripts/add_booking_columns.py",), ("prisma/schema.prisma", "prisma/dev.db"),
+        requires=("prisma/dev.db",), default=False),
+    Job("replace-footer", ("replace_footer.py",), ("app/(public)/layout.tsx",), ("app/(public)/layout.tsx",), default=False),
+]
+
+
+def expand(patterns: Iterable[str], root: Path) -> list[Path]:
+    found: set[Path] = set()
+    for pattern in patterns:
+        if any(char in pattern for char in "*?["):
+            found.update(path for path in root.glob(pattern) if path.is_file())
+        elif (root / pattern).is_file():
+            found.add(root / pattern)
+    return sorted(found)
+
+
+def _covers(pattern: str, path: str) -> bool:
+    return Path(path).match(pattern) if any(char in pattern for char in "*?[") else pattern == path
+
+
+def build_graph(jobs: list[Job]) -> dict[str, set[str]]:
+    """job -> jobs it waits for: named `after`, producers of its inputs, earlier writers of its outputs."""
+    graph: dict[str, set[str]] = {job.name: set(job.after) for job in jobs}
+    for position, job in enumerate(jobs):
+        for other in jobs:
+            if other is job:
+                continue
+            feeds = any(_covers(pattern, output) for output in other.outputs for pattern in job.inputs)
+            shares = set(other.outputs) & set(job.outputs) and jobs.index(other) < position
+            # A writer whose output is also its own input must not wait on readers of that file.
+            if shares or (feeds and not set(other.outputs) & set(job.outputs)):
+                graph[job.name].add(other.name)
+    return graph
+
+
+def imported_modules(source: str) -> list[str]:
+    """Top-level module names a Python file imports (relative imports are not used in scripts/)."""
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".", 1)[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".", 1)[0])
+    return sorted(names)
+
+
+class HashCache:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.files: dict[str, list] = {}
+        self.imports: dict[str, list] = {}
+        self.jobs: dict[str, str] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                self.files, self.imports, self.jobs = data["files"], data["imports"], data["jobs"]
+
+    def file_digest(self, path: Path) -> str:
+        stat = path.stat()
+        key = path.as_posix()
+        cached = self.files.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        self.files[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def script_closure(self, script: Path, root: Path) -> list[Path]:
+        """The script plus every sibling or scripts/*.py module it imports, transitively."""
+        seen: set[Path] = set()
+        stack = [script]
+        while stack:
+            path = stack.pop()
+            if path in seen or not path.is_file():
+                continue
+            seen.add(path)
+            digest = self.file_digest(path)
+            cached = self.imports.get(path.as_posix())
+            if not cached or cached[0] != digest:
+                cached = self.imports[path.as_posix()] = [digest, imported_modules(path.read_text(encoding="utf-8"))]
+            for name in cached[1]:
+                for folder in (path.parent, root / SCRIPTS_DIR):
+                    if (folder / f"{name}.py").is_file():
+                        stack.append(folder / f"{name}.py")
+                        break
+        return sorted(seen)
+
+    def job_key(self, job: Job, root: Path) -> str:
+        hasher = hashlib.sha1(json.dumps(job.command).encode("utf-8"))
+        scripts = [path.relative_to(root).as_posix() for path in self.script_closure(root / job.script, root)]
+        for path in expand(job.inputs + tuple(scripts), root):
+            hasher.update(f"{path.as_posix()}\0{self.file_digest(path)}\n".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": self.files, "imports": self.imports, "jobs": self.jobs}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+@dataclass
+class Outcome:
+    job: Job
+    status: str
+    seconds: float = 0.0
+    output: str = ""
+    key: str | None = None
+
+
+@dataclass
+class Runner:
+    jobs: list[Job]
+    root: Path = ROOT
+    cache: HashCache = field(default_factory=lambda: HashCache(CACHE_PATH))
+    force: bool = False
+    dry_run: bool = False
+
+    def up_to_date(self, job: Job, key: str) -> bool:
+        outputs_present = all((self.root / output).exists() for output in job.outputs)
+        return not self.force and self.cache.jobs.get(job.name) == key and outputs_present
+
+    def execute(self, job: Job) -> Outcome:
+        missing = [path for path in job.requires if not (self.root / path).exists()]
+        if missing:
+            return Outcome(job, "missing", output=f"requires {', '.join(missing)}")
+        absent = [name for name in job.modules if importlib.util.find_spec(name) is None]
+        if absent:
+            return Outcome(job, "missing", output=f"needs {', '.join(absent)} (pip install -r scripts/requirements.txt)")
+        key = self.cache.job_key(job, self.root)
+        if self.up_to_date(job, key):
+            return Outcome(job, "cached")
+        if self.dry_run:
+            return Outcome(job, "would run")
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, *job.command], cwd=self.root, capture_output=True, text=True, encoding="utf-8"
+        )
+        elapsed = time.perf_counter() - started
+        if completed.returncode:
+            return Outcome(job, "failed", elapsed, completed.stdout + completed.stderr)
+        # Hash again after the run: jobs that rewrite their own inputs are then up to date next time.
+        return Outcome(job, "ran", elapsed, completed.stdout, self.cache.job_key(job, self.root))
+
+    def run(self, workers: int) -> list[Outcome]:
+        graph = build_graph(self.jobs)
+        selected = {job.name for job in self.jobs}
+        pending = {job.name: job for job in self.jobs}
+        waits = {name: deps & selected for name, deps in graph.items() if name in selected}
+        done: dict[str, Outcome] = {}
+        running: dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            while pending or running:
+                for name in [name for name in pending if waits[name] <= done.keys()]:
+                    job = pending.pop(name)
+                    if any(done[dep].status in ("failed", "blocked") for dep in waits[name]):
+                        done[name] = Outcome(job, "blocked")
+                        continue
+                    running[pool.submit(self.execute, job)] = name
+                if not running:
+                    if pending:
+                        raise RuntimeError(f"dependency cycle between {', '.join(sorted(pending))}")
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    outcome = future.result()
+                    done[running.pop(future)] = outcome
+                    if outcome.key:
+                        self.cache.jobs[outcome.job.name] = outcome.key
+                    report(outcome)
+        if not self.dry_run:
+            self.cache.save()
+        return [done[job.name] for job in self.jobs]
+
+
+def report(outcome: Outcome) -> None:
+    timing = f" {outcome.seconds:.2f}s" if outcome.seconds else ""
+    print(f"[{outcome.status}] {outcome.job.name}{timing}", flush=True)
+    if outcome.status == "failed" or (outcome.status == "missing" and outcome.output):
+        for line in outcome.output.strip().splitlines()[-15:]:
+            print(f"    {line}")
+
+
+def select(names: list[str]) -> list[Job]:
+    by_name = {job.name: job for job in JOBS}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise SystemExit(f"Unknown jobs: {', '.join(unknown)} (see --list)")
+    if not names:
+        return [job for job in JOBS if job.default]
+    wanted = set(names)
+    graph = build_graph(JOBS)
+    # Pull in what the named jobs wait for (default jobs only, opt-in writers stay opt-in).
+    stack = list(wanted)
+    while stack:
+        for dep in graph[stack.pop()]:
+            if dep not in wanted and by_name[dep].default:
+                wanted.add(dep)
+                stack.append(dep)
+    return [job for job in JOBS if job.name in wanted]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run content jobs whose inputs changed")
+    parser.add_argument("jobs", nargs="*", help="jobs to run (default: every non opt-in job)")
+    parser.add_argument("--list", action="store_true", help="show jobs, dependencies and cache state")
+    parser.add_argument("--force", action="store_true", help="ignore the cache")
+    parser.add_argument("--dry-run", action="store_true", help="report what would run")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args(argv)
+
+    if args.list:
+        cache = HashCache(CACHE_PATH)
+        graph = build_graph(JOBS)
+        for job in JOBS:
+            state = "cached" if cache.jobs.get(job.name) == cache.job_key(job, ROOT) else "stale"
+            flags = "" if job.default else " (opt-in)"
+            deps = f" <- {', '.join(sorted(graph[job.name]))}" if graph[job.name] else ""
+            print(f"{job.name:28} {state:7}{flags}{deps}")
+        return
+
+    outcomes = Runner(select(args.jobs), force=args.force, dry_run=args.dry_run).run(args.workers)
+    counts: dict[str, int] = {}
+    for outcome in outcomes:
+        counts[outcome.status] = counts.get(outcome.status, 0) + 1
+    print(", ".join(f"{count} {status}" for status, count in counts.items()))
+    sys.exit(1 if counts.get("failed") or counts.get("blocked") else 0)
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,335 @@
+"""Bulk generator for airport <-> hotel transfer landings.
+
+Hotels and zones come from the `directory` / `extraDirectory` objects in
+scripts/seed-transfer-hotels.ts. For every airport serving a hotel's zone one
+airport-to-hotel entry is rendered; its `reverseSlug` (hotel-to-airport) is
+served from the same entry by TransferLandingPage, so no separate reverse
+entry is written. `priceFrom` is the cheapest rate between the airport's and
+the hotel's zone in data/traslado-pricing.ts, resolved like
+getTransferPrice(). Entries are streamed into the target TS file in chunks,
+right after its last existing entry. Pairs whose forward or reverse slug is
+already a landingSlug or reverseSlug in the landing index are skipped.
+
+Usage:
+    python scripts/generate_transfer_landings.py [--airport PUJ ...] [--zone ZONA_PC_BAVARO ...]
+        [--target data/transfer-landings.ts] [--chunk-size 500] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from content_cli import read_text, run_tool, span
+from landing_index import LandingIndex
+from slugs import slugify, strip_accents
+from ts_literals import parse_declarations
+
+SEED_PATH = Path("scripts/seed-transfer-hotels.ts")
+TARGET_PATH = Path("data/transfer-landings.ts")
+PRICING_PATH = Path("data/traslado-pricing.ts")
+DEFAULT_ZONE = re.compile(r"DEFAULT_ZONE_ID\s*=\s*\"(\w+)\"")
+DIRECTORY_NAMES = ("directory", "extraDirectory")
+COPY_BLOCK = 1 << 20
+
+
+@dataclass(frozen=True)
+class Airport:
+    code: str
+    slug: str
+    name: str
+    node: str
+    zones: tuple[str, ...]
+
+
+AIRPORTS = {
+    airport.code: airport
+    for airport in (
+        Airport(
+            "PUJ",
+            "punta-cana-international-airport",
+            "Punta Cana International Airport",
+            "PUJ_BAVARO",
+            ("ZONA_PC_BAVARO", "ZONA_UVERO_ALTO_MICHES", "ZONA_ROMANA_BAYAHIBE", "ZONA_PC_BAVARO_EXTRA",
+             "ZONA_ROMANA_BAYAHIBE_EXTRA", "ZONA_MICHES_SABANA_EXTRA"),
+        ),
+        Airport(
+            "SDQ",
+            "las-americas-international-airport",
+            "Las Americas International Airport",
+            "SANTO_DOMINGO",
+            ("ZONA_SANTO_DOMINGO", "ZONA_SANTO_DOMINGO_EXTRA"),
+        ),
+        Airport(
+            "LRM",
+            "la-romana-international-airport",
+            "La Romana International Airport",
+            "ROMANA_BAYAHIBE",
+            ("ZONA_ROMANA_BAYAHIBE", "ZONA_ROMANA_BAYAHIBE_EXTRA"),
+        ),
+        Airport(
+            "AZS",
+            "samana-el-catey-international-airport",
+            "Samana El Catey International Airport",
+            "SAMANA",
+            ("ZONA_SAMANA", "ZONA_SAMANA_EXTRA"),
+        ),
+        Airport(
+            "POP",
+            "puerto-plata-international-airport",
+            "Puerto Plata International Airport",
+            "NORTE_CIBAO",
+            ("ZONA_PUERTO_PLATA_STI", "ZONA_NORTE_EXTRA"),
+        ),
+        Airport(
+            "STI",
+            "cibao-international-airport",
+            "Cibao International Airport",
+            "NORTE_CIBAO",
+            ("ZONA_PUERTO_PLATA_STI", "ZONA_NORTE_EXTRA"),
+        ),
+    )
+}
+
+# Seed directory zone -> trasladoPricing node.
+PRICING_NODES = {
+    "ZONA_PC_BAVARO": "PUJ_BAVARO",
+    "ZONA_PC_BAVARO_EXTRA": "PUJ_BAVARO",
+    "ZONA_UVERO_ALTO_MICHES": "UVERO_MICHES",
+    "ZONA_MICHES_SABANA_EXTRA": "UVERO_MICHES",
+    "ZONA_ROMANA_BAYAHIBE": "ROMANA_BAYAHIBE",
+    "ZONA_ROMANA_BAYAHIBE_EXTRA": "ROMANA_BAYAHIBE",
+    "ZONA_SANTO_DOMINGO": "SANTO_DOMINGO",
+    "ZONA_SANTO_DOMINGO_EXTRA": "SANTO_DOMINGO",
+    "ZONA_SAMANA": "SAMANA",
+    "ZONA_SAMANA_EXTRA": "SAMANA",
+    "ZONA_PUERTO_PLATA_STI": "NORTE_CIBAO",
+    "ZONA_NORTE_EXTRA": "NORTE_CIBAO",
+}
+
+# trasladoPricing node -> region named in the long copy (buildLongCopy's regionName).
+REGION_NAMES = {
+    "PUJ_BAVARO": "Punta Cana",
+    "UVERO_MICHES": "Uvero Alto y Miches",
+    "ROMANA_BAYAHIBE": "La Romana y Bayahibe",
+    "SANTO_DOMINGO": "Santo Domingo",
+    "SAMANA": "Samana",
+    "NORTE_CIBAO": "Puerto Plata y Santiago",
+}
+
+ZONE_BLOCK = re.compile(r"(?P<zone>[A-Z0-9_]+)\s*:\s*\[(?P<body>.*?)\]", re.S)
+QUOTED = re.compile(r"\"((?:\\.|[^\"\\])*)\"")
+
+
+def load_hotel_directory(path: Path = SEED_PATH) -> dict[str, list[str]]:
+    """Return {zone: [hotel names]} for directory and extraDirectory in one read."""
+    with span("read", path.stat().st_size):
+        text = path.read_text(encoding="utf-8")
+    with span("parse", len(text)):
+        return _parse_directory(text, path)
+
+
+def _parse_directory(text: str, path: Path) -> dict[str, list[str]]:
+    zones: dict[str, list[str]] = {}
+    for name in DIRECTORY_NAMES:
+        marker = f"const {name} = {{"
+        start = text.find(marker)
+        if start == -1:
+            raise ValueError(f"{path} has no `{marker}` block")
+        end = text.index("\n};", start)
+        for match in ZONE_BLOCK.finditer(text, start + len(marker), end):
+            names = [json.loads(f'"{raw}"') for raw in QUOTED.findall(match.group("body"))]
+            zones.setdefault(match.group("zone"), []).extend(names)
+    return zones
+
+
+class PriceFrom:
+    """Cheapest rate between two trasladoPricing nodes, with getTransferPrice()'s fallbacks."""
+
+    def __init__(self, path: Path = PRICING_PATH) -> None:
+        text = read_text(path)
+        with span("parse", len(text)):
+            nodes = parse_declarations(text)["trasladoPricing"]["nodes"]
+        self.transfers = {node["id"]: node["transfers"] for node in nodes}
+        self.default = DEFAULT_ZONE.search(text).group(1)
+
+    def __call__(self, origin: str, destination: str) -> float:
+        fallback = self.transfers.get(self.default, {})
+        for rates in (
+            self.transfers.get(origin, {}).get(destination),
+            fallback.get(destination),
+            fallback.get(self.default),
+        ):
+            if rates:
+                return min(rates.values())
+        raise ValueError(f"no trasladoPricing rate for {origin} -> {destination}")
+
+    def for_landing(self, landing: Landing) -> float:
+        return self(landing.airport.node, landing.destination_node)
+
+
+@dataclass(frozen=True)
+class Landing:
+    slug: str
+    reverse_slug: str
+    hotel_slug: str
+    hotel_name: str
+    airport: Airport
+    zone: str
+
+    @property
+    def destination_node(self) -> str:
+        return PRICING_NODES.get(self.zone, self.airport.node)
+
+
+def plan_landings(zones: dict[str, list[str]], airports: Iterable[Airport]) -> Iterator[Landing]:
+    for airport in airports:
+        for zone in airport.zones:
+            for hotel_name in zones.get(zone, ()):
+                hotel_slug = slugify(hotel_name)
+                forward = f"{airport.slug}-to-{hotel_slug}"
+                reverse = f"{hotel_slug}-to-{airport.slug}"
+                yield Landing(forward, reverse, hotel_slug, hotel_name, airport, zone)
+
+
+def _ts(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _ts_list(values: list[str]) -> str:
+    return "[" + ", ".join(_ts(value) for value in values) + "]"
+
+
+def _ts_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def render_landing(landing: Landing, price_from: float) -> str:
+    """One forward entry; copy is ASCII like the rest of data/transfer-landings.ts."""
+    hotel = strip_accents(landing.hotel_name)
+    airport = f"{landing.airport.name} ({landing.airport.code})"
+    code = landing.airport.code
+    region = REGION_NAMES.get(landing.destination_node, "Republica Dominicana")
+    hero_title = f"{airport} -> {hotel}"
+    subtitle = f"Traslado privado con chofer bilingue, Wi-Fi y asistencia personalizada hasta {hotel}."
+    image_alt = f"Transporte premium hacia {hotel}"
+    seo_title = f"Transfer privado {code} a {hotel} | Proactivitis"
+    meta = f"Traslado sin esperas desde {airport} hasta {hotel} con confirmacion inmediata, Wi-Fi y chofer bilingue."
+    keywords = [f"{code} {hotel} transfer", f"{hotel} transfer privado", f"transfer {hotel}", f"{hotel} to {code} transfer"]
+    return (
+        "  {\n"
+        f"    landingSlug: {_ts(landing.slug)},\n"
+        f"    reverseSlug: {_ts(landing.reverse_slug)},\n"
+        f"    hotelSlug: {_ts(landing.hotel_slug)},\n"
+        f"    hotelName: {_ts(hotel)},\n"
+        f"    heroTitle: {_ts(hero_title)},\n"
+        f"    heroSubtitle: {_ts(subtitle)},\n"
+        "    heroTagline: \"Servicio premium sin esperas ni filas\",\n"
+        "    heroImage: \"/transfer/mini van.png\",\n"
+        f"    heroImageAlt: {_ts(image_alt)},\n"
+        f"    priceFrom: {_ts_number(price_from)},\n"
+        f"    priceDetails: {_ts_list(['Confirmacion instantanea con chofer asignado', f'60 minutos de espera gratuita en {code}', 'Wi-Fi y agua embotellada durante el trayecto'])},\n"
+        f"    longCopy: buildLongCopy({_ts(hotel)}, {_ts(landing.airport.name)}, {_ts(code)}, {_ts(region)}),\n"
+        "    trustBadges: [\"Servicio privado garantizado\", \"Chofer bilingue | Wi-Fi a bordo\", \"Cancelacion flexible 24h\"],\n"
+        f"    faq: buildFaq({_ts(hotel)}),\n"
+        f"    seoTitle: {_ts(seo_title)},\n"
+        f"    metaDescription: {_ts(meta)},\n"
+        f"    keywords: {_ts_list(keywords)},\n"
+        f"    canonical: {_ts(f'https://proactivitis.com/transfer/{landing.slug}')}\n"
+        "  }"
+    )
+
+
+def select_new(landings: Iterable[Landing], index: LandingIndex) -> Iterator[Landing]:
+    """Drop landings whose forward or reverse page is already served or whose hotel route is covered."""
+    entries = [entry for entries in index.by_slug.values() for entry in entries]
+    taken = set(index.by_slug) | {entry.reverseSlug for entry in entries if entry.reverseSlug}
+    covered = {
+        (entry.slug.removesuffix(f"-to-{entry.hotelSlug}"), entry.hotelSlug)
+        for entry in entries
+        if entry.hotelSlug and entry.slug.endswith(f"-to-{entry.hotelSlug}")
+    }
+    for landing in landings:
+        if landing.slug in taken or landing.reverse_slug in taken:
+            continue
+        if (landing.airport.slug, landing.hotel_slug) in covered:
+            continue
+        taken.update((landing.slug, landing.reverse_slug))
+        yield landing
+
+
+def stream_into(path: Path, anchor: int, blocks: Iterable[str], chunk_size: int = 500) -> int:
+    """Copy `path` to a temp file, writing `blocks` at byte `anchor` in chunks, then swap it in."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    written = 0
+    try:
+        with span("write") as writing, path.open("rb") as src, tmp.open("wb") as dst:
+            remaining = anchor
+            while remaining:
+                data = src.read(min(COPY_BLOCK, remaining))
+                if not data:
+                    break
+                dst.write(data)
+                remaining -= len(data)
+            buffer: list[str] = []
+            for block in blocks:
+                buffer.append(",\n" + block)
+                written += 1
+                if len(buffer) >= chunk_size:
+                    dst.write("".join(buffer).encode("utf-8"))
+                    buffer.clear()
+            if buffer:
+                dst.write("".join(buffer).encode("utf-8"))
+            while data := src.read(COPY_BLOCK):
+                dst.write(data)
+            writing.add(dst.tell())
+        if written:
+            os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return written
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate airport <-> hotel transfer landings in bulk")
+    parser.add_argument("--airport", action="append", choices=sorted(AIRPORTS), help="default: every airport")
+    parser.add_argument("--zone", action="append", help="limit to these directory zones")
+    parser.add_argument("--seed", type=Path, default=SEED_PATH)
+    parser.add_argument("--target", type=Path, default=TARGET_PATH)
+    parser.add_argument("--pricing", type=Path, default=PRICING_PATH)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    zones = load_hotel_directory(args.seed)
+    if args.zone:
+        zones = {zone: names for zone, names in zones.items() if zone in args.zone}
+    airports = [AIRPORTS[code] for code in (args.airport or sorted(AIRPORTS))]
+
+    index = LandingIndex.load()
+    existing = index.entries_in(args.target)
+    if not existing:
+        raise SystemExit(f"{args.target} has no indexed landings to append after")
+    landings = select_new(plan_landings(zones, airports), index)
+    if args.dry_run:
+        with span("transform"):
+            count = sum(1 for _ in landings)
+        print(f"Would add {count} landings to {args.target}")
+        return
+    price_from = PriceFrom(args.pricing)
+    blocks = (render_landing(landing, price_from.for_landing(landing)) for landing in landings)
+    anchor = max(entry.end for entry in existing)
+    written = stream_into(args.target, anchor, blocks, args.chunk_size)
+    if written:
+        index.refresh()
+    print(f"Added {written} landings to {args.target}")
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,181 @@
+"""Near-duplicate detection for hotel names in the transfer hotel directory.
+
+Names are normalized (accents, punctuation, generic suffixes such as
+"Hotel"/"Resort", common abbreviations) and compared only inside their zone
+block. Candidate pairs come from two sub-quadratic sources: MinHash LSH over
+character trigrams (spelling variants) and an inverted index over
+distinctive tokens (word order, extra qualifiers). Each candidate is then
+verified (same tokens, one name plus only places or generic qualifiers such
+as "Punta Cana" or "All Inclusive", or trigram Jaccard over the threshold
+when neither name's tokens contain the other's) and matches are merged into
+clusters with a union-find.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import combinations
+from typing import Iterable
+
+from slugs import strip_accents
+
+STOP_TOKENS = frozenset(
+    {"a", "and", "by", "de", "del", "el", "la", "the", "hotel", "hotels", "resort", "resorts", "spa", "casino"}
+)
+PLACE_TOKENS = frozenset(
+    {"bavaro", "bayahibe", "cabarete", "cana", "cap", "dolio", "domingo", "juan", "miches", "plata", "puerto",
+     "punta", "romana", "samana", "santiago", "santo", "uvero", "alto"}
+)
+# Qualifiers that don't name a different property: "Hotel X All Inclusive" is still "Hotel X".
+GENERIC_TOKENS = frozenset({"all", "inclusive", "adults", "only", "beach", "boutique"})
+ALIASES = {"pc": ("punta", "cana"), "puntacana": ("punta", "cana"), "sd": ("santo", "domingo")}
+ZONE_GROUPS = {"ZONA_NORTE": "ZONA_PUERTO_PLATA_STI", "ZONA_MICHES_SABANA": "ZONA_UVERO_ALTO_MICHES"}
+
+NUM_PERM = 32
+BANDS = 8
+MERSENNE = (1 << 61) - 1
+_PERMUTATIONS = [
+    ((i * 0x9E3779B97F4A7C15 + 1) % MERSENNE, (i * 0xC2B2AE3D27D4EB4F + 7) % MERSENNE) for i in range(1, NUM_PERM + 1)
+]
+
+
+def tokenize(name: str) -> tuple[str, ...]:
+    words = re.findall(r"[a-z0-9]+", strip_accents(name).lower().replace("&", " and ").replace("'", ""))
+    tokens: list[str] = []
+    for word in words:
+        tokens.extend(ALIASES.get(word, (word,)))
+    return tuple(token for token in tokens if token not in STOP_TOKENS)
+
+
+def zone_group(zone: str) -> str:
+    base = zone.removesuffix("_EXTRA")
+    return ZONE_GROUPS.get(base, base)
+
+
+@dataclass(frozen=True)
+class Hotel:
+    name: str
+    zone: str
+    tokens: tuple[str, ...]
+
+    @cached_property
+    def key(self) -> str:
+        return " ".join(sorted(set(self.tokens)))
+
+    @cached_property
+    def trigrams(self) -> frozenset[str]:
+        text = f" {' '.join(self.tokens)} "
+        return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+@dataclass(frozen=True)
+class Match:
+    left: Hotel
+    right: Hotel
+    reason: str
+    score: float
+
+
+_shingle_rows: dict[str, tuple[int, ...]] = {}
+
+
+def _permuted(shingle: str) -> tuple[int, ...]:
+    row = _shingle_rows.get(shingle)
+    if row is None:
+        value = zlib.crc32(shingle.encode())
+        row = _shingle_rows[shingle] = tuple((a * value + b) % MERSENNE for a, b in _PERMUTATIONS)
+    return row
+
+
+def minhash(shingles: Iterable[str]) -> list[int]:
+    """MinHash signature; per-shingle permutations are memoized since names share trigrams."""
+    rows = [_permuted(shingle) for shingle in shingles] or [_permuted("")]
+    return list(map(min, zip(*rows)))
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+class _UnionFind:
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, left: int, right: int) -> None:
+        self.parent[self.find(left)] = self.find(right)
+
+
+def candidate_pairs(hotels: list[Hotel], max_token_block: int = 25) -> set[tuple[int, int]]:
+    pairs: set[tuple[int, int]] = set()
+    rows = NUM_PERM // BANDS
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+    postings: dict[str, list[int]] = defaultdict(list)
+    for position, hotel in enumerate(hotels):
+        signature = minhash(hotel.trigrams)
+        for band in range(BANDS):
+            buckets[(band, tuple(signature[band * rows : (band + 1) * rows]))].append(position)
+        for token in set(hotel.tokens):
+            postings[token].append(position)
+    blocks = list(buckets.values()) + [ids for ids in postings.values() if len(ids) <= max_token_block]
+    for block in blocks:
+        if len(block) > 1:
+            pairs.update(combinations(sorted(set(block)), 2))
+    return pairs
+
+
+def verify(left: Hotel, right: Hotel, threshold: float) -> Match | None:
+    if left.key == right.key:
+        return Match(left, right, "same-tokens", 1.0)
+    left_tokens, right_tokens = set(left.tokens), set(right.tokens)
+    small, large = sorted((left_tokens, right_tokens), key=len)
+    if small < large:
+        # Any other extra word ("Chic", "Macao", "Flora") names a sibling property, whatever the trigram score.
+        if small - PLACE_TOKENS and large - small <= PLACE_TOKENS | GENERIC_TOKENS:
+            return Match(left, right, "contained", len(small) / len(large))
+        return None
+    score = jaccard(left.trigrams, right.trigrams)
+    if score >= threshold:
+        return Match(left, right, "similar", score)
+    return None
+
+
+def find_clusters(
+    zones: dict[str, list[str]], threshold: float = 0.7
+) -> dict[str, list[tuple[list[Hotel], list[Match]]]]:
+    """Return {zone group: [(cluster hotels, matches)]} for clusters of two or more names."""
+    grouped: dict[str, list[Hotel]] = defaultdict(list)
+    for zone, names in zones.items():
+        for name in names:
+            grouped[zone_group(zone)].append(Hotel(name, zone, tokenize(name)))
+
+    report: dict[str, list[tuple[list[Hotel], list[Match]]]] = {}
+    for group, hotels in grouped.items():
+        union = _UnionFind(len(hotels))
+        matches: list[tuple[int, Match]] = []
+        for left, right in candidate_pairs(hotels):
+            match = verify(hotels[left], hotels[right], threshold)
+            if match:
+                union.union(left, right)
+                matches.append((left, match))
+        members: dict[int, list[Hotel]] = defaultdict(list)
+        for position, hotel in enumerate(hotels):
+            members[union.find(position)].append(hotel)
+        cluster_matches: dict[int, list[Match]] = defaultdict(list)
+        for position, match in matches:
+            cluster_matches[union.find(position)].append(match)
+        clusters = [(hotels_in, cluster_matches[root]) for root, hotels_in in members.items() if len(hotels_in) > 1]
+        if clusters:
+            report[group] = clusters
+    return report
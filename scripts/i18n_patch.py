@@ -0,0 +1,206 @@
+"""Single-pass patch engine for the messages/*.json catalogs.
+
+Every locale file is read once, parsed once into a key index and written at
+most once (via an atomic rename). New keys are appended before the closing
+brace so the existing text, ordering and escapes stay byte-for-byte intact.
+
+Locales are independent, so with --workers N each catalog is parsed, validated,
+patched and serialized in its own worker process and the per-locale reports
+are merged afterwards.
+
+Usage:
+    python scripts/i18n_patch.py batch1.json [batch2.json ...] [--dry-run] [--workers N]
+
+Each batch file is a JSON object of the form {"es": {"key": "value"}, ...}.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from content_cli import TIMER, merge, run_tool, snapshot, span
+
+MESSAGES_DIR = Path("messages")
+
+Batch = Mapping[str, Mapping[str, str]]
+
+
+@dataclass
+class LocaleReport:
+    locale: str
+    path: Path
+    added: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    invalid: list[str] = field(default_factory=list)
+    total_keys: int = 0
+    written: bool = False
+
+    def summary(self) -> str:
+        state = "written" if self.written else "unchanged"
+        line = f"{self.locale}: +{len(self.added)} keys, {len(self.skipped)} already present ({state})"
+        if self.invalid:
+            line += f", {len(self.invalid)} non-string values"
+        return line
+
+
+def merge_reports(reports: Iterable[LocaleReport]) -> dict[str, int]:
+    totals = {"locales": 0, "keys": 0, "added": 0, "skipped": 0, "invalid": 0, "written": 0}
+    for report in reports:
+        totals["locales"] += 1
+        totals["keys"] += report.total_keys
+        totals["added"] += len(report.added)
+        totals["skipped"] += len(report.skipped)
+        totals["invalid"] += len(report.invalid)
+        totals["written"] += int(report.written)
+    return totals
+
+
+def _reject_duplicates(pairs: list[tuple[str, object]]) -> dict[str, object]:
+    catalog: dict[str, object] = {}
+    for key, value in pairs:
+        if key in catalog:
+            raise ValueError(f"duplicate key {key!r}")
+        catalog[key] = value
+    return catalog
+
+
+def parse_catalog(text: str, path: Path) -> dict[str, object]:
+    try:
+        catalog = json.loads(text, object_pairs_hook=_reject_duplicates)
+    except ValueError as exc:
+        raise ValueError(f"{path}: {exc}") from exc
+    if not isinstance(catalog, dict):
+        raise ValueError(f"{path} does not contain a JSON object")
+    return catalog
+
+
+def merge_batches(batches: Iterable[Batch]) -> dict[str, dict[str, str]]:
+    """Fold batches into one ordered {locale: {key: value}} plan; first value wins."""
+    merged: dict[str, dict[str, str]] = {}
+    for batch in batches:
+        for locale, entries in batch.items():
+            target = merged.setdefault(locale, {})
+            for key, value in entries.items():
+                target.setdefault(key, value)
+    return merged
+
+
+def render_entries(entries: Mapping[str, str], indent: str = "  ") -> str:
+    return ",\n".join(
+        f"{indent}{json.dumps(key, ensure_ascii=False)}: {json.dumps(value, ensure_ascii=False)}"
+        for key, value in entries.items()
+    )
+
+
+def splice_entries(text: str, entries: Mapping[str, str], path: Path) -> str:
+    trimmed = text.rstrip()
+    if not trimmed.endswith("}"):
+        raise ValueError(f"{path} does not end with a JSON object")
+    body = trimmed[:-1].rstrip()
+    separator = "\n" if body.endswith("{") else ",\n"
+    return body + separator + render_entries(entries) + "\n}\n"
+
+
+def write_atomic(path: Path, text: str) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as handle:
+            handle.write(text)
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def patch_locale(path: Path, entries: Mapping[str, str], dry_run: bool = False) -> LocaleReport:
+    report = LocaleReport(locale=path.stem, path=path)
+    with span("read", path.stat().st_size):
+        text = path.read_text(encoding="utf-8")
+    with span("parse", len(text)):
+        existing = parse_catalog(text, path)
+    with span("transform"):
+        report.invalid = [key for key, value in existing.items() if not isinstance(value, str)]
+        pending: dict[str, str] = {}
+        for key, value in entries.items():
+            if key in existing:
+                report.skipped.append(key)
+            else:
+                pending[key] = value
+                report.added.append(key)
+        report.total_keys = len(existing) + len(pending)
+        patched = splice_entries(text, pending, path) if pending and not dry_run else None
+    if patched is not None:
+        with span("write", len(patched)):
+            write_atomic(path, patched)
+        report.written = True
+    return report
+
+
+def _patch_locale_job(job: tuple[Path, dict[str, str], bool]) -> LocaleReport:
+    path, entries, dry_run = job
+    return patch_locale(path, entries, dry_run=dry_run)
+
+
+def _patch_locale_worker(job: tuple[Path, dict[str, str], bool]) -> tuple[LocaleReport, dict[str, dict]]:
+    TIMER.reset()
+    report = _patch_locale_job(job)
+    return report, snapshot()
+
+
+def patch_messages(
+    batches: Iterable[Batch],
+    messages_dir: Path = MESSAGES_DIR,
+    dry_run: bool = False,
+    workers: int = 1,
+) -> list[LocaleReport]:
+    plan = merge_batches(batches)
+    jobs = []
+    for locale, entries in plan.items():
+        path = messages_dir / f"{locale}.json"
+        if not path.exists():
+            raise FileNotFoundError(f"No catalog for locale {locale!r} at {path}")
+        jobs.append((path, entries, dry_run))
+    if workers <= 1 or len(jobs) <= 1:
+        return [_patch_locale_job(job) for job in jobs]
+    reports = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        for report, phases in pool.map(_patch_locale_worker, jobs):
+            merge(phases)
+            reports.append(report)
+    return reports
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Append translation keys to messages/*.json")
+    parser.add_argument("batches", nargs="+", type=Path, help="JSON files shaped {locale: {key: value}}")
+    parser.add_argument("--messages-dir", type=Path, default=MESSAGES_DIR)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--workers", type=int, default=1, help="process one locale per worker process")
+    args = parser.parse_args(argv)
+
+    batches = [json.loads(path.read_text(encoding="utf-8")) for path in args.batches]
+    reports = patch_messages(
+        batches, messages_dir=args.messages_dir, dry_run=args.dry_run, workers=args.workers
+    )
+    for report in reports:
+        print(report.summary())
+    totals = merge_reports(reports)
+    print(
+        f"{totals['locales']} locales, {totals['keys']} keys, +{totals['added']} added, "
+        f"{totals['written']} files written"
+    )
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,231 @@
+"""Resized WebP/AVIF derivatives for the images the site references.
+
+Sources are every image under public/ plus every "/path.png"-style string in
+data/*.ts that points into public/. Each source is hashed (sha256) and its
+derivatives are named after that hash, width and format, so unchanged
+sources are never re-encoded and a changed file simply gets new names.
+Sources are processed in a process pool; the manifest maps each public URL
+to its variants so landing data and components can pick a srcset.
+
+Needs Pillow (see scripts/requirements.txt; AVIF only when the installed
+Pillow can encode it).
+
+Usage:
+    python scripts/image_derivatives.py [--out public/optimized] [--widths 320 640 960 1280 1920]
+        [--workers 4] [--prune] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from content_cli import TIMER, merge, run_tool, snapshot, span
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # pragma: no cover - reported by main()
+    Image = None
+
+PUBLIC_DIR = Path("public")
+DATA_DIR = Path("data")
+OUTPUT_DIR = PUBLIC_DIR / "optimized"
+WIDTHS = (320, 640, 960, 1280, 1920)
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+QUALITY = {"webp": 80, "avif": 50}
+REFERENCE = re.compile(r"[\"'`](/[^\"'`\n?#]+?\.(?:png|jpe?g|webp))[\"'`]", re.I)
+
+
+@dataclass(frozen=True)
+class Source:
+    url: str
+    path: Path
+    digest: str
+
+
+def available_formats() -> list[str]:
+    formats = ["webp"] if features.check("webp") else []
+    if features.check("avif"):
+        formats.append("avif")
+    return formats
+
+
+def find_references(data_dir: Path = DATA_DIR) -> dict[str, list[str]]:
+    """Public URL -> data files that mention it."""
+    references: dict[str, list[str]] = {}
+    for path in sorted(data_dir.glob("*.ts")):
+        with span("read", path.stat().st_size):
+            text = path.read_text(encoding="utf-8")
+        for url in sorted(set(REFERENCE.findall(text))):
+            references.setdefault(url, []).append(path.as_posix())
+    return references
+
+
+def find_sources(public_dir: Path, output_dir: Path, references: dict[str, list[str]]) -> tuple[list[Source], list[str]]:
+    candidates: dict[str, Path] = {}
+    for path in public_dir.rglob("*"):
+        if path.suffix.lower() in IMAGE_SUFFIXES and path.is_file() and output_dir not in path.parents:
+            candidates["/" + path.relative_to(public_dir).as_posix()] = path
+    missing = []
+    for url in references:
+        path = public_dir / url.lstrip("/")
+        if path.is_file():
+            candidates[url] = path
+        else:
+            missing.append(url)
+    sources = []
+    for url, path in sorted(candidates.items()):
+        with span("read", path.stat().st_size):
+            raw = path.read_bytes()
+        sources.append(Source(url, path, hashlib.sha256(raw).hexdigest()[:16]))
+    return sources, missing
+
+
+def derivative_name(source: Source, width: int, fmt: str) -> str:
+    stem = re.sub(r"[^a-z0-9]+", "-", source.path.stem.lower()).strip("-") or "image"
+    return f"{stem}.{source.digest}.{width}.{fmt}"
+
+
+def plan_widths(original: int, widths: tuple[int, ...]) -> list[int]:
+    chosen = [width for width in widths if width < original]
+    return chosen + [original] if not chosen or original <= max(widths) else chosen
+
+
+RenderJob = tuple[Source, Path, Path, tuple[int, ...], tuple[str, ...], bool]
+
+
+def render_source(job: RenderJob) -> dict[str, object]:
+    """Create the missing derivatives of one source."""
+    source, output_dir, public_dir, widths, formats, dry_run = job
+    with Image.open(source.path) as opened:
+        with span("parse", source.path.stat().st_size):
+            image = ImageOps.exif_transpose(opened)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+        original_width, original_height = image.size
+        variants = []
+        encoded = 0
+        for width in plan_widths(original_width, widths):
+            resized = None
+            for fmt in formats:
+                target = output_dir / derivative_name(source, width, fmt)
+                if not target.exists():
+                    encoded += 1
+                    if not dry_run:
+                        if resized is None:
+                            height = max(1, round(original_height * width / original_width))
+                            with span("transform"):
+                                resized = image if width == original_width else image.resize((width, height), Image.LANCZOS)
+                        tmp = target.with_name(target.name + ".tmp")
+                        with span("write") as written:
+                            resized.save(tmp, format=fmt.upper(), quality=QUALITY[fmt])
+                            written.add(tmp.stat().st_size)
+                            os.replace(tmp, target)
+                variants.append(
+                    {
+                        "width": width,
+                        "format": fmt,
+                        "src": "/" + target.relative_to(public_dir).as_posix()
+                        if public_dir in target.parents
+                        else target.as_posix(),
+                        "bytes": target.stat().st_size if target.exists() else None,
+                    }
+                )
+    return {
+        "url": source.url,
+        "hash": source.digest,
+        "width": original_width,
+        "height": original_height,
+        "bytes": source.path.stat().st_size,
+        "variants": variants,
+        "encoded": encoded,
+    }
+
+
+def _render_worker(job: RenderJob) -> tuple[dict[str, object], dict[str, dict]]:
+    """render_source in a worker process, with its spans shipped back to the parent."""
+    TIMER.reset()
+    result = render_source(job)
+    return result, snapshot()
+
+
+def write_manifest(path: Path, manifest: dict[str, object]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    text = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    with span("write", len(text)):
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def prune(output_dir: Path, keep: set[str]) -> list[Path]:
+    stale = [path for path in output_dir.iterdir() if path.is_file() and path.name != "manifest.json" and path.name not in keep]
+    for path in stale:
+        path.unlink()
+    return stale
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate WebP/AVIF derivatives for referenced images")
+    parser.add_argument("--public-dir", type=Path, default=PUBLIC_DIR)
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--widths", type=int, nargs="+", default=list(WIDTHS))
+    parser.add_argument("--format", action="append", choices=sorted(QUALITY), help="default: every format Pillow can encode")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--prune", action="store_true", help="delete derivatives no source maps to any more")
+    parser.add_argument("--dry-run", action="store_true", help="report what would be encoded")
+    args = parser.parse_args(argv)
+
+    if Image is None:
+        raise SystemExit("Pillow is required: pip install -r scripts/requirements.txt")
+    formats = tuple(args.format or available_formats())
+    unsupported = [fmt for fmt in formats if fmt not in available_formats()]
+    if unsupported:
+        raise SystemExit(f"This Pillow build cannot encode {', '.join(unsupported)}")
+
+    references = find_references()
+    sources, missing = find_sources(args.public_dir, args.out, references)
+    if not args.dry_run:
+        args.out.mkdir(parents=True, exist_ok=True)
+    jobs = [(source, args.out, args.public_dir, tuple(sorted(args.widths)), formats, args.dry_run) for source in sources]
+    if args.workers > 1 and len(jobs) > 1:
+        results = []
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for result, phases in pool.map(_render_worker, jobs):
+                merge(phases)
+                results.append(result)
+    else:
+        results = [render_source(job) for job in jobs]
+
+    images = {}
+    encoded = 0
+    for result in results:
+        encoded += result.pop("encoded")
+        result["referencedBy"] = references.get(result["url"], [])
+        images[result.pop("url")] = result
+    original_bytes = sum(result["bytes"] for result in images.values())
+
+    print(f"{len(sources)} source images ({original_bytes / 1_048_576:.1f} MB), formats: {', '.join(formats)}")
+    for url in missing:
+        print(f"  missing source for {url} ({', '.join(references[url])})")
+    if args.dry_run:
+        print(f"{encoded} derivatives would be encoded")
+        return
+    write_manifest(args.out / "manifest.json", {"widths": sorted(args.widths), "formats": list(formats), "images": images})
+    if args.prune:
+        keep = {variant["src"].rsplit("/", 1)[-1] for result in images.values() for variant in result["variants"]}
+        print(f"{len(prune(args.out, keep))} stale derivatives pruned")
+    derived = [variant for result in images.values() for variant in result["variants"]]
+    print(
+        f"{len(derived)} derivatives in {args.out} ({encoded} encoded, {len(derived) - encoded} cached, "
+        f"{sum(variant['bytes'] for variant in derived) / 1_048_576:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,277 @@
+"""Check keyword sheets (url, locale, keywords) against the landing data.
+
+Landing documents are read from data/*-landings.ts and data/*-variants.ts
+(plus any --source files) with ts_literals: every object with a literal
+slug/landingSlug, every slug-keyed record entry and every record of a
+`LIST.map(...)` over a literal string list (filled from the callback's own
+templates) becomes one document per locale. Their title/seoTitle/
+metaDescription/keywords text feeds an inverted index (token -> document
+ids), so each keyword is answered by intersecting a few posting sets instead
+of scanning every landing.
+
+Reports:
+  * coverage      - keywords whose target URL (or any landing) contains all their terms
+  * cannibalized  - keywords targeted by more than one URL in the same locale
+  * missing pages - sheet URLs with no landing document behind them
+
+Usage:
+    python scripts/keyword_coverage.py sosua_party_boat_keywords.csv [more.csv ...]
+        [--source components/public/SosuaPartyBoatAliasPage.tsx] [--json report.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+from urllib.parse import urlparse
+
+from content_cli import read_text, run_tool, span, write_text
+from slugs import fold, slugify_blog
+from ts_literals import UNKNOWN, fill_template, iter_objects, iter_strings, map_callback, parse_declarations
+
+DATA_DIR = Path("data")
+LANDING_PATTERNS = ("*-landings.ts", "*-variants.ts")
+LOCALES = ("es", "en", "fr")
+ANY_LOCALE = "*"
+SLUG_FIELDS = ("landingSlug", "slug")
+STRONG_FIELDS = {"title", "titles", "seoTitle", "heroTitle", "keyword", "keywords"}
+TEXT_FIELDS = STRONG_FIELDS | {"metaDescription", "metaDescriptions", "description", "seoDescription", "question"}
+STOP_WORDS = frozenset(
+    {"a", "an", "and", "the", "in", "of", "for", "to", "on", "de", "del", "la", "el", "en", "y", "con",
+     "du", "des", "le", "les", "et", "au", "aux", "l"}
+)
+SLUG_KEY = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)+$")
+# TS helpers that may appear inside `${...}` of a mapped record template.
+TEMPLATE_HELPERS = {"slugifyBlog": slugify_blog}
+
+
+def terms(text: str) -> list[str]:
+    words = re.findall(r"[a-z0-9]+", fold(text))
+    return [word[:-1] if len(word) > 3 and word.endswith("s") else word for word in words if word not in STOP_WORDS]
+
+
+def phrase(text: str) -> str:
+    return " ".join(terms(text))
+
+
+@dataclass
+class Document:
+    slug: str
+    locale: str
+    source: str
+    text: list[str] = field(default_factory=list)
+    strong: list[str] = field(default_factory=list)
+
+
+def _locale_texts(value: Any) -> dict[str, list[str]]:
+    if isinstance(value, dict) and value and set(value) <= set(LOCALES):
+        return {locale: list(iter_strings(child)) for locale, child in value.items()}
+    return {ANY_LOCALE: list(iter_strings(value))}
+
+
+def _add_document(docs: dict[tuple[str, str], Document], slug: str, record: dict[str, Any], source: str) -> None:
+    for name, value in record.items():
+        if name not in TEXT_FIELDS or value is UNKNOWN:
+            continue
+        for locale, texts in _locale_texts(value).items():
+            texts = [text for text in texts if "${" not in text]
+            if not texts:
+                continue
+            doc = docs.setdefault((slug, locale), Document(slug, locale, source))
+            doc.text.extend(texts)
+            if name in STRONG_FIELDS:
+                doc.strong.extend(texts)
+
+
+def mapped_records(text: str, declarations: dict[str, Any]) -> Iterable[tuple[str, dict[str, Any]]]:
+    """Records built by `LIST.map((item) => ...)` over a literal string list.
+
+    keywordSalesLandings in keyword-sales-landings.ts is built this way. The
+    callback's own templates are filled per item, so the records follow the TS.
+    Fields whose templates need more than the item, earlier `const` bindings
+    and TEMPLATE_HELPERS are left out.
+    """
+    for name, items in declarations.items():
+        if not isinstance(items, list) or f"{name}.map(" not in text:
+            continue
+        callback = map_callback(text, name)
+        if callback is None:
+            continue
+        for item in items:
+            if not isinstance(item, str):
+                continue
+            variables = {callback.param: item}
+            for binding, template in callback.bindings.items():
+                if isinstance(template, str) and (value := fill_template(template, variables, TEMPLATE_HELPERS)) is not None:
+                    variables[binding] = value
+            record: dict[str, Any] = {}
+            for key, template in callback.returned.items():
+                if template is UNKNOWN and key in variables:
+                    record[key] = variables[key]
+                elif isinstance(template, str) and (value := fill_template(template, variables, TEMPLATE_HELPERS)) is not None:
+                    record[key] = value
+            slug = next((record[field_name] for field_name in SLUG_FIELDS if isinstance(record.get(field_name), str)), None)
+            if slug:
+                yield slug, record
+
+
+def load_documents(paths: Iterable[Path]) -> dict[tuple[str, str], Document]:
+    docs: dict[tuple[str, str], Document] = {}
+    for path in paths:
+        text = read_text(path)
+        declarations = parse_declarations(text)
+        source = path.as_posix()
+        for slug, record in mapped_records(text, declarations):
+            _add_document(docs, slug, record, source)
+        for parent_key, record in iter_objects(list(declarations.values())):
+            slug = next((record[name] for name in SLUG_FIELDS if isinstance(record.get(name), str)), None)
+            if slug is None and parent_key and SLUG_KEY.match(parent_key) and TEXT_FIELDS & record.keys():
+                slug = parent_key
+            if slug:
+                _add_document(docs, slug, record, source)
+    return docs
+
+
+class KeywordIndex:
+    def __init__(self, docs: dict[tuple[str, str], Document]) -> None:
+        self.docs = docs
+        self.postings: dict[tuple[str, str], set[tuple[str, str]]] = defaultdict(set)
+        self.strong: dict[tuple[str, str], str] = {}
+        self._cache: dict[tuple[str, str], frozenset[tuple[str, str]]] = {}
+        for doc_id, doc in docs.items():
+            for term in {term for text in doc.text for term in terms(text)}:
+                self.postings[(doc.locale, term)].add(doc_id)
+            self.strong[doc_id] = " | ".join(phrase(text) for text in doc.strong)
+
+    def document(self, slug: str, locale: str) -> tuple[str, str] | None:
+        for candidate in ((slug, locale), (slug, ANY_LOCALE)):
+            if candidate in self.docs:
+                return candidate
+        return None
+
+    def match(self, keyword_terms: tuple[str, ...], locale: str) -> frozenset[tuple[str, str]]:
+        """Documents in `locale` (or locale-agnostic) containing every term."""
+        key = (" ".join(keyword_terms), locale)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        result: set[tuple[str, str]] = set()
+        if keyword_terms:
+            for scope in (locale, ANY_LOCALE):
+                postings = sorted((self.postings.get((scope, term), set()) for term in set(keyword_terms)), key=len)
+                if postings and postings[0]:
+                    result |= set.intersection(*postings)
+        self._cache[key] = frozen = frozenset(result)
+        return frozen
+
+    def strong_matches(self, keyword_phrase: str, candidates: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        needle = f" {keyword_phrase} "
+        return [doc_id for doc_id in candidates if needle in f" {self.strong[doc_id].replace(' | ', '  ')} "]
+
+
+@dataclass
+class SheetRow:
+    sheet: str
+    url: str
+    locale: str
+    keywords: list[str]
+
+    @property
+    def slug(self) -> str:
+        return urlparse(self.url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def load_sheets(paths: Iterable[Path]) -> list[SheetRow]:
+    rows = []
+    for path in paths:
+        with span("parse", path.stat().st_size), path.open(encoding="utf-8", newline="") as handle:
+            for record in csv.DictReader(handle):
+                keywords = [keyword.strip() for keyword in (record.get("keywords") or "").split(",") if keyword.strip()]
+                rows.append(SheetRow(path.as_posix(), record["url"].strip(), (record.get("locale") or "es").strip(), keywords))
+    return rows
+
+
+def analyze(rows: list[SheetRow], index: KeywordIndex) -> dict[str, Any]:
+    targets: dict[tuple[str, str], set[str]] = defaultdict(set)
+    missing_pages: dict[str, None] = {}
+    uncovered: list[dict[str, str]] = []
+    landing_overlap: dict[str, list[str]] = {}
+    total = covered_by_target = covered_anywhere = 0
+    for row in rows:
+        target = index.document(row.slug, row.locale)
+        if target is None:
+            missing_pages.setdefault(f"{row.url} ({row.locale})")
+        for keyword in row.keywords:
+            keyword_terms = tuple(terms(keyword))
+            keyword_phrase = " ".join(keyword_terms)
+            targets[(keyword_phrase, row.locale)].add(row.url)
+            matches = index.match(keyword_terms, row.locale)
+            total += 1
+            if target is not None and target in matches:
+                covered_by_target += 1
+            if matches:
+                covered_anywhere += 1
+            else:
+                uncovered.append({"keyword": keyword, "locale": row.locale, "url": row.url})
+            strong = index.strong_matches(keyword_phrase, matches)
+            if len(strong) > 1:
+                landing_overlap[f"{keyword_phrase} ({row.locale})"] = sorted(f"{slug} [{locale}]" for slug, locale in strong)
+    cannibalized = {
+        f"{keyword_phrase} ({locale})": sorted(urls) for (keyword_phrase, locale), urls in targets.items() if len(urls) > 1
+    }
+    return {
+        "rows": len(rows),
+        "keywords": total,
+        "coveredByTarget": covered_by_target,
+        "coveredAnywhere": covered_anywhere,
+        "uncovered": uncovered,
+        "cannibalized": cannibalized,
+        "landingOverlap": landing_overlap,
+        "missingPages": list(missing_pages),
+    }
+
+
+def landing_sources(extra: Iterable[Path]) -> list[Path]:
+    found: set[Path] = set(extra)
+    for pattern in LANDING_PATTERNS:
+        found.update(DATA_DIR.glob(pattern))
+    return sorted(found)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Keyword sheet coverage, cannibalization and missing landings")
+    parser.add_argument("sheets", nargs="+", type=Path, help="CSV files with url,locale,keywords columns")
+    parser.add_argument("--source", action="append", type=Path, default=[], help="extra TS/TSX files with landing data")
+    parser.add_argument("--json", type=Path, help="write the full report to this file")
+    parser.add_argument("--limit", type=int, default=15, help="examples printed per section")
+    args = parser.parse_args(argv)
+
+    docs = load_documents(landing_sources(args.source))
+    rows = load_sheets(args.sheets)
+    with span("transform"):
+        index = KeywordIndex(docs)
+        report = analyze(rows, index)
+
+    print(f"{len(docs)} landing documents indexed, {report['rows']} sheet rows, {report['keywords']} keywords")
+    print(f"covered by target URL: {report['coveredByTarget']}/{report['keywords']}")
+    print(f"covered by any landing: {report['coveredAnywhere']}/{report['keywords']}")
+    for label, key in (("cannibalized keywords", "cannibalized"), ("overlapping landings", "landingOverlap")):
+        items = report[key]
+        print(f"{label}: {len(items)}")
+        for keyword, urls in list(items.items())[: args.limit]:
+            print(f"  {keyword}: {', '.join(urls)}")
+    print(f"missing pages: {len(report['missingPages'])}")
+    for url in report["missingPages"][: args.limit]:
+        print(f"  {url}")
+    if args.json:
+        write_text(args.json, json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    run_tool(main)
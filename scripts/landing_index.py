@@ -0,0 +1,249 @@
+"""Persistent slug index over data/*-landings.ts and data/*-variants.ts.
+
+Each TS file is tokenized once (strings, template literals, comments and
+braces) and every object literal that carries a literal `landingSlug` or
+`slug` becomes an entry: slug -> file, byte offset, hotelSlug, reverseSlug,
+canonical. The index is cached on disk and refreshed per file by mtime/size,
+falling back to a content hash, so unchanged files are never re-parsed.
+
+Usage:
+    python scripts/landing_index.py [--rebuild] [--duplicates] [--missing slug ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from content_cli import run_tool, span
+from ts_literals import COMMENT, STRING, TEMPLATE, unquote
+
+DATA_DIR = Path("data")
+CACHE_PATH = Path(".cache/content-tools/landing-index.json")
+PATTERNS = ("*-landings.ts", "*-variants.ts")
+SLUG_FIELDS = ("landingSlug", "slug")
+INDEXED_FIELDS = frozenset((*SLUG_FIELDS, "hotelSlug", "reverseSlug", "canonical"))
+INDEX_VERSION = 1
+
+# Same comment/string/template grammar as ts_literals, over raw bytes so offsets are byte offsets.
+TOKEN = re.compile(
+    rf"""
+    (?P<comment>{COMMENT})
+  | (?P<prop>(?<![\w$.])(?P<name>[A-Za-z_$][\w$]*+)\s*+:\s*+(?P<value>{STRING}))
+  | (?P<str>{STRING})
+  | (?P<tpl>{TEMPLATE})
+  | (?P<open>\{{)
+  | (?P<close>\}})
+    """.encode(),
+    re.S | re.X,
+)
+
+
+@dataclass
+class LandingEntry:
+    slug: str
+    file: str
+    offset: int
+    end: int
+    field: str
+    hotelSlug: str | None = None
+    reverseSlug: str | None = None
+    canonical: str | None = None
+
+
+def parse_landing_file(raw: bytes, file: str) -> list[LandingEntry]:
+    entries: list[LandingEntry] = []
+    stack: list[tuple[int, dict[str, tuple[str, int]]]] = []
+    for match in TOKEN.finditer(raw):
+        kind = match.lastgroup
+        if kind == "open":
+            stack.append((match.start(), {}))
+        elif kind == "close":
+            if not stack:
+                continue
+            _, props = stack.pop()
+            for slug_field in SLUG_FIELDS:
+                if slug_field in props:
+                    slug, offset = props[slug_field]
+                    entries.append(
+                        LandingEntry(
+                            slug=slug,
+                            file=file,
+                            offset=offset,
+                            end=match.end(),
+                            field=slug_field,
+                            hotelSlug=props.get("hotelSlug", (None,))[0],
+                            reverseSlug=props.get("reverseSlug", (None,))[0],
+                            canonical=props.get("canonical", (None,))[0],
+                        )
+                    )
+                    break
+        elif kind == "prop" and stack:
+            name = match.group("name").decode()
+            if name in INDEXED_FIELDS:
+                stack[-1][1].setdefault(name, (unquote(match.group("value").decode("utf-8")), match.start()))
+    entries.sort(key=lambda entry: entry.offset)
+    return entries
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.sha1(raw).hexdigest()
+
+
+class LandingIndex:
+    def __init__(self, data_dir: Path = DATA_DIR, cache_path: Path | None = CACHE_PATH) -> None:
+        self.data_dir = data_dir
+        self.cache_path = cache_path
+        self.files: dict[str, dict] = {}
+        self.by_slug: dict[str, list[LandingEntry]] = {}
+        self.reparsed: list[str] = []
+
+    @classmethod
+    def load(cls, data_dir: Path = DATA_DIR, cache_path: Path | None = CACHE_PATH, rebuild: bool = False) -> "LandingIndex":
+        index = cls(data_dir, cache_path)
+        if cache_path and cache_path.exists() and not rebuild:
+            with span("read", cache_path.stat().st_size):
+                raw_cache = cache_path.read_text(encoding="utf-8")
+            with span("parse", len(raw_cache)):
+                cached = json.loads(raw_cache)
+            if cached.get("version") == INDEX_VERSION:
+                index.files = cached["files"]
+        index.refresh()
+        return index
+
+    def source_files(self) -> list[Path]:
+        found: set[Path] = set()
+        for pattern in PATTERNS:
+            found.update(self.data_dir.glob(pattern))
+        return sorted(found)
+
+    def refresh(self) -> list[str]:
+        """Re-parse only files whose mtime/size and content hash changed."""
+        self.reparsed = []
+        current: dict[str, dict] = {}
+        for path in self.source_files():
+            key = path.as_posix()
+            stat = path.stat()
+            cached = self.files.get(key)
+            if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                current[key] = cached
+                continue
+            with span("read", stat.st_size):
+                raw = path.read_bytes()
+            digest = _digest(raw)
+            if cached and cached["sha1"] == digest:
+                cached.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                current[key] = cached
+                continue
+            current[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha1": digest,
+                "entries": self._parse(raw, key),
+            }
+            self.reparsed.append(key)
+        dirty = bool(self.reparsed) or current.keys() != self.files.keys()
+        self.files = current
+        self._rebuild_lookup()
+        if dirty or (self.cache_path and not self.cache_path.exists()):
+            self.save()
+        return self.reparsed
+
+    def _parse(self, raw: bytes, key: str) -> list[dict]:
+        with span("parse", len(raw)):
+            return [vars(entry).copy() for entry in parse_landing_file(raw, key)]
+
+    def _rebuild_lookup(self) -> None:
+        self.by_slug = {}
+        for meta in self.files.values():
+            for raw_entry in meta["entries"]:
+                entry = LandingEntry(**raw_entry)
+                self.by_slug.setdefault(entry.slug, []).append(entry)
+
+    def save(self) -> None:
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_suffix(".tmp")
+        payload = json.dumps({"version": INDEX_VERSION, "files": self.files})
+        with span("write", len(payload)):
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.by_slug
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.by_slug.values())
+
+    def get(self, slug: str) -> LandingEntry | None:
+        entries = self.by_slug.get(slug)
+        return entries[0] if entries else None
+
+    def entries_in(self, path: Path) -> list[LandingEntry]:
+        meta = self.files.get(path.as_posix())
+        return [LandingEntry(**raw) for raw in meta["entries"]] if meta else []
+
+    def slugs_in(self, path: Path) -> set[str]:
+        return {entry.slug for entry in self.entries_in(path)}
+
+    def missing(self, slugs: Iterable[str], path: Path | None = None) -> list[str]:
+        known = self.slugs_in(path) if path else self.by_slug.keys()
+        return [slug for slug in slugs if slug not in known]
+
+    def duplicates(self) -> dict[str, list[LandingEntry]]:
+        return {slug: entries for slug, entries in self.by_slug.items() if len(entries) > 1}
+
+    def insert_entries(self, path: Path, blocks: Iterable[tuple[str, str]]) -> list[str]:
+        """Append rendered `(slug, block)` objects after the last entry of `path`.
+
+        Slugs already present anywhere in the index (or repeated in `blocks`)
+        are skipped. Returns the slugs that were written.
+        """
+        existing = self.entries_in(path)
+        if not existing:
+            raise ValueError(f"{path} has no indexed entries to anchor the insert")
+        pending: dict[str, str] = {}
+        for slug, block in blocks:
+            if slug not in self.by_slug and slug not in pending:
+                pending[slug] = block
+        if not pending:
+            return []
+        anchor = max(entry.end for entry in existing)
+        with span("read", path.stat().st_size):
+            raw = path.read_bytes()
+        insertion = (",\n" + ",\n".join(pending.values())).encode("utf-8")
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with span("write", len(raw) + len(insertion)):
+            tmp.write_bytes(raw[:anchor] + insertion + raw[anchor:])
+            os.replace(tmp, path)
+        self.refresh()
+        return list(pending)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build and query the landing slug index")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the on-disk cache")
+    parser.add_argument("--duplicates", action="store_true", help="list slugs defined more than once")
+    parser.add_argument("--missing", nargs="*", metavar="SLUG", help="report which of these slugs are not indexed")
+    args = parser.parse_args(argv)
+
+    index = LandingIndex.load(rebuild=args.rebuild)
+    print(f"{len(index)} entries across {len(index.files)} files ({len(index.reparsed)} re-parsed)")
+    if args.duplicates:
+        for slug, entries in sorted(index.duplicates().items()):
+            locations = ", ".join(f"{entry.file}@{entry.offset}" for entry in entries)
+            print(f"duplicate {slug}: {locations}")
+    if args.missing is not None:
+        for slug in index.missing(args.missing):
+            print(f"missing {slug}")
+
+
+if __name__ == "__main__":
+    run_tool(main)
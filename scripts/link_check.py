@@ -0,0 +1,452 @@
+"""Canonical and internal-link checker for the landing inventory.
+
+The inventory is every indexed landing (landing_index) expanded to its
+public path in each locale (es unprefixed, /en and /fr prefixed), plus
+data/discovered-not-indexed-urls.ts. Offline it reports:
+
+  * reverse links    - reverseSlug that is not `{to}-to-{from}` of its entry,
+                       is claimed by two entries, or shadows another landingSlug
+                       (the transfer page resolves both, first match wins)
+  * canonicals       - hard-coded `canonical` that is not the es URL of the entry
+  * stale discovered - discovered URLs under a landing route with no entry
+                       (a warning; it only fails the run with --strict)
+
+Reverse slugs are served by their forward entry's route, so they are part of
+the inventory.
+
+With --base (a running `next start`/dev server) or --export (a static export
+directory) every inventory URL is also fetched by a fixed number of asyncio
+workers, each keeping one HTTP/1.1 keep-alive connection. Redirects are
+followed hop by hop (chains longer than one hop and loops are reported), the
+rendered <link rel="canonical"> is compared with the expected one, <a href>
+targets are checked, and inventory pages no other crawled page links to are
+reported as orphans.
+
+Usage:
+    python scripts/link_check.py [--base http://localhost:3000 | --export out]
+        [--concurrency 32] [--follow] [--strict] [--json .cache/content-tools/link-check.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from content_cli import read_text, run_tool, write_text
+from landing_index import LandingIndex
+from ts_literals import parse_declarations
+
+SITE_ORIGIN = "https://proactivitis.com"
+DISCOVERED_PATH = Path("data/discovered-not-indexed-urls.ts")
+LOCALES = ("es", "en", "fr")
+MAX_REDIRECTS = 5
+THINGTODO = "/thingtodo/tours/{slug}"
+ROUTES = {
+    "data/transfer-landings.ts": "/transfer/{slug}",
+    "data/transfer-generic-landings.ts": "/transfer/{slug}",
+    "data/premium-transfer-market-landings.ts": "/punta-cana/premium-transfer-services/{slug}",
+    "data/transfer-question-sales-landings.ts": "/punta-cana/premium-transfer-services/questions/{slug}",
+    "data/excursion-keyword-landings.ts": "/excursiones/{slug}",
+    "data/country-punta-cana-landings.ts": "/landing/{slug}",
+    "data/buggy-atv-variants.ts": THINGTODO,
+    "data/parasailing-variants.ts": THINGTODO,
+    "data/party-boat-variants.ts": THINGTODO,
+    "data/samana-whale-variants.ts": THINGTODO,
+    "data/santo-domingo-variants.ts": THINGTODO,
+}
+
+CANONICAL_TAG = re.compile(r"<link\b[^>]*\brel=[\"']canonical[\"'][^>]*>", re.I)
+HREF = re.compile(r"\bhref=[\"']([^\"']*)[\"']", re.I)
+ANCHOR_HREF = re.compile(r"<a\b[^>]*?\bhref=[\"']([^\"'#]*)", re.I)
+
+
+def localized(path: str, locale: str) -> str:
+    return path if locale == "es" else f"/{locale}{path}"
+
+
+def normalize(url: str, base: str = SITE_ORIGIN) -> str | None:
+    """Site-relative path for an internal URL, None for external ones."""
+    parts = urlsplit(urljoin(base + "/", url))
+    if parts.scheme not in ("http", "https"):
+        return None
+    if parts.netloc not in (urlsplit(SITE_ORIGIN).netloc, urlsplit(base).netloc):
+        return None
+    path = parts.path or "/"
+    return path.rstrip("/") or "/"
+
+
+@dataclass
+class Page:
+    path: str
+    file: str
+    slug: str
+    canonical: str
+
+
+@dataclass
+class Inventory:
+    pages: dict[str, Page] = field(default_factory=dict)
+    discovered: list[str] = field(default_factory=list)
+    unrouted: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class Fetched:
+    status: int
+    location: str | None = None
+    body: str = ""
+
+
+@dataclass
+class LinkReport:
+    broken_reverse: list[dict] = field(default_factory=list)
+    canonical_mismatches: list[dict] = field(default_factory=list)
+    orphans: list[dict] = field(default_factory=list)
+    stale_discovered: list[str] = field(default_factory=list)
+    redirect_chains: list[dict] = field(default_factory=list)
+    broken_links: list[dict] = field(default_factory=list)
+    fetched: int = 0
+    seconds: float = 0.0
+
+    @property
+    def problems(self) -> int:
+        return sum(
+            len(items)
+            for items in (
+                self.broken_reverse,
+                self.canonical_mismatches,
+                self.orphans,
+                self.redirect_chains,
+                self.broken_links,
+            )
+        )
+
+
+def load_discovered(path: Path = DISCOVERED_PATH) -> list[str]:
+    if not path.exists():
+        return []
+    urls: list[str] = []
+    for value in parse_declarations(read_text(path)).values():
+        if isinstance(value, list):
+            urls.extend(item for item in value if isinstance(item, str))
+    return urls
+
+
+def build_inventory(index: LandingIndex, discovered: list[str]) -> Inventory:
+    inventory = Inventory(discovered=discovered)
+    for slug, entries in index.by_slug.items():
+        entry = entries[0]
+        route = ROUTES.get(entry.file)
+        if route is None:
+            inventory.unrouted[entry.file] = inventory.unrouted.get(entry.file, 0) + 1
+            continue
+        for page_slug in (slug, entry.reverseSlug):
+            if not page_slug:
+                continue
+            path = route.format(slug=page_slug)
+            for locale in LOCALES:
+                url_path = localized(path, locale)
+                inventory.pages.setdefault(url_path, Page(url_path, entry.file, page_slug, SITE_ORIGIN + path))
+    return inventory
+
+
+def reverse_problem(slug: str, reverse: str, claimed: dict[str, set[str]], index: LandingIndex) -> str | None:
+    origin, sep, destination = slug.partition("-to-")
+    if not sep or "-to-" in destination:
+        return "slug is not origin-to-destination"
+    if reverse != f"{destination}-to-{origin}":
+        return f"expected {destination}-to-{origin}"
+    if len(claimed[reverse]) > 1:
+        return "also the reverseSlug of " + ", ".join(sorted(claimed[reverse] - {slug}))
+    if reverse in index:
+        return "shadows a landingSlug in " + index.get(reverse).file
+    return None
+
+
+def check_offline(index: LandingIndex, inventory: Inventory, report: LinkReport) -> None:
+    claimed: dict[str, set[str]] = {}
+    for slug, entries in index.by_slug.items():
+        for entry in entries:
+            if entry.reverseSlug:
+                claimed.setdefault(entry.reverseSlug, set()).add(slug)
+    for slug, entries in index.by_slug.items():
+        for position, entry in enumerate(entries):
+            if entry.reverseSlug and position == 0:
+                problem = reverse_problem(slug, entry.reverseSlug, claimed, index)
+                if problem:
+                    report.broken_reverse.append(
+                        {"slug": slug, "reverseSlug": entry.reverseSlug, "file": entry.file, "problem": problem}
+                    )
+            route = ROUTES.get(entry.file)
+            expected = SITE_ORIGIN + route.format(slug=slug) if route else None
+            if entry.canonical and expected and entry.canonical != expected:
+                report.canonical_mismatches.append(
+                    {"slug": slug, "file": entry.file, "canonical": entry.canonical, "expected": expected, "source": "data"}
+                )
+
+    prefixes = {route.split("{slug}")[0] for route in ROUTES.values()}
+    for url in inventory.discovered:
+        path = normalize(url)
+        if path is None or path in inventory.pages:
+            continue
+        unprefixed = re.sub(r"^/(en|fr)(?=/)", "", path)
+        if any(unprefixed.startswith(prefix) for prefix in prefixes):
+            report.stale_discovered.append(url)
+
+
+class HttpFetcher:
+    """One keep-alive HTTP/1.1 connection per worker, reopened when the server closes it."""
+
+    def __init__(self, base: str) -> None:
+        parts = urlsplit(base)
+        self.base = base.rstrip("/")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = parts.scheme == "https"
+        self.connections: dict[int, tuple[asyncio.StreamReader, asyncio.StreamWriter]] = {}
+
+    async def _connection(self, worker: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if worker not in self.connections:
+            self.connections[worker] = await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+        return self.connections[worker]
+
+    async def _drop(self, worker: int) -> None:
+        _, writer = self.connections.pop(worker, (None, None))
+        if writer is not None:
+            writer.close()
+
+    async def fetch(self, path: str, worker: int) -> Fetched:
+        for attempt in (1, 2):
+            reader, writer = await self._connection(worker)
+            writer.write(
+                f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\nAccept: text/html\r\nConnection: keep-alive\r\n\r\n".encode()
+            )
+            try:
+                await writer.drain()
+                return await self._read_response(reader, worker)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self._drop(worker)
+                if attempt == 2:
+                    raise
+        raise AssertionError("unreachable")
+
+    async def _read_response(self, reader: asyncio.StreamReader, worker: int) -> Fetched:
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(head[0].split()[1])
+        headers = {}
+        for line in head[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int((await reader.readuntil(b"\r\n")).split(b";")[0], 16):
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            await reader.readuntil(b"\r\n")
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            await self._drop(worker)
+        if headers.get("connection", "").lower() == "close":
+            await self._drop(worker)
+        html = body.decode("utf-8", "replace") if "html" in headers.get("content-type", "html") else ""
+        return Fetched(status, headers.get("location"), html)
+
+    async def close(self) -> None:
+        for worker in list(self.connections):
+            await self._drop(worker)
+
+
+class ExportFetcher:
+    """Serves a static export directory the way `next export` output is hosted."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.base = SITE_ORIGIN
+
+    async def fetch(self, path: str, worker: int) -> Fetched:
+        relative = path.strip("/")
+        for candidate in (self.root / f"{relative}.html", self.root / relative / "index.html"):
+            if candidate.is_file():
+                return Fetched(200, body=candidate.read_text(encoding="utf-8", errors="replace"))
+        return Fetched(404)
+
+    async def close(self) -> None:
+        pass
+
+
+async def crawl(
+    fetcher: HttpFetcher | ExportFetcher,
+    inventory: Inventory,
+    report: LinkReport,
+    concurrency: int = 32,
+    follow: bool = False,
+) -> None:
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    seen: set[str] = set()
+    inbound: dict[str, set[str]] = {}
+    status: dict[str, int] = {}
+    links: dict[str, set[str]] = {}
+
+    def enqueue(path: str) -> None:
+        if path not in seen:
+            seen.add(path)
+            queue.put_nowait(path)
+
+    for path in inventory.pages:
+        enqueue(path)
+    for url in inventory.discovered:
+        path = normalize(url)
+        if path is not None:
+            enqueue(path)
+
+    async def visit(path: str, worker: int) -> None:
+        hops = [path]
+        current = path
+        while True:
+            response = await fetcher.fetch(current, worker)
+            report.fetched += 1
+            if response.status not in (301, 302, 303, 307, 308) or not response.location:
+                break
+            target = normalize(response.location, fetcher.base)
+            if target is None or target in hops or len(hops) > MAX_REDIRECTS:
+                hops.append(response.location)
+                report.redirect_chains.append({"from": path, "hops": hops, "loop": target in hops[:-1]})
+                status[path] = response.status
+                return
+            hops.append(target)
+            current = target
+        status[path] = response.status
+        if len(hops) > 2:
+            report.redirect_chains.append({"from": path, "hops": hops, "loop": False})
+        if response.status != 200 or not response.body:
+            return
+        page = inventory.pages.get(path)
+        tag = CANONICAL_TAG.search(response.body)
+        href = HREF.search(tag.group(0)) if tag else None
+        if page and href and href.group(1).rstrip("/") != page.canonical:
+            report.canonical_mismatches.append(
+                {"slug": page.slug, "file": page.file, "canonical": href.group(1), "expected": page.canonical, "source": path}
+            )
+        if page is None and not follow:
+            return
+        targets = {target for raw in ANCHOR_HREF.findall(response.body) if (target := normalize(raw, fetcher.base))}
+        links[path] = targets
+        for target in targets:
+            if target != path:
+                inbound.setdefault(target, set()).add(path)
+            enqueue(target)
+
+    async def worker(number: int) -> None:
+        while True:
+            path = await queue.get()
+            try:
+                await visit(path, number)
+            except (OSError, ValueError, asyncio.IncompleteReadError) as error:
+                status[path] = 0
+                report.broken_links.append({"source": None, "target": path, "status": 0, "error": str(error)})
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker(number)) for number in range(concurrency)]
+    try:
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await fetcher.close()
+
+    for source, targets in links.items():
+        for target in sorted(targets):
+            code = status.get(target)
+            if code is not None and code >= 400:
+                report.broken_links.append({"source": source, "target": target, "status": code})
+    for path, page in inventory.pages.items():
+        code = status.get(path)
+        if code is not None and code >= 400:
+            report.broken_links.append({"source": None, "target": path, "status": code})
+        elif not inbound.get(path):
+            report.orphans.append({"slug": page.slug, "file": page.file, "path": path, "reason": "no inbound links"})
+
+
+def run(
+    base: str | None = None,
+    export: Path | None = None,
+    concurrency: int = 32,
+    follow: bool = False,
+    index: LandingIndex | None = None,
+) -> tuple[Inventory, LinkReport]:
+    started = time.perf_counter()
+    index = index or LandingIndex.load()
+    inventory = build_inventory(index, load_discovered())
+    report = LinkReport()
+    check_offline(index, inventory, report)
+    if base or export:
+        fetcher = HttpFetcher(base) if base else ExportFetcher(export)
+        asyncio.run(crawl(fetcher, inventory, report, concurrency, follow))
+    report.seconds = time.perf_counter() - started
+    return inventory, report
+
+
+def print_report(inventory: Inventory, report: LinkReport, limit: int = 20) -> None:
+    print(f"{len(inventory.pages)} landing URLs, {len(inventory.discovered)} discovered URLs")
+    for file, count in sorted(inventory.unrouted.items()):
+        print(f"  no route for {file} ({count} entries skipped)")
+    sections = (
+        ("broken reverse links", report.broken_reverse,
+         lambda item: f"{item['slug']} -> {item['reverseSlug']}: {item['problem']}"),
+        ("canonical mismatches", report.canonical_mismatches,
+         lambda item: f"{item['source']}: {item['canonical']} != {item['expected']}"),
+        ("orphans", report.orphans, lambda item: f"{item['path']} ({item['reason']})"),
+        ("stale discovered URLs (warning)", report.stale_discovered, str),
+        ("redirect chains", report.redirect_chains,
+         lambda item: " -> ".join(item["hops"]) + (" (loop)" if item["loop"] else "")),
+        ("broken links", report.broken_links,
+         lambda item: f"{item['source'] or '(inventory)'} -> {item['target']} [{item['status']}]"),
+    )
+    for title, items, describe in sections:
+        print(f"{title}: {len(items)}")
+        for item in items[:limit]:
+            print(f"  {describe(item)}")
+        if len(items) > limit:
+            print(f"  ... {len(items) - limit} more")
+    if report.fetched:
+        rate = report.fetched / report.seconds if report.seconds else 0
+        print(f"fetched {report.fetched} responses in {report.seconds:.2f}s ({rate:.0f}/s)")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Check canonicals, reverse links and orphans in the landing inventory")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base", help="crawl a running server, e.g. http://localhost:3000")
+    target.add_argument("--export", type=Path, help="crawl a static export directory")
+    parser.add_argument("--concurrency", type=int, default=32, help="parallel workers / open connections")
+    parser.add_argument("--follow", action="store_true", help="also parse pages outside the inventory")
+    parser.add_argument("--json", type=Path, help="write the full report as JSON")
+    parser.add_argument("--limit", type=int, default=20, help="items to print per section")
+    parser.add_argument("--strict", action="store_true", help="also fail on stale discovered URLs")
+    args = parser.parse_args(argv)
+
+    inventory, report = run(args.base, args.export, args.concurrency, args.follow)
+    print_report(inventory, report, args.limit)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        payload = {key: value for key, value in vars(report).items()}
+        write_text(args.json, json.dumps(payload, indent=2) + "\n")
+    failed = report.problems or (args.strict and report.stale_discovered)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    run_tool(main)
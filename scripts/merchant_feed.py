@@ -0,0 +1,325 @@
+"""Streaming Merchant Center feed builder/validator over the local SQLite snapshot.
+
+Python counterpart of scripts/generate-merchant-feed.cjs for large local
+runs: published tours are read in batches with fetchmany(), every row is
+cleaned the same way as the JS generator, validated (lengths, URLs, price),
+deduplicated by id and written to the TSV as it is produced (optionally
+gzipped). The previous feed is reduced to {id: row hash} up front so only
+added, changed and removed ids are reported.
+
+Usage:
+    python scripts/merchant_feed.py [--db prisma/dev.db] [--output public/merchant-center/products.tsv]
+        [--gzip] [--batch-size 1000] [--no-root-copy]
+    python scripts/merchant_feed.py --validate merchant_center_feed.tsv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterator
+
+from content_cli import run_tool, span
+
+DB_PATH = Path("prisma/dev.db")
+OUTPUT_PATH = Path("public/merchant-center/products.tsv")
+ROOT_COPY_PATH = Path("merchant_center_feed.tsv")
+
+SITE_URL = (os.environ.get("NEXT_PUBLIC_SITE_URL") or os.environ.get("NEXTAUTH_URL") or "https://proactivitis.com").rstrip("/")
+BRAND = os.environ.get("GOOGLE_MERCHANT_BRAND") or os.environ.get("NEXT_PUBLIC_BRAND_NAME") or "Proactivitis"
+CURRENCY = os.environ.get("GOOGLE_MERCHANT_CURRENCY") or "USD"
+GOOGLE_PRODUCT_CATEGORY = os.environ.get("GOOGLE_MERCHANT_PRODUCT_CATEGORY") or ""
+
+HEADERS = [
+    "id",
+    "title",
+    "description",
+    "link",
+    "image_link",
+    "availability",
+    "price",
+    "brand",
+    "product_type",
+    "condition",
+    "identifier_exists",
+    "custom_label_0",
+    "custom_label_1",
+    "custom_label_2",
+    "google_product_category",
+]
+MAX_LENGTHS = {"id": 50, "title": 150, "description": 5000, "product_type": 750, "brand": 70}
+MAX_LENGTHS.update({f"custom_label_{i}": 100 for i in range(5)})
+REQUIRED = ("id", "title", "description", "link", "image_link", "availability", "price")
+URL_FIELDS = ("link", "image_link")
+# Merchant Center accepts both spellings ("in stock" / "in_stock").
+AVAILABILITY = {"in stock", "out of stock", "preorder", "backorder"}
+PRICE = re.compile(r"^\d+(\.\d{1,2})? [A-Z]{3}$")
+
+TEXT_REPLACEMENTS = [
+    ("Ã¡", "á"),
+    ("Ã©", "é"),
+    ("Ã­", "í"),
+    ("Ã³", "ó"),
+    ("Ãº", "ú"),
+    ("Ã±", "ñ"),
+    ("Ã\x81", "Á"),
+    ("Ã‰", "É"),
+    ("Ã\x8d", "Í"),
+    ("Ã“", "Ó"),
+    ("Ãš", "Ú"),
+    ("Ã‘", "Ñ"),
+    ("Â¿", "¿"),
+    ("Â¡", "¡"),
+    ("Â·", "-"),
+]
+TAGS = re.compile(r"<[^>]*>")
+ABSOLUTE = re.compile(r"^https?://", re.I)
+VALID_URL = re.compile(r"^https?://[^\s/?#]+[^\s]*$", re.I)
+
+TOUR_QUERY = """
+    SELECT id, productId, title, slug, price, description, subtitle, shortDescription,
+           category, location, heroImage, gallery
+    FROM Tour
+    WHERE status = 'published' AND price > 0
+    ORDER BY featured DESC, createdAt DESC
+"""
+
+
+def clean_text(value: object, max_length: int | None = None) -> str:
+    if not value:
+        return ""
+    text = str(value)
+    if "<" in text:
+        text = TAGS.sub(" ", text)
+    if "Ã" in text or "Â" in text:
+        for source, target in TEXT_REPLACEMENTS:
+            text = text.replace(source, target)
+    text = " ".join(text.split())
+    if max_length and len(text) > max_length:
+        text = text[: max_length - 1].strip()
+    return text
+
+
+def parse_gallery(value: str | None) -> list[str]:
+    if not value:
+        return []
+    try:
+        parsed = json.loads(value)
+        if isinstance(parsed, list):
+            return [item for item in parsed if isinstance(item, str) and item.strip()]
+    except ValueError:
+        pass
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+def absolute_url(value: str | None) -> str:
+    if not value:
+        return f"{SITE_URL}/fototours/fotosimple.jpg"
+    if ABSOLUTE.match(value):
+        return value
+    return f"{SITE_URL}{value if value.startswith('/') else '/' + value}"
+
+
+def format_price(value: object) -> str:
+    try:
+        amount = float(value)
+    except (TypeError, ValueError):
+        amount = 0.0
+    return f"{amount:.2f} {CURRENCY}"
+
+
+def build_row(tour: sqlite3.Row) -> list[str]:
+    gallery = parse_gallery(tour["gallery"])
+    product_type = clean_text(tour["category"] or "Tours & Activities", 750)
+    description = clean_text(tour["shortDescription"] or tour["subtitle"] or tour["description"], 5000)
+    # Cells not passed through clean_text above get it here, like feedCell() in the JS generator.
+    return [
+        clean_text(tour["productId"] or tour["id"]),
+        clean_text(tour["title"], 150),
+        description,
+        clean_text(absolute_url(f"/tours/{tour['slug']}")),
+        clean_text(absolute_url(tour["heroImage"] or (gallery[0] if gallery else None))),
+        "in stock",
+        format_price(tour["price"]),
+        clean_text(BRAND),
+        f"Tours & Activities > {product_type}",
+        "new",
+        "no",
+        "tour",
+        clean_text(tour["location"] or "Dominican Republic", 100),
+        product_type,
+        clean_text(GOOGLE_PRODUCT_CATEGORY),
+    ]
+
+
+def validate_row(row: dict[str, str]) -> list[str]:
+    problems = []
+    for name in REQUIRED:
+        if name in row and not row[name]:
+            problems.append(f"{name} is empty")
+    for name, limit in MAX_LENGTHS.items():
+        if len(row.get(name, "")) > limit:
+            problems.append(f"{name} longer than {limit}")
+    for name in URL_FIELDS:
+        value = row.get(name)
+        if value and not VALID_URL.match(value):
+            problems.append(f"{name} is not an absolute URL")
+    if row.get("price") and not PRICE.match(row["price"]):
+        problems.append("price must look like '65.00 USD'")
+    if row.get("availability") and row["availability"].replace("_", " ") not in AVAILABILITY:
+        problems.append(f"availability {row['availability']!r} not allowed")
+    return problems
+
+
+def row_digest(cells: list[str]) -> str:
+    return hashlib.blake2b("\t".join(cells).encode("utf-8"), digest_size=12).hexdigest()
+
+
+def open_feed(path: Path, mode: str, compressed: bool | None = None) -> IO[str]:
+    if compressed if compressed is not None else path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return path.open(mode, encoding="utf-8", newline="")
+
+
+def load_digests(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    with span("read", path.stat().st_size), open_feed(path, "r") as handle:
+        header = handle.readline().rstrip("\n").split("\t")
+        id_column = header.index("id") if "id" in header else 0
+        digests = {}
+        for line in handle:
+            cells = line.rstrip("\n").split("\t")
+            digests[cells[id_column]] = row_digest(cells)
+    return digests
+
+
+@dataclass
+class FeedReport:
+    written: int = 0
+    duplicates: list[str] = field(default_factory=list)
+    invalid: dict[str, list[str]] = field(default_factory=dict)
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    missing_columns: list[str] = field(default_factory=list)
+
+
+def stream_tours(conn: sqlite3.Connection, batch_size: int) -> Iterator[sqlite3.Row]:
+    with span("read"):
+        cursor = conn.execute(TOUR_QUERY)
+    while True:
+        with span("read"):
+            batch = cursor.fetchmany(batch_size)
+        if not batch:
+            return
+        yield from batch
+
+
+def build_feed(db_path: Path, output: Path, batch_size: int = 1000) -> FeedReport:
+    report = FeedReport()
+    previous = load_digests(output)
+    seen: set[str] = set()
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + ".tmp")
+    try:
+        with span("transform"), open_feed(tmp, "w", compressed=output.suffix == ".gz") as handle:
+            handle.write("\t".join(HEADERS) + "\n")
+            for tour in stream_tours(conn, batch_size):
+                cells = build_row(tour)
+                product_id = cells[0]
+                if product_id in seen:
+                    report.duplicates.append(product_id)
+                    continue
+                problems = validate_row(dict(zip(HEADERS, cells)))
+                if problems:
+                    report.invalid[product_id] = problems
+                    continue
+                seen.add(product_id)
+                handle.write("\t".join(cells) + "\n")
+                report.written += 1
+                digest = previous.pop(product_id, None)
+                if digest is None:
+                    report.added.append(product_id)
+                elif digest != row_digest(cells):
+                    report.changed.append(product_id)
+        with span("write", tmp.stat().st_size):
+            os.replace(tmp, output)
+    finally:
+        conn.close()
+        if tmp.exists():
+            tmp.unlink()
+    report.removed = list(previous)
+    return report
+
+
+def validate_feed(path: Path) -> FeedReport:
+    report = FeedReport()
+    seen: set[str] = set()
+    # Reading and CSV parsing are interleaved row by row, so both count as parse.
+    with span("parse", path.stat().st_size), open_feed(path, "r") as handle:
+        reader = csv.DictReader(handle, delimiter="\t", quoting=csv.QUOTE_NONE)
+        report.missing_columns = [name for name in REQUIRED if name not in (reader.fieldnames or ())]
+        for row in reader:
+            product_id = row.get("id") or ""
+            if product_id in seen:
+                report.duplicates.append(product_id)
+                continue
+            seen.add(product_id)
+            problems = validate_row({key: value or "" for key, value in row.items() if key})
+            if problems:
+                report.invalid[product_id] = problems
+            report.written += 1
+    return report
+
+
+def print_report(report: FeedReport, limit: int = 20) -> None:
+    if report.missing_columns:
+        print(f"missing required columns: {', '.join(report.missing_columns)}")
+    for product_id, problems in list(report.invalid.items())[:limit]:
+        print(f"invalid {product_id}: {'; '.join(problems)}")
+    for label in ("duplicates", "added", "changed", "removed"):
+        ids = getattr(report, label)
+        if ids:
+            print(f"{label} ({len(ids)}): {', '.join(ids[:limit])}{' ...' if len(ids) > limit else ''}")
+    print(f"{report.written} rows, {len(report.invalid)} invalid, {len(report.duplicates)} duplicate ids")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build or validate the Merchant Center TSV feed")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--gzip", action="store_true", help="write <output>.gz instead of plain TSV")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--no-root-copy", action="store_true", help=f"do not refresh {ROOT_COPY_PATH}")
+    parser.add_argument("--validate", type=Path, metavar="FEED", help="only validate an existing feed file")
+    args = parser.parse_args(argv)
+
+    if args.validate:
+        report = validate_feed(args.validate)
+        print_report(report)
+        raise SystemExit(1 if report.invalid or report.duplicates or report.missing_columns else 0)
+
+    if not args.db.exists():
+        raise SystemExit(f"{args.db} not found (the feed is built from the local SQLite snapshot)")
+    output = args.output.with_name(args.output.name + ".gz") if args.gzip else args.output
+    report = build_feed(args.db, output, args.batch_size)
+    if not args.no_root_copy and not args.gzip:
+        shutil.copyfile(output, ROOT_COPY_PATH)
+    print_report(report)
+    print(output)
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,283 @@
+"""Translation-key usage scan and per-namespace / per-route message shards.
+
+Every .ts/.tsx file under app/, components/, lib/ and context/ is scanned
+once: string literals that are exact catalog keys count as uses (also
+inside the `${...}` of a template literal), and template literals such as
+`trust.badges.${id}` mark every key under their static prefix as used, as
+do plain literals that are a dotted prefix of catalog keys
+(`tKey("safetyGuide.section.lost.steps", index)`). Routes are the
+app/**/page.tsx files; a route's keys are those of its page, the layouts
+above it and everything they import (`@/...` and relative imports,
+followed transitively).
+
+Output (default .cache/content-tools/message-shards/):
+    <locale>/ns/<namespace>.json      keys grouped by their first segment
+    <locale>/routes/<route>.json      only the keys a route can reach
+    manifest.json                     sizes/hashes per shard, dead keys
+
+Usage:
+    python scripts/message_shards.py [--by namespace|route|both] [--out DIR] [--dead]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from content_cli import run_tool, span
+from i18n_patch import MESSAGES_DIR, parse_catalog, write_atomic
+
+ROOT = Path(".")
+SOURCE_DIRS = ("app", "components", "lib", "context")
+SOURCE_SUFFIXES = (".ts", ".tsx")
+OUTPUT_DIR = Path(".cache/content-tools/message-shards")
+RESOLVE_SUFFIXES = ("", ".ts", ".tsx", ".js", ".jsx", "/index.ts", "/index.tsx")
+
+STRING = re.compile(r""""((?:[^"\\\n]|\\.)*)"|'((?:[^'\\\n]|\\.)*)'|`((?:[^`\\]|\\.)*)`""")
+IMPORT = re.compile(r"""(?:\bfrom\s*|\bimport\s*\(?\s*)["']([^"']+)["']""")
+KEY_SHAPE = re.compile(r"^[A-Za-z][\w-]*(?:\.[\w-]+)+$")
+PREFIX_SHAPE = re.compile(r"^[A-Za-z][\w-]*(?:\.[\w-]+)*\.$")
+
+
+@dataclass
+class SourceFile:
+    path: Path
+    keys: set[str] = field(default_factory=set)
+    prefixes: set[str] = field(default_factory=set)
+    imports: list[Path] = field(default_factory=list)
+
+
+def resolve_import(spec: str, importer: Path, root: Path) -> Path | None:
+    if spec.startswith("@/"):
+        base = root / spec[2:]
+    elif spec.startswith("."):
+        base = importer.parent / spec
+    elif spec.split("/", 1)[0] in SOURCE_DIRS:
+        base = root / spec
+    else:
+        return None
+    for suffix in RESOLVE_SUFFIXES:
+        candidate = Path(os.path.normpath(f"{base}{suffix}"))
+        if candidate.suffix in SOURCE_SUFFIXES and candidate.is_file():
+            return candidate
+    return None
+
+
+def key_prefixes(catalog_keys: Iterable[str]) -> set[str]:
+    """Every proper dotted prefix of the catalog keys, with its trailing dot ("a.b." for "a.b.c")."""
+    prefixes: set[str] = set()
+    for key in catalog_keys:
+        end = key.rfind(".")
+        while end > 0:
+            prefixes.add(key[: end + 1])
+            end = key.rfind(".", 0, end)
+    return prefixes
+
+
+def _scan_strings(source: SourceFile, text: str, catalog_keys: set[str], prefixes: set[str]) -> None:
+    for match in STRING.finditer(text):
+        double, single, template = match.groups()
+        if template is None:
+            _add_literal(source, double if double is not None else single, catalog_keys, prefixes)
+            continue
+        head, dynamic, rest = template.partition("${")
+        if not dynamic:
+            _add_literal(source, template, catalog_keys, prefixes)
+            continue
+        if PREFIX_SHAPE.match(head):
+            source.prefixes.add(head)
+        # Keys passed inside `${...}`, e.g. `${duration} ${translate(locale, "a.b")}`.
+        _scan_strings(source, rest, catalog_keys, prefixes)
+
+
+def _add_literal(source: SourceFile, literal: str, catalog_keys: set[str], prefixes: set[str]) -> None:
+    if not KEY_SHAPE.match(literal):
+        return
+    if literal in catalog_keys:
+        source.keys.add(literal)
+    elif f"{literal}." in prefixes:
+        # A base key completed at runtime, e.g. `${base}.${index}` in a helper.
+        source.prefixes.add(f"{literal}.")
+
+
+def scan_file(path: Path, root: Path, catalog_keys: set[str], prefixes: set[str] = frozenset()) -> SourceFile:
+    with span("read", path.stat().st_size):
+        text = path.read_text(encoding="utf-8", errors="replace")
+    source = SourceFile(path)
+    with span("parse", len(text)):
+        _scan_strings(source, text, catalog_keys, prefixes)
+        for spec in IMPORT.findall(text):
+            target = resolve_import(spec, path, root)
+            if target is not None:
+                source.imports.append(target)
+    return source
+
+
+def scan_sources(root: Path, catalog_keys: set[str], dirs: Iterable[str] = SOURCE_DIRS) -> dict[Path, SourceFile]:
+    sources: dict[Path, SourceFile] = {}
+    prefixes = key_prefixes(catalog_keys)
+    for directory in dirs:
+        for path in sorted((root / directory).rglob("*")):
+            if path.suffix in SOURCE_SUFFIXES and path.is_file():
+                sources[path] = scan_file(path, root, catalog_keys, prefixes)
+    return sources
+
+
+def expand_prefixes(prefixes: Iterable[str], ordered_keys: list[str]) -> set[str]:
+    return {key for prefix in set(prefixes) for key in ordered_keys if key.startswith(prefix)}
+
+
+def route_name(page: Path, app_dir: Path) -> str:
+    parts = [part for part in page.parent.relative_to(app_dir).parts if not (part.startswith("(") and part.endswith(")"))]
+    return "/" + "/".join(parts)
+
+
+def route_files(page: Path, app_dir: Path) -> list[Path]:
+    """The page plus every layout.tsx from app/ down to the page's directory."""
+    files = [page]
+    directory = page.parent
+    while True:
+        for name in ("layout.tsx", "layout.ts"):
+            if (directory / name).is_file():
+                files.append(directory / name)
+        if directory == app_dir:
+            return files
+        directory = directory.parent
+
+
+def reachable_keys(entries: list[Path], sources: dict[Path, SourceFile], ordered_keys: list[str]) -> set[str]:
+    seen: set[Path] = set()
+    stack = [entry for entry in entries if entry in sources]
+    keys: set[str] = set()
+    prefixes: set[str] = set()
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        source = sources[path]
+        keys |= source.keys
+        prefixes |= source.prefixes
+        stack.extend(target for target in source.imports if target in sources and target not in seen)
+    return keys | expand_prefixes(prefixes, ordered_keys)
+
+
+def shard_file_name(route: str) -> str:
+    return (route.strip("/").replace("/", "~") or "index") + ".json"
+
+
+def namespace(key: str) -> str:
+    return key.split(".", 1)[0]
+
+
+def render_shard(catalog: dict[str, object], keys: Iterable[str]) -> str:
+    wanted = set(keys)
+    subset = {key: value for key, value in catalog.items() if key in wanted}
+    return json.dumps(subset, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    with span("read"):
+        unchanged = path.exists() and path.read_text(encoding="utf-8") == text
+    if unchanged:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with span("write", len(text)):
+        write_atomic(path, text)
+    return True
+
+
+def shard_entry(path: Path, text: str, out: Path) -> dict[str, object]:
+    data = text.encode("utf-8")
+    return {"path": path.relative_to(out).as_posix(), "bytes": len(data), "sha1": hashlib.sha1(data).hexdigest()[:12]}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Scan translation-key usage and emit message shards")
+    parser.add_argument("--messages-dir", type=Path, default=MESSAGES_DIR)
+    parser.add_argument("--root", type=Path, default=ROOT)
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--by", choices=("namespace", "route", "both"), default="both")
+    parser.add_argument("--dead", action="store_true", help="list every dead key")
+    args = parser.parse_args(argv)
+
+    catalogs = {}
+    for path in sorted(args.messages_dir.glob("*.json")):
+        with span("read", path.stat().st_size):
+            text = path.read_text(encoding="utf-8")
+        with span("parse", len(text)):
+            catalogs[path.stem] = parse_catalog(text, path)
+    with span("transform"):
+        ordered_keys = list(dict.fromkeys(key for catalog in catalogs.values() for key in catalog))
+        sources = scan_sources(args.root, set(ordered_keys))
+        used = set().union(*(source.keys for source in sources.values()))
+        used |= expand_prefixes((prefix for source in sources.values() for prefix in source.prefixes), ordered_keys)
+        dead = [key for key in ordered_keys if key not in used]
+
+        app_dir = args.root / "app"
+        routes = {
+            route_name(page, app_dir): reachable_keys(route_files(page, app_dir), sources, ordered_keys)
+            for page in sorted(app_dir.rglob("page.tsx"))
+        }
+        namespaces: dict[str, list[str]] = defaultdict(list)
+        for key in ordered_keys:
+            if key in used:
+                namespaces[namespace(key)].append(key)
+
+    manifest: dict[str, object] = {
+        "locales": list(catalogs),
+        "keys": len(ordered_keys),
+        "usedKeys": len(used),
+        "deadKeys": dead,
+        "dynamicPrefixes": sorted({prefix for source in sources.values() for prefix in source.prefixes}),
+        "namespaces": {},
+        "routes": {},
+    }
+    written = 0
+    with span("transform"):
+        for locale, catalog in catalogs.items():
+            if args.by in ("namespace", "both"):
+                for name, keys in namespaces.items():
+                    path = args.out / locale / "ns" / f"{name}.json"
+                    text = render_shard(catalog, keys)
+                    written += write_if_changed(path, text)
+                    entry = manifest["namespaces"].setdefault(name, {"keys": len(keys), "files": {}})
+                    entry["files"][locale] = shard_entry(path, text, args.out)
+            if args.by in ("route", "both"):
+                for route, keys in routes.items():
+                    if not keys:
+                        continue
+                    path = args.out / locale / "routes" / shard_file_name(route)
+                    text = render_shard(catalog, keys)
+                    written += write_if_changed(path, text)
+                    entry = manifest["routes"].setdefault(
+                        route, {"keys": len(keys), "namespaces": sorted({namespace(key) for key in keys}), "files": {}}
+                    )
+                    entry["files"][locale] = shard_entry(path, text, args.out)
+    write_if_changed(args.out / "manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2) + "\n")
+
+    full = {locale: len(render_shard(catalog, catalog).encode("utf-8")) for locale, catalog in catalogs.items()}
+    route_sizes = [
+        file["bytes"] for entry in manifest["routes"].values() for file in entry["files"].values()
+    ]
+    print(f"{len(sources)} source files, {len(ordered_keys)} keys, {len(used)} used, {len(dead)} dead")
+    print(f"{len(routes)} routes, {len(manifest['routes'])} using translations, {len(namespaces)} namespaces")
+    if route_sizes:
+        print(
+            f"full catalog {max(full.values()):,} bytes; route shards avg {sum(route_sizes) // len(route_sizes):,}, "
+            f"max {max(route_sizes):,} bytes"
+        )
+    for key in dead if args.dead else dead[:10]:
+        print(f"  dead {key}")
+    print(f"{written} shard files updated in {args.out}")
+
+
+if __name__ == "__main__":
+    run_tool(main)
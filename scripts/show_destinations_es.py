@@ -1,7 +1,15 @@
 from pathlib import Path
 
-text = Path("messages/es.json").read_text()
-needle = '"destinations.note.verifying"'
-idx = text.index(needle)
-line_end = text.index("\n", idx)
-print(repr(text[idx:line_end + 1]))
+from content_cli import read_text, run_tool
+
+
+def main() -> None:
+    text = read_text(Path("messages/es.json"))
+    needle = '"destinations.note.verifying"'
+    idx = text.index(needle)
+    line_end = text.index("\n", idx)
+    print(repr(text[idx:line_end + 1]))
+
+
+if __name__ == "__main__":
+    run_tool(main)
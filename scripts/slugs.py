@@ -0,0 +1,31 @@
+"""Accent folding and slugs shared by the Python content tools.
+
+`slugify` is the Python port of `slugify` in scripts/seed-transfer-hotels.ts
+and `slugify_blog` of `slugifyBlog` in lib/blog.ts (the same slug cut to 90
+characters), so slugs built here match the ones the app resolves.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+
+def strip_accents(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def fold(value: str) -> str:
+    """Lowercase and strip accents, for matching text across spellings."""
+    return strip_accents(value.lower())
+
+
+def slugify(value: str) -> str:
+    value = unicodedata.normalize("NFD", value.lower())
+    value = "".join(char for char in value if not unicodedata.combining(char))
+    return re.sub(r"[^a-z0-9]+", "-", value).strip("-")
+
+
+def slugify_blog(value: str) -> str:
+    return slugify(value)[:90]
@@ -0,0 +1,305 @@
+"""Apply a batch of anchored/regex edits across app/, components/ and data/.
+
+A plan is a JSON file with an "edits" list. Each edit names a file and one of:
+  * "find"    - literal text; with "whitespace": "loose" any whitespace run
+                matches any other whitespace run (indentation drift, CRLF),
+                except that leading/trailing whitespace keeps its line
+                breaks, so "replace" takes the place of the whole lines
+  * "pattern" - a Python regex ("replace" may use \\1 / \\g<name>)
+plus "replace", and optionally:
+  * "after" / "before" - literal anchors that limit the search to the text
+                         between them
+  * "count"  - how many matches are expected (default 1, 0 = all, at least one)
+  * "sha1"   - hash of the file before the plan runs
+
+Every file is read once and decoded as strict UTF-8 and every edit is
+checked before anything is written; a single failed precondition aborts the
+whole plan. Changed files are then written in parallel (temp file +
+os.replace), keeping their BOM and line endings, and one combined unified
+diff is printed.
+
+Usage:
+    python scripts/source_patch.py plan.json [more.json ...] [--dry-run] [--workers 8]
+    python scripts/source_patch.py --hash app/(public)/layout.tsx ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from content_cli import run_tool, span
+
+ROOT = Path(".")
+ALLOWED_DIRS = ("app", "components", "data")
+BOM = "\ufeff"
+
+
+class PlanError(Exception):
+    pass
+
+
+def _loose_edge(whitespace: str) -> str:
+    """Pattern for the whitespace before/after a loose `find`: same line breaks, any indentation."""
+    return "\n".join(r"[^\S\n]*" if line else "" for line in whitespace.split("\n")) if whitespace else ""
+
+
+@dataclass
+class Edit:
+    file: str
+    replace: str
+    find: str | None = None
+    pattern: str | None = None
+    after: str | None = None
+    before: str | None = None
+    count: int = 1
+    whitespace: str = "exact"
+    sha1: str | None = None
+
+    @classmethod
+    def from_json(cls, raw: dict[str, Any]) -> "Edit":
+        unknown = set(raw) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise PlanError(f"unknown edit keys: {', '.join(sorted(unknown))}")
+        try:
+            edit = cls(**raw)
+        except TypeError as exc:
+            raise PlanError(f"invalid edit {raw!r}: {exc}") from exc
+        if (edit.find is None) == (edit.pattern is None):
+            raise PlanError(f"{edit.file}: an edit needs exactly one of 'find' or 'pattern'")
+        if edit.whitespace not in ("exact", "loose"):
+            raise PlanError(f"{edit.file}: whitespace must be 'exact' or 'loose'")
+        return edit
+
+    def regex(self) -> re.Pattern[str]:
+        if self.pattern is not None:
+            return re.compile(self.pattern, re.M)
+        if self.whitespace == "loose":
+            parts = [re.escape(part) for part in self.find.split()]
+            stripped = self.find.strip()
+            lead = self.find[: len(self.find) - len(self.find.lstrip())]
+            trail = self.find[len(self.find.rstrip()) :] if stripped else ""
+            return re.compile(_loose_edge(lead) + r"\s+".join(parts) + _loose_edge(trail))
+        return re.compile(re.escape(self.find))
+
+    def label(self) -> str:
+        target = self.find if self.find is not None else f"/{self.pattern}/"
+        target = " ".join(target.split())
+        return f"{self.file}: {target[:60]}{'...' if len(target) > 60 else ''}"
+
+
+@dataclass
+class FileResult:
+    path: Path
+    original: str
+    text: str
+    newline: str
+    bom: bool
+    applied: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return self.text != self.original
+
+
+def file_sha1(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def resolve(root: Path, name: str, allowed: Iterable[str] | None) -> Path:
+    path = (root / name).resolve()
+    base = root.resolve()
+    if not path.is_relative_to(base):
+        raise PlanError(f"{name}: outside {base}")
+    if allowed is not None and path.relative_to(base).parts[:1] not in [(entry,) for entry in allowed]:
+        raise PlanError(f"{name}: only files under {', '.join(allowed)} may be patched")
+    return path
+
+
+def load_plan(paths: Iterable[Path]) -> list[Edit]:
+    edits = []
+    for path in paths:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        entries = raw.get("edits") if isinstance(raw, dict) else raw
+        if not isinstance(entries, list):
+            raise PlanError(f"{path}: expected a list of edits or {{\"edits\": [...]}}")
+        edits.extend(Edit.from_json(entry) for entry in entries)
+    return edits
+
+
+def read_source(path: Path) -> FileResult:
+    with span("read", path.stat().st_size):
+        data = path.read_bytes()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise PlanError(f"{path}: not valid UTF-8 at byte {exc.start}") from exc
+    bom = text.startswith(BOM)
+    if bom:
+        text = text[1:]
+    newline = "\r\n" if text.count("\r\n") > text.count("\n") // 2 else "\n"
+    text = text.replace("\r\n", "\n")
+    return FileResult(path, text, text, newline, bom)
+
+
+def _scope(text: str, edit: Edit) -> tuple[int, int]:
+    start, end = 0, len(text)
+    if edit.after is not None:
+        found = text.find(edit.after)
+        if found < 0:
+            raise PlanError(f"anchor after={edit.after!r} not found")
+        start = found + len(edit.after)
+    if edit.before is not None:
+        found = text.find(edit.before, start)
+        if found < 0:
+            raise PlanError(f"anchor before={edit.before!r} not found")
+        end = found
+    return start, end
+
+
+def apply_edit(text: str, edit: Edit) -> str:
+    start, end = _scope(text, edit)
+    region = text[start:end]
+    regex = edit.regex()
+    found = sum(1 for _ in regex.finditer(region))
+    if found == 0 or (edit.count and found != edit.count):
+        expected = "at least 1" if not edit.count else str(edit.count)
+        raise PlanError(f"expected {expected} match(es), found {found}")
+    replace = edit.replace.replace("\r\n", "\n")
+    if edit.find is not None:
+        region = regex.sub(lambda _: replace, region)
+    else:
+        region = regex.sub(replace, region)
+    return text[:start] + region + text[end:]
+
+
+def prepare(edits: list[Edit], root: Path, allowed: Iterable[str] | None = ALLOWED_DIRS) -> list[FileResult]:
+    """Run every edit in memory; raise PlanError listing all failures if any edit does not apply."""
+    by_file: dict[Path, list[Edit]] = {}
+    errors: list[str] = []
+    for edit in edits:
+        try:
+            by_file.setdefault(resolve(root, edit.file, allowed), []).append(edit)
+        except PlanError as exc:
+            errors.append(str(exc))
+    results = []
+    for path, file_edits in by_file.items():
+        if not path.exists():
+            errors.append(f"{path}: file not found")
+            continue
+        digest = file_sha1(path)
+        for edit in file_edits:
+            if edit.sha1 and edit.sha1 != digest:
+                errors.append(f"{edit.label()}: sha1 {digest} does not match plan ({edit.sha1})")
+        try:
+            result = read_source(path)
+        except PlanError as exc:
+            errors.append(str(exc))
+            continue
+        with span("transform", len(result.original)):
+            for edit in file_edits:
+                try:
+                    result.text = apply_edit(result.text, edit)
+                    result.applied += 1
+                except (PlanError, re.error) as exc:
+                    errors.append(f"{edit.label()}: {exc}")
+        results.append(result)
+    if errors:
+        raise PlanError("\n".join(errors))
+    return results
+
+
+def write_atomic(result: FileResult) -> Path:
+    text = result.text.replace("\n", result.newline)
+    if result.bom:
+        text = BOM + text
+    fd, tmp = tempfile.mkstemp(dir=result.path.parent, prefix=f".{result.path.name}.", suffix=".tmp")
+    try:
+        with span("write", len(text)), os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+            handle.write(text)
+        shutil.copymode(result.path, tmp)
+        os.replace(tmp, result.path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return result.path
+
+
+def combined_diff(results: Iterable[FileResult], root: Path) -> str:
+    chunks = []
+    for result in results:
+        if not result.changed:
+            continue
+        name = result.path.relative_to(root.resolve()).as_posix()
+        chunks.extend(
+            difflib.unified_diff(
+                result.original.splitlines(keepends=True),
+                result.text.splitlines(keepends=True),
+                fromfile=f"a/{name}",
+                tofile=f"b/{name}",
+            )
+        )
+    return "".join(chunks)
+
+
+def apply_plan(
+    edits: list[Edit],
+    root: Path = ROOT,
+    dry_run: bool = False,
+    workers: int = 8,
+    allowed: Iterable[str] | None = ALLOWED_DIRS,
+) -> list[FileResult]:
+    results = prepare(edits, root, allowed)
+    changed = [result for result in results if result.changed]
+    if not dry_run and changed:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            list(pool.map(write_atomic, changed))
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Apply a JSON plan of anchored/regex source edits")
+    parser.add_argument("plans", nargs="*", type=Path, help="plan files ({\"edits\": [...]})")
+    parser.add_argument("--root", type=Path, default=ROOT)
+    parser.add_argument("--dry-run", action="store_true", help="check the plan and print the diff only")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--any-path", action="store_true", help=f"allow files outside {', '.join(ALLOWED_DIRS)}")
+    parser.add_argument("--hash", nargs="+", type=Path, metavar="FILE", help="print sha1 preconditions for files")
+    args = parser.parse_args(argv)
+
+    if args.hash:
+        for path in args.hash:
+            print(f"{file_sha1(path)}  {path.as_posix()}")
+        return
+    if not args.plans:
+        parser.error("at least one plan file is required")
+
+    try:
+        edits = load_plan(args.plans)
+        results = apply_plan(
+            edits, args.root, args.dry_run, args.workers, None if args.any_path else ALLOWED_DIRS
+        )
+    except PlanError as exc:
+        print(f"plan not applied:\n{exc}", file=sys.stderr)
+        raise SystemExit(1)
+
+    sys.stdout.write(combined_diff(results, args.root))
+    changed = sum(result.changed for result in results)
+    verb = "would change" if args.dry_run else "changed"
+    print(f"{len(edits)} edits, {verb} {changed} of {len(results)} files")
+
+
+if __name__ == "__main__":
+    run_tool(main)
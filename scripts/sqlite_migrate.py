@@ -0,0 +1,264 @@
+"""Versioned, transactional schema sync for local SQLite snapshots (prisma/dev.db).
+
+The Prisma schema is parsed for scalar fields (honouring @map/@@map), the
+database is inspected once (sqlite_master + PRAGMA table_info), and only the
+missing tables/columns are emitted. The whole plan runs in a single
+transaction in WAL mode and is recorded in `_content_migrations`.
+
+SQLite cannot ADD COLUMN a NOT NULL column without a constant default, so
+such columns (and `now()` defaults) are added as nullable, matching what the
+old add_booking_columns.py did.
+
+Usage:
+    python scripts/sqlite_migrate.py [--db prisma/dev.db] [--model Booking ...] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+from content_cli import read_text, run_tool, span
+
+DB_PATH = Path("prisma/dev.db")
+SCHEMA_PATH = Path("prisma/schema.prisma")
+VERSION_TABLE = "_content_migrations"
+
+SCALAR_TYPES = {
+    "String": "TEXT",
+    "Int": "INTEGER",
+    "BigInt": "INTEGER",
+    "Float": "REAL",
+    "Decimal": "DECIMAL",
+    "Boolean": "BOOLEAN",
+    "DateTime": "DATETIME",
+    "Json": "TEXT",
+    "Bytes": "BLOB",
+}
+
+BLOCK = re.compile(r"^(model|enum)\s+(\w+)\s*\{(.*?)^\}", re.S | re.M)
+FIELD = re.compile(r"^\s*(\w+)\s+(\w+)(\[\])?(\?)?(.*)$")
+MAP_ATTR = re.compile(r"@map\(\s*\"([^\"]+)\"\s*\)")
+TABLE_MAP = re.compile(r"@@map\(\s*\"([^\"]+)\"\s*\)")
+DEFAULT_ATTR = re.compile(r"@default\((.*?)\)(?=\s*(?:@|$))")
+
+
+@dataclass
+class Column:
+    name: str
+    sql_type: str
+    nullable: bool
+    default: str | None = None
+    primary_key: bool = False
+
+    def definition(self, for_alter: bool = False) -> str:
+        parts = [_quote(self.name), self.sql_type]
+        if self.primary_key and not for_alter:
+            parts.append("PRIMARY KEY")
+        default = self.default
+        if for_alter and default == "CURRENT_TIMESTAMP":
+            default = None
+        if not self.nullable and (not for_alter or default is not None):
+            parts.append("NOT NULL")
+        if default is not None:
+            parts.append(f"DEFAULT {default}")
+        return " ".join(parts)
+
+
+@dataclass
+class Model:
+    name: str
+    table: str
+    columns: list[Column] = field(default_factory=list)
+
+
+@dataclass
+class Plan:
+    statements: list[str] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def version(self) -> str:
+        return hashlib.sha1("\n".join(self.statements).encode("utf-8")).hexdigest()[:12]
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _sql_default(raw: str, prisma_type: str, enums: set[str]) -> str | None:
+    raw = raw.strip()
+    if raw in ("cuid()", "uuid()", "autoincrement()", "dbgenerated()") or raw.startswith("dbgenerated("):
+        return None
+    if raw == "now()":
+        return "CURRENT_TIMESTAMP"
+    if raw in ("true", "false"):
+        return "1" if raw == "true" else "0"
+    if raw.startswith('"'):
+        return "'" + raw[1:-1].replace("'", "''") + "'"
+    if prisma_type in enums:
+        return f"'{raw}'"
+    if re.fullmatch(r"-?\d+(\.\d+)?", raw):
+        return raw
+    return None
+
+
+def parse_schema(text: str) -> dict[str, Model]:
+    blocks = BLOCK.findall(text)
+    enums = {name for kind, name, _ in blocks if kind == "enum"}
+    models: dict[str, Model] = {}
+    for kind, name, body in blocks:
+        if kind != "model":
+            continue
+        table = TABLE_MAP.search(body)
+        model = Model(name=name, table=table.group(1) if table else name)
+        for line in body.splitlines():
+            line = line.split("//", 1)[0].rstrip()
+            match = FIELD.match(line)
+            if not match:
+                continue
+            field_name, prisma_type, is_list, optional, attrs = match.groups()
+            if is_list or "@relation" in attrs:
+                continue
+            if prisma_type in SCALAR_TYPES:
+                sql_type = SCALAR_TYPES[prisma_type]
+            elif prisma_type in enums:
+                sql_type = "TEXT"
+            else:
+                continue
+            column_map = MAP_ATTR.search(attrs)
+            default = DEFAULT_ATTR.search(attrs)
+            model.columns.append(
+                Column(
+                    name=column_map.group(1) if column_map else field_name,
+                    sql_type=sql_type,
+                    nullable=bool(optional),
+                    default=_sql_default(default.group(1), prisma_type, enums) if default else None,
+                    primary_key="@id" in attrs.split(),
+                )
+            )
+        models[name] = model
+    return models
+
+
+def inspect_database(conn: sqlite3.Connection) -> dict[str, set[str]]:
+    tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    return {table: {row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")} for table in tables}
+
+
+def plan_migration(models: Iterable[Model], existing: dict[str, set[str]]) -> Plan:
+    plan = Plan()
+    for model in models:
+        present = existing.get(model.table)
+        if present is None:
+            columns = ",\n  ".join(column.definition() for column in model.columns)
+            plan.statements.append(f"CREATE TABLE {_quote(model.table)} (\n  {columns}\n)")
+            continue
+        for column in model.columns:
+            if column.name in present:
+                continue
+            definition = column.definition(for_alter=True)
+            if not column.nullable and "NOT NULL" not in definition:
+                plan.notes.append(f"{model.table}.{column.name} added as nullable (SQLite needs a constant default)")
+            plan.statements.append(f"ALTER TABLE {_quote(model.table)} ADD COLUMN {definition}")
+    return plan
+
+
+def connect(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
+    if read_only:
+        return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True, isolation_level=None)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def apply_plan(conn: sqlite3.Connection, plan: Plan) -> None:
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} "
+        "(version TEXT PRIMARY KEY, appliedAt TEXT NOT NULL, statementCount INTEGER NOT NULL, statements TEXT NOT NULL)"
+    )
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for statement in plan.statements:
+            conn.execute(statement)
+        conn.execute(
+            f"INSERT OR REPLACE INTO {VERSION_TABLE} VALUES (?, ?, ?, ?)",
+            (
+                plan.version,
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                len(plan.statements),
+                ";\n".join(plan.statements),
+            ),
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate(
+    db_path: Path = DB_PATH,
+    schema_path: Path = SCHEMA_PATH,
+    model_names: Iterable[str] | None = None,
+    dry_run: bool = False,
+) -> Plan:
+    schema = read_text(schema_path)
+    with span("parse", len(schema)):
+        models = parse_schema(schema)
+    if model_names:
+        unknown = [name for name in model_names if name not in models]
+        if unknown:
+            raise SystemExit(f"Unknown models in {schema_path}: {', '.join(unknown)}")
+        selected = [models[name] for name in model_names]
+    else:
+        selected = list(models.values())
+    if not db_path.exists():
+        if dry_run:
+            with span("transform"):
+                return plan_migration(selected, {})
+        # connect() would create an empty database and report the new tables as applied.
+        raise SystemExit(f"{db_path} not found")
+    conn = connect(db_path, read_only=dry_run)
+    try:
+        with span("read"):
+            existing = inspect_database(conn)
+        with span("transform"):
+            plan = plan_migration(selected, existing)
+        if plan.statements and not dry_run:
+            with span("write"):
+                apply_plan(conn, plan)
+    finally:
+        conn.close()
+    return plan
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bring a local SQLite snapshot in line with schema.prisma")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("--schema", type=Path, default=SCHEMA_PATH)
+    parser.add_argument("--model", action="append", help="limit to these Prisma models (default: all)")
+    parser.add_argument("--dry-run", action="store_true", help="print the plan without applying it")
+    args = parser.parse_args(argv)
+
+    plan = migrate(args.db, args.schema, args.model, dry_run=args.dry_run)
+    for statement in plan.statements:
+        print(statement + ";")
+    for note in plan.notes:
+        print(f"-- {note}")
+    if not plan.statements:
+        print("Schema already up to date")
+    elif args.dry_run:
+        print(f"-- dry run: {len(plan.statements)} statements (version {plan.version}) not applied")
+    else:
+        print(f"-- applied {len(plan.statements)} statements as version {plan.version}")
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,6 @@
+"""The content tools import each other as flat modules from scripts/."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
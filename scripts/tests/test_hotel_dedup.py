@@ -0,0 +1,31 @@
+import pytest
+
+from hotel_dedup import Hotel, tokenize, verify
+
+
+def hotel(name: str) -> Hotel:
+    return Hotel(name, "ZONA_PC_BAVARO", tokenize(name))
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ("Hard Rock Hotel", "Hard Rock Hotel Punta Cana"),
+        ("Vista Sol Punta Cana", "Vista Sol Punta Cana Beach"),
+        ("Secrets Royal Beach", "Secrets Royal Beach Punta Cana All Inclusive"),
+    ],
+)
+def test_place_and_generic_suffixes_are_duplicates(left: str, right: str) -> None:
+    match = verify(hotel(left), hotel(right), threshold=0.7)
+    assert match is not None and match.reason == "contained"
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ("Royalton Punta Cana", "Royalton Chic Punta Cana"),
+        ("Punta Cana", "Punta Cana Beach"),
+    ],
+)
+def test_sibling_properties_are_not_duplicates(left: str, right: str) -> None:
+    assert verify(hotel(left), hotel(right), threshold=0.7) is None
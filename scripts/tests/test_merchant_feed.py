@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+from merchant_feed import validate_feed, validate_row
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.parametrize("name", ["merchant_center_feed.tsv", "merchant_center_feed_one_product.tsv"])
+def test_shipped_feeds_validate(name: str) -> None:
+    report = validate_feed(ROOT / name)
+    assert report.written
+    assert not report.missing_columns
+    assert not report.invalid
+    assert not report.duplicates
+
+
+@pytest.mark.parametrize("value", ["in stock", "in_stock", "out_of_stock", "backorder"])
+def test_availability_spellings(value: str) -> None:
+    assert validate_row({"availability": value}) == []
+
+
+def test_unknown_availability() -> None:
+    assert validate_row({"availability": "sold out"}) == ["availability 'sold out' not allowed"]
@@ -0,0 +1,26 @@
+from source_patch import Edit, apply_edit
+
+FIND = "      {/* Footer */}\n      <footer>\n        <p>old</p>\n      </footer>\n"
+REPLACE = "      <footer>\n        <p>new</p>\n      </footer>\n"
+
+
+def layout(footer: str) -> str:
+    return "    <main>\n" + footer + "    </main>\n"
+
+
+def test_loose_find_replaces_whole_lines() -> None:
+    text = layout(FIND)
+    edit = Edit(file="app/layout.tsx", find=FIND, replace=REPLACE, whitespace="loose")
+    assert apply_edit(text, edit) == layout(REPLACE)
+
+
+def test_loose_find_absorbs_indentation_drift() -> None:
+    drifted = "  {/* Footer */}\n  <footer>\n      <p>old</p>\n  </footer>\n"
+    edit = Edit(file="app/layout.tsx", find=FIND, replace=REPLACE, whitespace="loose")
+    assert apply_edit(layout(drifted), edit) == layout(REPLACE)
+
+
+def test_loose_find_keeps_following_blank_line() -> None:
+    text = layout(FIND + "\n")
+    edit = Edit(file="app/layout.tsx", find=FIND, replace=REPLACE, whitespace="loose")
+    assert apply_edit(text, edit) == layout(REPLACE + "\n")
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from sqlite_migrate import migrate
+
+SCHEMA = """
+model Booking {
+  id        String   @id @default(cuid())
+  status    String   @default("PENDING")
+  createdAt DateTime @default(now())
+}
+"""
+
+
+@pytest.fixture
+def schema(tmp_path: Path) -> Path:
+    path = tmp_path / "schema.prisma"
+    path.write_text(SCHEMA, encoding="utf-8")
+    return path
+
+
+def test_missing_database_is_not_created(tmp_path: Path, schema: Path) -> None:
+    db = tmp_path / "dev.db"
+    with pytest.raises(SystemExit, match="dev.db not found"):
+        migrate(db, schema, ["Booking"])
+    assert not db.exists()
+
+
+def test_dry_run_without_database_plans_every_table(tmp_path: Path, schema: Path) -> None:
+    plan = migrate(tmp_path / "dev.db", schema, dry_run=True)
+    assert [statement.split("(")[0].strip() for statement in plan.statements] == ['CREATE TABLE "Booking"']
+    assert not (tmp_path / "dev.db").exists()
@@ -0,0 +1,354 @@
+"""Compile transfer prices into dense lookup arrays and audit them.
+
+Two sources, two tables:
+
+  * data/traslado-pricing.ts -> zone x zone x VehicleCategory. Every cell is
+    resolved exactly like getTransferPrice(): base vehicle (VIP/BUS use SUV),
+    direct rate, DEFAULT_ZONE_ID fallbacks, then CATEGORY_MARKUPS.
+  * prisma/dev.db -> airport x location x vehicle, from TransferRoutePrice
+    (zone-level, either direction) with TransferRoutePriceOverride layered on
+    top (lowest override wins, like the hotel pages' findFirst/orderBy price).
+
+Both are checked for asymmetric routes, missing prices and outliers (price
+ratio to the cheapest category far from the median ratio, or a larger
+vehicle priced below a smaller one) and exported to one compressed .npz, so
+a quote is `table[i, j, k]` after a dict lookup per axis.
+
+Needs numpy (see scripts/requirements.txt).
+
+Usage:
+    python scripts/transfer_price_matrix.py [--pricing data/traslado-pricing.ts] [--db prisma/dev.db]
+        [--output .cache/content-tools/transfer-prices.npz] [--json prices.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sqlite3
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from content_cli import read_text, run_tool, span, write_text
+from sqlite_migrate import DB_PATH, connect
+from ts_literals import parse_declarations
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - reported by main()
+    np = None
+
+PRICING_PATH = Path("data/traslado-pricing.ts")
+OUTPUT_PATH = Path(".cache/content-tools/transfer-prices.npz")
+CATEGORY_TYPE = re.compile(r"type\s+VehicleCategory\s*=\s*([^;]+);")
+BASE_VEHICLE = re.compile(r"if\s*\(([^)]*)\)\s*return\s*\"(\w+)\"")
+DEFAULT_ZONE = re.compile(r"DEFAULT_ZONE_ID\s*=\s*\"(\w+)\"")
+OUTLIER_Z = 3.5
+
+
+@dataclass
+class PriceTable:
+    """Dense price array with a name -> index map per axis; NaN marks 'no price'."""
+
+    axes: tuple[str, str, str]
+    labels: tuple[list[str], list[str], list[str]]
+    values: np.ndarray
+    positions: tuple[dict[str, int], ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.positions = tuple({label: i for i, label in enumerate(labels)} for labels in self.labels)
+
+    def price(self, first: str, second: str, third: str) -> float | None:
+        i, j, k = (positions.get(label) for positions, label in zip(self.positions, (first, second, third)))
+        if i is None or j is None or k is None:
+            return None
+        value = self.values[i, j, k]
+        return None if np.isnan(value) else float(value)
+
+    def cell(self, index: tuple[int, int, int]) -> str:
+        return " / ".join(labels[position] for labels, position in zip(self.labels, index))
+
+
+def load_static_table(path: Path = PRICING_PATH) -> tuple[PriceTable, PriceTable]:
+    """Return (raw rates, prices resolved like getTransferPrice) for the TS pricing module."""
+    text = read_text(path)
+    declarations = parse_declarations(text)
+    categories = re.findall(r"\"(\w+)\"", CATEGORY_TYPE.search(text).group(1))
+    nodes = declarations["trasladoPricing"]["nodes"]
+    zones = [node["id"] for node in nodes]
+    zone_index = {zone: i for i, zone in enumerate(zones)}
+    category_index = {category: i for i, category in enumerate(categories)}
+
+    raw = np.full((len(zones), len(zones), len(categories)), np.nan, dtype=np.float32)
+    for node in nodes:
+        for destination, rates in node["transfers"].items():
+            if destination not in zone_index:
+                continue
+            for category, price in rates.items():
+                raw[zone_index[node["id"]], zone_index[destination], category_index[category]] = price
+
+    base = np.arange(len(categories))
+    for condition, target in BASE_VEHICLE.findall(text):
+        for category in re.findall(r"\"(\w+)\"", condition):
+            base[category_index[category]] = category_index[target]
+    markups = declarations.get("CATEGORY_MARKUPS") or {}
+    markup = np.array([markups.get(category, 0) for category in categories], dtype=np.float32)
+    default = zone_index[DEFAULT_ZONE.search(text).group(1)]
+
+    direct = raw[:, :, base]
+    fallback = np.broadcast_to(raw[default, :, base.tolist()].T[np.newaxis], direct.shape)
+    default_rate = np.broadcast_to(raw[default, default, base], direct.shape)
+    resolved = np.where(~np.isnan(direct), direct, np.where(~np.isnan(fallback), fallback, default_rate))
+    resolved = np.where(np.isnan(resolved), 0, resolved + markup)
+
+    # Only base categories carry their own rates; the others are derived and would always look missing.
+    priced = sorted(set(base.tolist()))
+    axes = ("origin", "destination", "category")
+    return (
+        PriceTable(axes, (zones, zones, [categories[i] for i in priced]), raw[:, :, priced]),
+        PriceTable(axes, (zones, zones, categories), resolved.astype(np.float32)),
+    )
+
+
+ROUTE_PRICES = """
+    SELECT r.zoneAId, r.zoneBId, p.vehicleId, p.price
+    FROM TransferRoutePrice p
+    JOIN TransferRoute r ON r.id = p.routeId
+    JOIN TransferVehicle v ON v.id = p.vehicleId
+    WHERE r.active = 1 AND v.active = 1
+"""
+OVERRIDES = """
+    SELECT r.zoneAId, r.zoneBId, o.vehicleId, o.originLocationId, o.destinationLocationId, o.price
+    FROM TransferRoutePriceOverride o
+    JOIN TransferRoute r ON r.id = o.routeId
+    JOIN TransferVehicle v ON v.id = o.vehicleId
+    WHERE r.active = 1 AND v.active = 1
+"""
+
+
+@dataclass
+class DatabaseTables:
+    zones: PriceTable
+    quotes: PriceTable
+    skipped_overrides: int = 0
+
+
+def load_database_tables(conn: sqlite3.Connection) -> DatabaseTables:
+    zones = [row[0] for row in conn.execute("SELECT id FROM TransferZoneV2 ORDER BY slug")]
+    vehicles = [row[0] for row in conn.execute("SELECT id FROM TransferVehicle WHERE active = 1 ORDER BY category, maxPax")]
+    locations = conn.execute("SELECT id, zoneId, type = 'AIRPORT' FROM TransferLocation WHERE active = 1 ORDER BY id").fetchall()
+    zone_index = {zone: i for i, zone in enumerate(zones)}
+    vehicle_index = {vehicle: i for i, vehicle in enumerate(vehicles)}
+    location_ids = [row[0] for row in locations]
+    location_index = {location: i for i, location in enumerate(location_ids)}
+    location_zone = np.array([zone_index.get(row[1], -1) for row in locations], dtype=np.int64)
+    airports = np.array([i for i, row in enumerate(locations) if row[2]], dtype=np.int64)
+    airport_index = {int(location): i for i, location in enumerate(airports)}
+
+    route_rows = conn.execute(ROUTE_PRICES).fetchall()
+    zone_prices = np.full((len(zones), len(zones), len(vehicles)), np.nan, dtype=np.float32)
+    if route_rows:
+        a = np.array([zone_index[row[0]] for row in route_rows])
+        b = np.array([zone_index[row[1]] for row in route_rows])
+        v = np.array([vehicle_index[row[2]] for row in route_rows])
+        price = np.array([row[3] for row in route_rows], dtype=np.float32)
+        zone_prices[a, b, v] = price
+        # Routes are unordered zone pairs (the app looks up both directions); a route stored in both
+        # orders keeps both prices so asymmetric() can report the conflict.
+        zone_prices = np.where(np.isnan(zone_prices), zone_prices.transpose(1, 0, 2), zone_prices)
+
+    # Base quote for every airport -> location pair, read off the zone matrix in one gather.
+    origin_zone = location_zone[airports][:, np.newaxis]
+    destination_zone = location_zone[np.newaxis, :]
+    valid = (origin_zone >= 0) & (destination_zone >= 0)
+    quotes = np.where(
+        valid[..., np.newaxis], zone_prices[np.maximum(origin_zone, 0), np.maximum(destination_zone, 0)], np.nan
+    ).astype(np.float32)
+
+    # Overrides are collected into a NaN layer with fmin.at (lowest wins), then merged in a single where().
+    layer = np.full_like(quotes, np.nan)
+    skipped = 0
+    exact: list[tuple[int, int, int, float]] = []
+    to_location: list[tuple[int, int, int, float]] = []  # (location, other zone, vehicle, price)
+    from_airport: list[tuple[int, int, int, float]] = []  # (airport row, other zone, vehicle, price)
+    route_level: list[tuple[int, int, int, float]] = []
+    for zone_a, zone_b, vehicle_id, origin_id, destination_id, price in conn.execute(OVERRIDES):
+        vehicle = vehicle_index[vehicle_id]
+        ends = [location_index.get(origin_id), location_index.get(destination_id)]
+        pinned = [location for location in ends if location is not None]
+        airport_rows = [airport_index[location] for location in pinned if location in airport_index]
+        others = [location for location in pinned if location not in airport_index]
+        if not pinned:
+            route_level.append((zone_index[zone_a], zone_index[zone_b], vehicle, price))
+        elif len(pinned) == 2 and len(airport_rows) == 1 and len(others) == 1:
+            exact.append((airport_rows[0], others[0], vehicle, price))
+        elif len(pinned) == 1 and others:
+            pinned_zone = location_zone[others[0]]
+            other = zone_index[zone_a] if pinned_zone == zone_index[zone_b] else zone_index[zone_b]
+            to_location.append((others[0], other, vehicle, price))
+        elif len(pinned) == 1 and airport_rows:
+            pinned_zone = location_zone[pinned[0]]
+            other = zone_index[zone_a] if pinned_zone == zone_index[zone_b] else zone_index[zone_b]
+            from_airport.append((airport_rows[0], other, vehicle, price))
+        else:
+            skipped += 1  # location-to-location pairs without an airport are not in the quote table
+
+    if route_level:
+        a, b, v, price = (np.array(column) for column in zip(*route_level))
+        route_mask = ((origin_zone[..., np.newaxis] == a) & (destination_zone[..., np.newaxis] == b)) | (
+            (origin_zone[..., np.newaxis] == b) & (destination_zone[..., np.newaxis] == a)
+        )  # airports x locations x overrides
+        airport_row, location, override = np.nonzero(route_mask)
+        np.fmin.at(layer, (airport_row, location, v[override]), price[override].astype(np.float32))
+    if exact:
+        airport_row, location, v, price = (np.array(column) for column in zip(*exact))
+        np.fmin.at(layer, (airport_row, location, v), price.astype(np.float32))
+    if to_location:
+        location, other, v, price = (np.array(column) for column in zip(*to_location))
+        values = np.where(location_zone[airports][:, np.newaxis] == other, price, np.nan).astype(np.float32)
+        np.fmin.at(layer, (slice(None), location, v), values)
+    if from_airport:
+        airport_row, other, v, price = (np.array(column) for column in zip(*from_airport))
+        values = np.where(location_zone[np.newaxis, :] == other[:, np.newaxis], price[:, np.newaxis], np.nan)
+        np.fmin.at(layer, (airport_row[:, np.newaxis], np.arange(len(location_ids)), v[:, np.newaxis]), values.astype(np.float32))
+    quotes = np.where(np.isnan(layer), quotes, layer)
+
+    return DatabaseTables(
+        zones=PriceTable(("zoneA", "zoneB", "vehicle"), (zones, zones, vehicles), zone_prices),
+        quotes=PriceTable(("airport", "location", "vehicle"), ([location_ids[i] for i in airports], location_ids, vehicles), quotes),
+        skipped_overrides=skipped,
+    )
+
+
+def asymmetric(table: PriceTable) -> list[str]:
+    values = table.values
+    mismatch = ~np.isnan(values) & ~np.isnan(values.transpose(1, 0, 2)) & (values != values.transpose(1, 0, 2))
+    i, j, k = np.nonzero(np.triu(np.ones(values.shape[:2], dtype=bool), 1)[..., np.newaxis] & mismatch)
+    return [f"{table.cell((a, b, c))}: {values[a, b, c]:g} vs {values[b, a, c]:g}" for a, b, c in zip(i, j, k)]
+
+
+def missing(table: PriceTable, routes_only: bool = False) -> list[str]:
+    """Pairs lacking a price for some vehicle (the app then falls back to another rate).
+
+    With `routes_only` the table is treated as unordered routes: only pairs
+    priced for at least one vehicle are checked, each once.
+    """
+    absent = np.isnan(table.values)
+    gaps = absent.any(axis=2)
+    if routes_only:
+        gaps &= ~absent.all(axis=2) & np.triu(np.ones(gaps.shape, dtype=bool))
+    lines = []
+    for a, b in zip(*np.nonzero(gaps)):
+        vehicles = [table.labels[2][c] for c in np.nonzero(absent[a, b])[0]]
+        lines.append(f"{table.labels[0][a]} / {table.labels[1][b]}: {', '.join(vehicles)}")
+    return lines
+
+
+def outliers(table: PriceTable, z_limit: float = OUTLIER_Z) -> list[str]:
+    """Per vehicle, log price ratio to the pair's cheapest vehicle compared with the median ratio (MAD z-score).
+
+    Same-zone trips are left out of the statistics when both axes are zones:
+    short hops are priced with a different ratio on purpose.
+    """
+    values = table.values.astype(np.float64)
+    if table.labels[0] == table.labels[1]:
+        values[np.arange(values.shape[0]), np.arange(values.shape[0])] = np.nan
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        cheapest = np.nanmin(np.where(values > 0, values, np.nan), axis=2, keepdims=True)
+        ratio = np.log(values / cheapest)
+        median = np.nanmedian(ratio, axis=(0, 1), keepdims=True)
+        mad = np.nanmedian(np.abs(ratio - median), axis=(0, 1), keepdims=True)
+        score = 0.6745 * (ratio - median) / np.where(mad > 0, mad, np.nan)
+    flagged = [f"{table.cell((a, b, c))}: {values[a, b, c]:g} (z={score[a, b, c]:.1f})" for a, b, c in zip(*np.nonzero(np.abs(score) > z_limit))]
+    # Categories come in capacity order, so a bigger vehicle should not be cheaper.
+    if table.axes[2] == "category":
+        drops = np.diff(values, axis=2) < 0
+        flagged += [
+            f"{table.cell((a, b, c + 1))}: {values[a, b, c + 1]:g} below {table.labels[2][c]} {values[a, b, c]:g}"
+            for a, b, c in zip(*np.nonzero(drops))
+        ]
+    return flagged
+
+
+def export(path: Path, tables: dict[str, PriceTable]) -> None:
+    arrays: dict[str, np.ndarray] = {}
+    for name, table in tables.items():
+        arrays[name] = table.values.astype(np.float32)
+        for axis, labels in zip(table.axes, table.labels):
+            arrays[f"{name}__{axis}"] = np.array(labels, dtype=str)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.stem + ".tmp.npz")
+    with span("write") as writing:
+        np.savez_compressed(tmp, **arrays)
+        writing.add(tmp.stat().st_size)
+        tmp.replace(path)
+
+
+def load_export(path: Path) -> dict[str, PriceTable]:
+    with np.load(path) as data:
+        names = [name for name in data.files if "__" not in name]
+        tables = {}
+        for name in names:
+            axes = [key.split("__", 1)[1] for key in data.files if key.startswith(f"{name}__")]
+            tables[name] = PriceTable(tuple(axes), tuple(data[f"{name}__{axis}"].tolist() for axis in axes), data[name])
+    return tables
+
+
+def to_json(table: PriceTable) -> dict[str, object]:
+    values = np.where(np.isnan(table.values), -1, np.round(table.values, 2))
+    return {"axes": dict(zip(table.axes, table.labels)), "missing": -1, "values": values.tolist()}
+
+
+def report(label: str, lines: list[str], limit: int) -> None:
+    print(f"{label}: {len(lines)}")
+    for line in lines[:limit]:
+        print(f"  {line}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile transfer prices into dense lookup tables")
+    parser.add_argument("--pricing", type=Path, default=PRICING_PATH)
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--json", type=Path, help="also write the resolved static table as JSON")
+    parser.add_argument("--limit", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    if np is None:
+        raise SystemExit("numpy is required: pip install -r scripts/requirements.txt")
+    raw, resolved = load_static_table(args.pricing)
+    tables = {"static": resolved}
+    print(f"static: {len(raw.labels[0])} zones x {len(raw.labels[2])} categories")
+    report("  asymmetric", asymmetric(raw), args.limit)
+    report("  missing", missing(raw), args.limit)
+    report("  outliers", outliers(raw), args.limit)
+
+    if args.db.exists():
+        conn = connect(args.db, read_only=True)
+        try:
+            with span("read"):
+                database = load_database_tables(conn)
+        finally:
+            conn.close()
+        tables.update(zones=database.zones, quotes=database.quotes)
+        shape = database.quotes.values.shape
+        print(f"database: {shape[0]} airports x {shape[1]} locations x {shape[2]} vehicles")
+        report("  asymmetric", asymmetric(database.zones), args.limit)
+        report("  missing", missing(database.zones, routes_only=True), args.limit)
+        report("  outliers", outliers(database.zones), args.limit)
+        if database.skipped_overrides:
+            print(f"  {database.skipped_overrides} overrides between two non-airport locations left out of the quote table")
+    else:
+        print(f"database: {args.db} not found, only the static table is compiled")
+
+    export(args.output, tables)
+    if args.json:
+        write_text(args.json, json.dumps(to_json(resolved), separators=(",", ":")) + "\n")
+    print(args.output)
+
+
+if __name__ == "__main__":
+    run_tool(main)
@@ -0,0 +1,278 @@
+"""Tolerant reader for the object/array literals in our TS data modules.
+
+`parse_declarations(text)` returns {name: value} for every top-level
+`const|let|var NAME = <literal>`: objects become dicts, arrays lists, string
+and template literals str (template `${...}` parts are kept verbatim),
+numbers/booleans/null their Python values. Anything that needs evaluating
+(function calls, arrow functions, identifiers, `.map(...)`) becomes
+`UNKNOWN`, so callers can still walk the literal parts around it.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from content_cli import span
+
+UNKNOWN = object()
+
+# Lexical pieces shared with landing_index, which scans raw bytes with its own token set.
+COMMENT = r"//[^\n]*|/\*.*?\*/"
+STRING = r""""(?:[^"\\\n]++|\\.)*+"|'(?:[^'\\\n]++|\\.)*+'"""
+TEMPLATE = r"`(?:[^`\\]++|\\.)*+`"
+_PLACEHOLDER = re.compile(r"\$\{\s*([^}]*?)\s*\}")
+_CALL = re.compile(r"([A-Za-z_$][\w$]*)\(\s*([A-Za-z_$][\w$]*)\s*\)")
+
+_TOKEN = re.compile(
+    rf"""
+    (?P<skip>\s+|{COMMENT})
+  | (?P<string>{STRING})
+  | (?P<template>{TEMPLATE})
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*+)
+  | (?P<spread>\.\.\.)
+  | (?P<arrow>=>)
+  | (?P<punct>[{{}}\[\](),:;=<>?|&.!+*/%-])
+    """,
+    re.S | re.X,
+)
+_OPEN = {"{": "}", "[": "]", "(": ")"}
+_CLOSE = set(_OPEN.values())
+_KEYWORDS = {"true": True, "false": False, "null": None, "undefined": None}
+
+
+def unquote(raw: str) -> str:
+    body = raw[1:-1]
+    if "\\" not in body:
+        return body
+    if raw[0] == "'":
+        body = body.replace("\\'", "'").replace('"', '\\"')
+    try:
+        return json.loads(f'"{body}"')
+    except ValueError:
+        return body
+
+
+def tokenize(text: str) -> list[tuple[str, str, int]]:
+    return [
+        (match.lastgroup, match.group(), match.start())
+        for match in _TOKEN.finditer(text)
+        if match.lastgroup != "skip"
+    ]
+
+
+class _Parser:
+    def __init__(self, tokens: list[tuple[str, str, int]]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> tuple[str, str, int] | None:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def value_is(self, text: str, offset: int = 0) -> bool:
+        token = self.peek(offset)
+        return token is not None and token[1] == text
+
+    def skip_until(self, stops: set[str], angle: bool = False) -> None:
+        """Advance to the next stop token at bracket depth 0 (counting <> for types)."""
+        depth = 0
+        while (token := self.peek()) is not None:
+            value = token[1]
+            if depth == 0 and value in stops:
+                return
+            if value in _OPEN or (angle and value == "<"):
+                depth += 1
+            elif value in _CLOSE or (angle and value == ">"):
+                if depth == 0:
+                    return
+                depth -= 1
+            self.pos += 1
+
+    def parse_value(self) -> Any:
+        token = self.peek()
+        if token is None:
+            return UNKNOWN
+        kind, value, _ = token
+        result: Any = UNKNOWN
+        if value == "{" and kind == "punct":
+            result = self.parse_object()
+        elif value == "[":
+            result = self.parse_array()
+        elif kind == "string":
+            self.pos += 1
+            result = unquote(value)
+        elif kind == "template":
+            self.pos += 1
+            result = value[1:-1]
+        elif kind == "number":
+            self.pos += 1
+            result = float(value) if "." in value else int(value)
+        elif kind == "ident" and value in _KEYWORDS and not self.value_is("(", 1):
+            self.pos += 1
+            result = _KEYWORDS[value]
+        while self.value_is("as") or self.value_is("satisfies"):
+            self.pos += 1
+            self.skip_until({",", ";", "}", "]", ")", "="}, angle=True)
+        nxt = self.peek()
+        if nxt is not None and nxt[1] not in {",", ";", "}", "]", ")"}:
+            result = UNKNOWN
+            self.skip_until({",", ";"})
+        return result
+
+    def parse_object(self) -> dict[str, Any]:
+        self.pos += 1
+        result: dict[str, Any] = {}
+        while (token := self.peek()) is not None:
+            kind, value, _ = token
+            if value == "}":
+                self.pos += 1
+                break
+            if value in {",", ";"}:
+                self.pos += 1
+                continue
+            if kind == "spread":
+                self.pos += 1
+                self.parse_value()
+                continue
+            if kind in {"ident", "string", "number"} and (self.value_is(":", 1) or self.value_is("?", 1)):
+                key = unquote(value) if kind == "string" else value
+                self.pos += 1
+                if self.value_is("?"):
+                    self.pos += 1
+                self.pos += 1
+                result[key] = self.parse_value()
+                continue
+            if kind == "ident" and self.peek(1) and self.peek(1)[1] in {",", "}"}:
+                self.pos += 1
+                result[value] = UNKNOWN
+                continue
+            self.skip_until({",", ";"})
+        return result
+
+    def parse_array(self) -> list[Any]:
+        self.pos += 1
+        result: list[Any] = []
+        while (token := self.peek()) is not None:
+            if token[1] == "]":
+                self.pos += 1
+                break
+            if token[1] == ",":
+                self.pos += 1
+                continue
+            if token[0] == "spread":
+                self.pos += 1
+                self.parse_value()
+                continue
+            start = self.pos
+            result.append(self.parse_value())
+            if self.pos == start:
+                self.pos += 1
+        return result
+
+
+def parse_declarations(text: str) -> dict[str, Any]:
+    with span("parse", len(text)):
+        parser = _Parser(tokenize(text))
+        declarations: dict[str, Any] = {}
+        while (token := parser.peek()) is not None:
+            parser.pos += 1
+            if token[0] != "ident" or token[1] not in {"const", "let", "var"}:
+                continue
+            name = parser.peek()
+            if name is None or name[0] != "ident":
+                continue
+            parser.pos += 1
+            if parser.value_is(":"):
+                parser.pos += 1
+                parser.skip_until({"="}, angle=True)
+            if not parser.value_is("="):
+                continue
+            parser.pos += 1
+            declarations[name[1]] = parser.parse_value()
+        return declarations
+
+
+def iter_objects(value: Any, key: str | None = None) -> Iterator[tuple[str | None, dict[str, Any]]]:
+    """Yield (parent key, dict) for every object nested anywhere in `value`."""
+    if isinstance(value, dict):
+        yield key, value
+        for child_key, child in value.items():
+            yield from iter_objects(child, child_key)
+    elif isinstance(value, list):
+        for child in value:
+            yield from iter_objects(child, key)
+
+
+def iter_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for child in value.values():
+            yield from iter_strings(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from iter_strings(child)
+
+
+@dataclass
+class MapCallback:
+    """Literal parts of a `source.map((param) => { const x = ...; return {...}; })` callback."""
+
+    param: str
+    bindings: dict[str, Any]
+    returned: dict[str, Any]
+
+
+def map_callback(text: str, source: str) -> MapCallback | None:
+    """The first `source.map(...)` callback whose body returns an object literal.
+
+    Template literals keep their `${...}` parts; see fill_template().
+    """
+    tokens = tokenize(text)
+    for position in range(len(tokens) - 4):
+        if [token[1] for token in tokens[position : position + 4]] != [source, ".", "map", "("]:
+            continue
+        param = tokens[position + 5] if tokens[position + 4][1] == "(" else tokens[position + 4]
+        if param[0] != "ident":
+            return None
+        parser = _Parser(tokens)
+        parser.pos = position + 4
+        bindings: dict[str, Any] = {}
+        while (token := parser.peek()) is not None:
+            kind, value, _ = token
+            parser.pos += 1
+            if value in {"const", "let"} and parser.value_is("=", 1):
+                name = parser.peek()[1]
+                parser.pos += 2
+                bindings[name] = parser.parse_value()
+            elif value == "return" or (kind == "arrow" and parser.value_is("(")):
+                if parser.value_is("("):
+                    parser.pos += 1
+                if parser.value_is("{"):
+                    return MapCallback(param[1], bindings, parser.parse_object())
+        return None
+    return None
+
+
+def fill_template(template: str, variables: dict[str, str], helpers: dict[str, Any] | None = None) -> str | None:
+    """Substitute `${name}` and `${helper(name)}` parts; None when any part needs real evaluation."""
+    helpers = helpers or {}
+    missing = False
+
+    def substitute(match: re.Match[str]) -> str:
+        nonlocal missing
+        expression = match.group(1)
+        if expression in variables:
+            return variables[expression]
+        call = _CALL.fullmatch(expression)
+        if call and call.group(1) in helpers and call.group(2) in variables:
+            return helpers[call.group(1)](variables[call.group(2)])
+        missing = True
+        return ""
+
+    result = _PLACEHOLDER.sub(substitute, template)
+    return None if missing else result